@@ -0,0 +1,122 @@
+import unittest.mock
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+pytest.importorskip("google_auth_httplib2")
+
+import googleapiclient.errors
+import httplib2
+
+import youtube_api_tools
+from youtube_api_tools import YouTubeDataAPIv3Tools
+
+
+def make_tools() -> unittest.mock.MagicMock:
+    """
+    Returns a stand-in for YouTubeDataAPIv3Tools whose service is a MagicMock, so the
+    resource classes can be exercised without credentials or network access.
+    """
+    return unittest.mock.MagicMock(spec_set=["service", "apitools_ref", "_execute_batch", "_get_thread_http"])
+
+
+#////// SEARCH //////
+@pytest.mark.parametrize("video_type, kind, id_key", [
+    ("channel", "youtube#channel", "channelId"),
+    ("playlist", "youtube#playlist", "playlistId"),
+])
+def test_search_videos_by_type_reads_the_id_of_non_video_results(video_type, kind, id_key):
+    tools = make_tools()
+    tools.service.search.return_value.list.return_value.execute.return_value = {
+        "items": [{"id": {"kind": kind, id_key: "ID1"}, "snippet": {"title": "Title"}}]
+    }
+    search = YouTubeDataAPIv3Tools.Search(tools)
+
+    assert search.search_videos_by_type("query", video_type) == [{"id": "ID1", "title": "Title"}]
+    assert tools.service.search.return_value.list.call_args.kwargs["type"] == video_type
+
+
+#////// CAPTIONS //////
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch) -> youtube_api_tools.PersistentCache:
+    cache = youtube_api_tools.PersistentCache(str(tmp_path / "metadata"))
+    monkeypatch.setattr(youtube_api_tools, "disk_cache", cache)
+    monkeypatch.setattr(youtube_api_tools, "etag_cache", youtube_api_tools.PersistentCache(str(tmp_path / "etags")))
+    return cache
+
+
+def test_get_captions_in_languages_sees_an_updated_track(disk_cache):
+    tools = make_tools()
+    captions_list = tools.service.captions.return_value.list.return_value.execute
+    captions_list.return_value = {"items": [{"snippet": {"language": "en", "name": "Old"}}]}
+    localization = YouTubeDataAPIv3Tools.Localization(tools)
+    assert localization.get_captions_in_languages("VIDEO", ["en"]) == [{"language": "en", "name": "Old"}]
+
+    assert YouTubeDataAPIv3Tools.Captions(tools).update_track("TRACK", "en", "New") is True
+    captions_list.return_value = {"items": [{"snippet": {"language": "en", "name": "New"}}]}
+
+    assert localization.get_captions_in_languages("VIDEO", ["en"]) == [{"language": "en", "name": "New"}]
+    assert captions_list.call_count == 2
+
+
+#////// VIDEOS //////
+def make_video(tools: unittest.mock.MagicMock) -> YouTubeDataAPIv3Tools.Video:
+    tools.service.videos.return_value.list.return_value.execute.return_value = {
+        "items": [{
+            "etag": "ETAG",
+            "snippet": {"title": "Title", "description": "Description", "tags": ["a", "b"], "categoryId": "22"},
+            "status": {"privacyStatus": "public"}
+        }]
+    }
+    return YouTubeDataAPIv3Tools.Video(tools)
+
+
+def test_update_video_clears_the_description(disk_cache):
+    tools = make_tools()
+    assert make_video(tools).update_video("VIDEO", description="") is True
+
+    update = tools.service.videos.return_value.update
+    assert update.call_args.kwargs["part"] == "snippet"
+    assert update.call_args.kwargs["body"]["snippet"]["description"] == ""
+    assert update.call_args.kwargs["body"]["snippet"]["tags"] == ["a", "b"]
+
+
+def test_add_tags_clears_the_tags(disk_cache):
+    tools = make_tools()
+    assert make_video(tools).add_tags("VIDEO", []) is True
+
+    update = tools.service.videos.return_value.update
+    assert update.call_args.kwargs["part"] == "snippet"
+    assert update.call_args.kwargs["body"]["snippet"]["tags"] == []
+
+
+#////// THUMBNAILS //////
+def test_upload_video_thumbnail_handles_api_errors_while_iterating(disk_cache, tmp_path):
+    image = tmp_path / "thumbnail.jpg"
+    image.write_bytes(b"jpeg")
+    tools = make_tools()
+    tools.service.thumbnails.return_value.set.return_value.execute.side_effect = googleapiclient.errors.HttpError(
+        httplib2.Response({"status": 400}), b""
+    )
+
+    assert list(YouTubeDataAPIv3Tools.Thumbnail(tools).upload_video_thumbnail("VIDEO", str(image))) == []
+
+
+#////// LOCALIZATION //////
+def test_get_channel_details_in_languages_sees_new_localizations(disk_cache):
+    tools = make_tools()
+    tools._get_thread_http.return_value = None
+    channels = tools.service.channels.return_value
+    channels.list.return_value.execute.return_value = {
+        "items": [{"snippet": {"title": "Old", "description": "", "localized": {"title": "Old", "description": ""}}}]
+    }
+    localization = YouTubeDataAPIv3Tools.Localization(tools)
+    assert localization.get_channel_details_in_languages("CHANNEL", ["fr"]) == {"fr": {"title": "Old", "description": ""}}
+
+    channels.list.return_value.execute.return_value = {"items": [{"localizations": {}}]}
+    assert localization.set_channel_localizations("CHANNEL", {"fr": {"title": "New", "description": ""}}) == {"fr": True}
+    channels.list.return_value.execute.return_value = {
+        "items": [{"snippet": {"title": "Old", "description": "", "localized": {"title": "New", "description": ""}}}]
+    }
+
+    assert localization.get_channel_details_in_languages("CHANNEL", ["fr"]) == {"fr": {"title": "New", "description": ""}}
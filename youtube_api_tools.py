@@ -1,15 +1,612 @@
-import google.api.endpoint_pb2
-import google_auth_oauthlib.flow
+import google_auth_httplib2
 import googleapiclient.discovery
 import googleapiclient.errors
-import io
+import googleapiclient.http
+import googleapiclient.model
+import httplib2
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import operator
 import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+import typing
+import warnings
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Base URL of the YouTube Data API REST endpoints.
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# Google's servers only gzip responses for clients whose User-Agent contains "gzip".
+USER_AGENT = "youtube-data-api-v3-tools (gzip)"
+
+# Socket timeout in seconds for the keep-alive connections used to reach the API.
+HTTP_TIMEOUT = 60
+
+# Size in bytes of the chunks media downloads are fetched and written to disk in.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Size in bytes of the chunks resumable media uploads are read from disk and sent in.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# The YouTube Data API accepts at most 50 comma separated IDs per list call.
+MAX_IDS_PER_REQUEST = 50
+
+# Shared part strings for videos().list. Using the same constants everywhere keeps
+# the cache keys of different getters identical for the same video.
+VIDEO_ALL_PARTS = "snippet,contentDetails,statistics"
+VIDEO_SNIPPET = "snippet"
+VIDEO_STATS = "statistics"
+
+# Partial response masks for videos().list. The video ID is always kept because
+# results are matched back to the requested IDs.
+_FIELDS_TITLE = "items(id,snippet/title)"
+_FIELDS_DESCRIPTION = "items(id,snippet/description)"
+_FIELDS_CHANNEL_TITLE = "items(id,snippet/channelTitle)"
+_FIELDS_PUBLISHED_AT = "items(id,snippet/publishedAt)"
+_FIELDS_TAGS = "items(id,snippet/tags)"
+_FIELDS_CATEGORY_ID = "items(id,snippet/categoryId)"
+_FIELDS_DURATION = "items(id,contentDetails/duration)"
+_FIELDS_PRIVACY_STATUS = "items(id,status/privacyStatus)"
+_FIELDS_STATS = "items(id,statistics(viewCount,likeCount,dislikeCount,favoriteCount,commentCount))"
+
+# Partial response mask for search().list calls that only need each result's ID and title.
+_FIELDS_SEARCH_RESULTS = "items(id,snippet/title)"
+
+# Partial response mask for activities().list holding what _ACTIVITY_EXTRACTORS reads.
+_FIELDS_ACTIVITIES = "items(snippet(type,title,displayMessage),contentDetails(upload/videoId,like/resourceId/videoId,comment/videoId))"
+
+# Parts requested for a live chat. Only top level parts are accepted, so this already 
+# covers every snippet and status property the live chat getters read.
+_LIVE_CHAT_PART = "snippet,id,status"
+
+# Video thumbnails are served from predictable URLs, keyed here by the name the API 
+# uses for each resolution.
+THUMBNAIL_URL = "https://i.ytimg.com/vi/{video_id}/{name}.jpg"
+_THUMBNAIL_NAMES = {
+    "default": "default",
+    "medium": "mqdefault",
+    "high": "hqdefault",
+    "standard": "sddefault",
+    "maxres": "maxresdefault"
+}
+
+# Channel IDs are "UC" followed by 22 URL safe base64 characters.
+_CHANNEL_ID_RE = re.compile(r"^UC[\w-]{22}$")
+_CHANNEL_URL_RE = re.compile(r"youtube\.com/(?:channel/(?P<id>UC[\w-]{22})|(?P<handle>@[\w.-]+)|(?:user|c)/(?P<name>[^/?#]+))")
+
+# Reusable key getters for walking response items in list comprehensions.
+_SNIPPET = operator.itemgetter("snippet")
+_TITLE = operator.itemgetter("title")
+_RESOURCE_ID = operator.itemgetter("resourceId")
+_CHANNEL_ID = operator.itemgetter("channelId")
+_ID_AND_SNIPPET = operator.itemgetter("id", "snippet")
+
+# The key holding the ID of each kind of search result.
+_SEARCH_ID_KEYS = {
+    "youtube#video": "videoId",
+    "youtube#channel": "channelId",
+    "youtube#playlist": "playlistId",
+}
+
+def _extract_upload(snippet: dict, details: dict) -> dict:
+    return {"type": "upload", "title": snippet["title"], "video_id": details["upload"]["videoId"]}
+
+def _extract_like(snippet: dict, details: dict) -> dict:
+    return {"type": "like", "title": snippet["title"], "video_id": details["like"]["resourceId"]["videoId"]}
+
+def _extract_comment(snippet: dict, details: dict) -> dict:
+    return {"type": "comment", "title": snippet["title"], "video_id": details["comment"]["videoId"], "comment": snippet["displayMessage"]}
+
+# Turns the snippet and contentDetails of an item of an activities().list response 
+# into a dictionary, keyed by the activity's snippet type. Activity types without an
+# entry are skipped.
+_ACTIVITY_EXTRACTORS = {
+    "upload": _extract_upload,
+    "like": _extract_like,
+    "comment": _extract_comment
+}
+
+# Formats a dictionary returned by _parse_activities() as one line of output.
+_ACTIVITY_FORMATS = {
+    "upload": "Uploaded Video: {title} (Video ID: {video_id})".format_map,
+    "like": "Liked Video: {title} (Video ID: {video_id})".format_map,
+    "comment": "Commented on Video: {title} (Video ID: {video_id}) - Comment: {comment}".format_map
+}
+
+def _parse_activity(activity: dict) -> (dict | None):
+    """
+    Parses a single item of an activities().list response with _ACTIVITY_EXTRACTORS,
+    returning None for activity types that aren't extracted. The snippet and 
+    contentDetails are looked up once and handed to the extractor.
+    """
+    snippet = activity["snippet"]
+    extractor = _ACTIVITY_EXTRACTORS.get(snippet["type"])
+    return extractor(snippet, activity["contentDetails"]) if extractor is not None else None
+
+def _parse_activities(items: list[dict]) -> list[dict]:
+    """
+    Parses the items of an activities().list response with _parse_activity(), 
+    leaving out the activity types that aren't extracted.
+    """
+    return [activity for activity in map(_parse_activity, items) if activity is not None]
+
+def _changed_localizations(current: dict, localizations: dict) -> dict:
+    """
+    Returns the title and description of every language in localizations, which maps
+    language codes to dictionaries like the ones passed to set_video_localizations(), 
+    that differ from the localizations resource current the API returned.
+    """
+    changed = {}
+    for language, localization_data in localizations.items():
+        localized = {
+            "title": localization_data.get("title", ""),
+            "description": localization_data.get("description", "")
+        }
+        if current.get(language) != localized:
+            changed[language] = localized
+    return changed
 
 class YouTubeAPIException(Exception):
     def __init__(self, message):
         self.message = message
         super().__init__(message)
 
+class LiveChatDetails(typing.NamedTuple):
+    """
+        The details of a live chat as returned by LiveBroadcast.get_all_live_chat_details().
+        Fields can be read by name or unpacked by position like a plain tuple.
+    """
+    live_chat_id: str
+    live_chat_type: str
+    title: str
+    description: str
+    is_moderated: bool
+    scheduled_start_time: str
+    actual_start_time: str
+    life_cycle_status: str
+    active_live_chat_id: str
+    concurrent_viewers: int
+    active_participants: int
+
+def _deprecated(reason: str):
+    """
+    Decorator that emits a DeprecationWarning with the given reason every time the
+    decorated method is called.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            warnings.warn(f"{method.__name__}() is deprecated. {reason}", DeprecationWarning, stacklevel=2)
+            return method(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _json_loads(data: (bytes | str)) -> object:
+    """
+    Parses a JSON document with orjson when it is installed and with the standard
+    library's json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(value: object) -> bytes:
+    """
+    Serializes value to a UTF-8 encoded JSON document with orjson when it is installed
+    and with the standard library's json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+def _file_digest(path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of the file at path, reading it in UPLOAD_CHUNK_SIZE
+    chunks so the whole file is never held in memory.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _handle_http(default: object=None):
+    """
+    Decorator that catches a googleapiclient HttpError raised by the decorated method,
+    prints it and returns default instead, so API errors are handled in one place.
+    Generator methods are wrapped in a generator, so errors raised while they are 
+    being iterated are caught too.
+    """
+    def decorator(method):
+        if inspect.isgeneratorfunction(method):
+            @functools.wraps(method)
+            def generator_wrapper(*args, **kwargs):
+                try:
+                    return (yield from method(*args, **kwargs))
+                except googleapiclient.errors.HttpError as e:
+                    print(f"An API error occurred: {e}")
+                    return default
+            return generator_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except googleapiclient.errors.HttpError as e:
+                print(f"An API error occurred: {e}")
+                return default
+        return wrapper
+    return decorator
+
+def _print_lines(lines: list[str]) -> None:
+    """
+    Writes the given lines to stdout with a single write call instead of
+    one print() call per line.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+class MetadataCache:
+    """
+        A small thread safe LRU cache with a time to live that holds video and channel 
+        metadata for the whole process. Keys are tuples whose second element is the 
+        video or channel ID so every entry for a resource can be invalidated at once 
+        after that resource is modified.
+    """
+    
+    def __init__(self, maxsize: int=4096, ttl: float=600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> (object | None):
+        """
+        Returns the value stored under key or None if there is no entry or
+        the entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: object, ttl: float=None) -> None:
+        """
+        Stores value under key, evicting the least recently used entry if the
+        cache is full. Pass ttl to keep this entry for a different time than the
+        cache's own ttl.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource_id: str) -> None:
+        """
+        Removes every entry cached for the video or channel specified by resource_id.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == resource_id]:
+                del self._entries[key]
+
+    def invalidate_kind(self, kind: str) -> None:
+        """
+        Removes every entry whose key starts with kind, e.g. "captions".
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+metadata_cache = MetadataCache()
+
+class PersistentCache:
+    """
+        An on-disk cache backed by an SQLite database for values that rarely change, 
+        like the channel ID a channel name resolves to. Entries survive between 
+        processes and expire after the ttl given when they were stored. Expired entries
+        are deleted whenever a new one is written, and SQLite's own locking keeps 
+        several processes sharing the same file consistent. Values are stored as JSON 
+        encoded with _json_dumps(), so they must be JSON serializable. The database is 
+        only opened on first use and the connection is kept open afterwards. Set path 
+        to None to turn the cache off.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> object:
+        """
+        Returns the open connection to the database, creating the database the first
+        time. Must be called with self._lock held.
+        """
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(f"{self.path}.sqlite3", timeout=30, check_same_thread=False)
+            with connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, kind TEXT, resource_id TEXT, expires REAL, value BLOB)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)")
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_resource_id ON entries (resource_id)")
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_kind ON entries (kind)")
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: tuple) -> (object | None):
+        """
+        Returns the value stored under key or None if there is no entry or
+        the entry has expired.
+        """
+        if self.path is None:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM entries WHERE key = ? AND expires >= ?", (json.dumps(key), time.time())
+            ).fetchone()
+        return _json_loads(row[0]) if row is not None else None
+
+    def set(self, key: tuple, value: object, ttl: float) -> None:
+        """
+        Stores value under key for ttl seconds and deletes every expired entry.
+        """
+        if self.path is None:
+            return
+        now = time.time()
+        resource_id = key[1] if len(key) > 1 else None
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries WHERE expires < ?", (now,))
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (json.dumps(key), str(key[0]), json.dumps(resource_id), now + ttl, _json_dumps(value))
+                )
+
+    def invalidate(self, resource_id: str) -> None:
+        """
+        Removes every entry stored for the video or channel specified by resource_id.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries WHERE resource_id = ?", (json.dumps(resource_id),))
+
+    def invalidate_kind(self, kind: str) -> None:
+        """
+        Removes every entry whose key starts with kind, e.g. "caption_tracks".
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries")
+
+disk_cache = PersistentCache(os.path.join(os.path.expanduser("~"), ".cache", "youtube_api_tools", "metadata"))
+
+etag_cache = PersistentCache(os.path.join(os.path.expanduser("~"), ".cache", "youtube_api_tools", "etags"))
+
+# How long values are kept in the disk cache, in seconds.
+CHANNEL_ID_TTL = 30 * 24 * 60 * 60
+VIDEO_SNIPPET_TTL = 24 * 60 * 60
+ETAG_TTL = 7 * 24 * 60 * 60
+LOCALIZED_DETAILS_TTL = 24 * 60 * 60
+ABUSE_REASONS_TTL = 7 * 24 * 60 * 60
+THUMBNAIL_HASH_TTL = 30 * 24 * 60 * 60
+
+# Live chat details change while a stream is running, so they are only kept in the
+# metadata cache for a short time.
+LIVE_CHAT_TTL = 30
+
+# Video categories are effectively static, so they are kept for a day.
+CATEGORY_TTL = 24 * 60 * 60
+
+# HTTP statuses that are worth retrying. A 403 is deliberately left out since a
+# quotaExceeded error won't go away until the daily quota resets.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Error reasons that make a 403 worth retrying, unlike quotaExceeded.
+RETRY_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+# HTTP methods that leave the resource in the same state when they are sent twice,
+# so they can be retried after a timeout or a server error that may have been 
+# preceded by the request being carried out.
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+
+# Statuses that mean the request was turned away before it was carried out, so even
+# an insert can be sent again without creating a duplicate.
+UNCOMMITTED_STATUSES = (429, 503)
+
+def _is_retryable_status(status: int, reasons: list[str], method: str="GET") -> bool:
+    """
+    Returns True if an error response with the given HTTP status and error reasons
+    is a rate limit or server error that may succeed when the request, made with the
+    given HTTP method, is sent again. Requests that aren't idempotent, like insert 
+    calls, are only retried when the error shows they weren't carried out.
+    """
+    if status in RETRY_STATUSES:
+        return method in IDEMPOTENT_METHODS or status in UNCOMMITTED_STATUSES
+    if status == 403:
+        return any(reason in RETRY_REASONS for reason in reasons)
+    return False
+
+def _is_retryable(error: googleapiclient.errors.HttpError, method: str="GET") -> bool:
+    """
+    Returns True if error may succeed when the request is sent again, see 
+    _is_retryable_status().
+    """
+    details = getattr(error, "error_details", None)
+    reasons = [detail.get("reason") for detail in details if isinstance(detail, dict)] if isinstance(details, list) else []
+    return _is_retryable_status(error.resp.status, reasons, method)
+
+def _error_reasons(content: bytes) -> list[str]:
+    """
+    Returns the reasons listed in the error.errors array of an API error response 
+    body, or an empty list if the body isn't a JSON error document.
+    """
+    try:
+        error = _json_loads(content).get("error", {})
+    except (ValueError, AttributeError):
+        return []
+    errors = error.get("errors", []) if isinstance(error, dict) else []
+    return [item.get("reason") for item in errors if isinstance(item, dict)]
+
+def _etag_execute(request: object, key: tuple, **kwargs) -> dict:
+    """
+    Executes request as a conditional GET. The last response stored under key in 
+    etag_cache is sent back as an If-None-Match header, and when the resource hasn't 
+    changed the API answers 304 Not Modified with an empty body, in which case the 
+    stored response is returned instead. Any keyword arguments are passed on to 
+    request.execute().
+    """
+    cached = etag_cache.get(key)
+    if cached is not None and "etag" in cached:
+        request.headers["If-None-Match"] = cached["etag"]
+    try:
+        response = request.execute(**kwargs)
+    except googleapiclient.errors.HttpError as e:
+        if cached is not None and e.resp.status == 304:
+            return cached
+        raise
+    if "etag" in response:
+        etag_cache.set(key, response, ETAG_TTL)
+    return response
+
+class FastJsonModel(googleapiclient.model.JsonModel):
+    """
+        A JsonModel that parses response bodies with _json_loads(), i.e. with orjson 
+        when it is installed, instead of the standard library's json module. It is 
+        passed to googleapiclient.discovery.build() as the model.
+    """
+
+    def deserialize(self, content: (bytes | str)) -> object:
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+class RetryingHttpRequest(googleapiclient.http.HttpRequest):
+    """
+        An HttpRequest that retries rate limit and server errors (see _is_retryable()), 
+        dropped connections and socket timeouts with exponential backoff and full 
+        jitter instead of failing on the first one, waiting as long as a Retry-After 
+        header asks for when the API sends one. Dropped connections and timeouts are 
+        only retried for idempotent methods, since an insert may already have been 
+        carried out. It is passed to googleapiclient.discovery.build() as the 
+        requestBuilder, so every execute() call made through the service gets the same
+        retry policy.
+    """
+
+    max_attempts = 6
+    initial_delay = 0.5
+    max_delay = 30.0
+    max_retry_after = 60.0
+
+    @classmethod
+    def retry_delay(cls, attempt: int, headers: dict=None) -> float:
+        """
+        Returns the number of seconds to wait before retry number attempt + 1. A 
+        Retry-After header given in seconds in headers is honoured up to max_retry_after,
+        otherwise it's a random time of up to initial_delay * 2 ** attempt seconds 
+        capped at max_delay.
+        """
+        retry_after = (headers or {}).get("retry-after", "")
+        if retry_after.strip().isdigit():
+            return min(cls.max_retry_after, float(retry_after))
+        return random.uniform(0, min(cls.max_delay, cls.initial_delay * 2 ** attempt))
+
+    def execute(self, http: object=None, num_retries: int=0) -> object:
+        """
+        Executes the request, sleeping for retry_delay() seconds between attempts. 
+        Callers that pass their own num_retries keep googleapiclient's built in retry 
+        behaviour instead.
+        """
+        if num_retries:
+            return super().execute(http=http, num_retries=num_retries)
+        for attempt in range(self.max_attempts):
+            headers = None
+            try:
+                return super().execute(http=http)
+            except googleapiclient.errors.HttpError as e:
+                if not _is_retryable(e, self.method) or attempt == self.max_attempts - 1:
+                    raise
+                headers = e.resp
+            except (ConnectionError, TimeoutError):
+                if self.method not in IDEMPOTENT_METHODS or attempt == self.max_attempts - 1:
+                    raise
+            time.sleep(self.retry_delay(attempt, headers))
+
+def _build_http(credentials: object) -> object:
+    """
+    Returns an authorized http object for credentials wrapping a single httplib2.Http, 
+    which keeps its connection to the API open between requests so only the first 
+    request pays for the TCP and TLS handshakes.
+    """
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    googleapiclient.http.set_user_agent(http, USER_AGENT)
+    return http
+
+def _cache_collections(service: object) -> None:
+    """
+    Replaces the collection methods of a discovery built service, e.g. videos() or 
+    subscriptions(), with ones that return a single prebuilt collection. googleapiclient
+    otherwise builds a new collection resource from the discovery document on each call.
+    """
+    for name in map(googleapiclient.discovery.fix_method_name, service._resourceDesc.get("resources", {})):
+        collection = getattr(service, name)()
+        setattr(service, name, lambda collection=collection: collection)
+
 class YouTubeDataAPIv3Tools:
     """
         This is a wrapper around the YouTube v3 API.
@@ -99,10 +696,121 @@ class YouTubeDataAPIv3Tools:
         
         self.TOKEN_FILE = _token_file
         
+        self.http = None
+        self._thread_local = threading.local()
+        # A single long lived worker fetches the next page for _prefetch_pages(), so its
+        # thread's keep-alive connection is reused by every paginated listing. It is 
+        # shut down by close() or when the object is garbage collected.
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="youtube-prefetch")
+        self._finalizer = weakref.finalize(self, self._prefetch_executor.shutdown, wait=False, cancel_futures=True)
         self.service = self.get_authenticated_service()
+
+    def __enter__(self) -> object:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the background thread used to prefetch pages of paginated listings.
+        """
+        self._finalizer()
     
     #////// UTILITY METHODS //////
     
+    def _get_thread_http(self) -> object:
+        """
+        Returns an authorized http object owned by the calling thread. httplib2.Http 
+        isn't thread safe, so worker threads must not share self.http. Each thread gets
+        its own keep-alive connection built from the same credentials.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = _build_http(self.http.credentials)
+            self._thread_local.http = http
+        return http
+    
+    def _prefetch_pages(self, collection: object, request: object, limit: int=None):
+        """
+        Yields every page of response for a paginated list request made on collection,
+        e.g. service.subscriptions(). While the caller works through one page the next
+        page is already being fetched on the instance's prefetch thread with its own 
+        keep-alive connection, unless the pages yielded so far already hold limit 
+        items. If the caller stops early, a prefetch that hasn't started yet is 
+        cancelled and one that is already running is left to finish in the background
+        instead of being waited for.
+        """
+        def execute(page_request: object) -> dict:
+            return page_request.execute(http=self._get_thread_http())
+
+        executor = self._prefetch_executor
+        future = None
+        try:
+            future = executor.submit(execute, request)
+            count = 0
+            while future is not None:
+                response = future.result()
+                count += len(response.get("items", []))
+                request = collection.list_next(request, response)
+                if request is None or (limit is not None and count >= limit):
+                    future = None
+                else:
+                    future = executor.submit(execute, request)
+                yield response
+        finally:
+            if future is not None:
+                future.cancel()
+
+    def _execute_batch(self, requests: dict) -> dict:
+        """
+        Sends the requests in the given dictionary, which maps a unique string key to 
+        each request, as batch requests of up to 50 calls so each group costs a single 
+        HTTP round trip. Calls that fail with a rate limit or server error are sent 
+        again in a new batch with the same backoff as RetryingHttpRequest, honouring the 
+        longest Retry-After header among them. Returns a dictionary mapping each key to
+        the response of its request, or to the HttpError it raised so one failed call 
+        doesn't stop the rest.
+        """
+        results = {}
+
+        def collect(request_id, response, exception):
+            results[request_id] = response if exception is None else exception
+
+        pending = requests
+        for attempt in range(RetryingHttpRequest.max_attempts):
+            if attempt:
+                time.sleep(max(RetryingHttpRequest.retry_delay(attempt - 1, results[key].resp) for key in pending))
+            items = iter(pending.items())
+            chunk = list(itertools.islice(items, MAX_IDS_PER_REQUEST))
+            while chunk:
+                batch = self.service.new_batch_http_request(callback=collect)
+                for key, request in chunk:
+                    batch.add(request, request_id=key)
+                batch.execute()
+                chunk = list(itertools.islice(items, MAX_IDS_PER_REQUEST))
+            pending = {
+                key: requests[key] for key in pending
+                if isinstance(results[key], googleapiclient.errors.HttpError) and _is_retryable(results[key], requests[key].method)
+            }
+            if not pending:
+                break
+        return results
+
+    def _paginate(self, collection: object, request: object, limit: int=None):
+        """
+        Yields the items of every page of a paginated list request made on collection,
+        stopping after limit items if limit is given. Pages are fetched with 
+        _prefetch_pages(), which prefetches at most one page ahead of the caller and 
+        none once limit items have been received.
+        """
+        pages = self._prefetch_pages(collection, request, limit)
+        try:
+            items = itertools.chain.from_iterable(page.get("items", []) for page in pages)
+            yield from itertools.islice(items, limit)
+        finally:
+            pages.close()
+    
     def _dict_to_arr(self, dictionary: dict):
         if isinstance(dictionary, dict):
             array = []
@@ -110,6 +818,15 @@ class YouTubeDataAPIv3Tools:
                 array.append(dictionary[key])
             return array
             
+    def clear_cache(self) -> None:
+        """
+        Empties the in-memory metadata cache and the on-disk metadata and ETag caches, 
+        so every following call fetches fresh data from the API.
+        """
+        metadata_cache.clear()
+        disk_cache.clear()
+        etag_cache.clear()
+
     def add_scope(self, scope: str) -> (list | None):
         """
         Adds the given scope to the list of scopes held in the api_scopes list.
@@ -204,15 +921,78 @@ class YouTubeDataAPIv3Tools:
         """
         This method is a wrapper around the 'googleapiclient.discovery.build' method.
         It returns the resource needed for interacting with the YouTube API.
+        
+        The service is built on a single authorized httplib2.Http object stored in 
+        self.http so every request reuses the same keep-alive connection instead of 
+        paying for a new TLS handshake, and asks for gzip compressed responses. 
+        Requests are built as RetryingHttpRequest objects so transient errors are 
+        retried with backoff, and responses are parsed by FastJsonModel. Each 
+        collection, e.g. service.videos(), is only built once and the same object is 
+        returned on every later call.
         """
         _credentials = credentials
-        return googleapiclient.discovery.build(
+        self.http = _build_http(_credentials)
+        service = googleapiclient.discovery.build(
             "youtube", 
             "v3", 
-            credentials=_credentials,
-            developerKey=self.DEV_KEY
+            http=self.http,
+            developerKey=self.DEV_KEY,
+            model=FastJsonModel(),
+            requestBuilder=RetryingHttpRequest
         )
+        _cache_collections(service)
+        return service
+
+    def _get_thread_tools(self) -> object:
+        """
+        Returns a shallow copy of this object owned by the calling thread, whose service
+        sends its requests over the thread's own connection from _get_thread_http(). 
+        The service is built from the discovery document already held by self.service,
+        so no extra request is made.
+        """
+        tools = getattr(self._thread_local, "tools", None)
+        if tools is None:
+            tools = copy.copy(self)
+            tools.http = self._get_thread_http()
+            tools.service = googleapiclient.discovery.build_from_document(
+                self.service._rootDesc,
+                http=tools.http,
+                developerKey=self.DEV_KEY,
+                model=FastJsonModel(),
+                requestBuilder=RetryingHttpRequest
+            )
+            _cache_collections(tools.service)
+            self._thread_local.tools = tools
+        return tools
+
+    def map_channels(self, func: object, channel_ids: list[str], workers: int=16) -> list:
+        """
+        Calls func(tools, channel_id) for every ID in channel_ids on a pool of worker 
+        threads and returns the results in the same order as channel_ids. tools is a 
+        copy of this object for the worker thread, so resource classes built from it 
+        never share a connection with another thread:
+        
+            counts = tube.map_channels(
+                lambda tools, channel_id: tools.Channel(tools).get_subscriber_count(False, channel_id),
+                channel_ids
+            )
+        """
+        def call(channel_id: str) -> object:
+            return func(self._get_thread_tools(), channel_id)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(call, channel_ids))
 
+    async def _execute_async(self, request: object) -> dict:
+        """
+        Executes request on one of asyncio's worker threads so the event loop keeps 
+        running while the request waits for its response. The request is sent over the
+        worker thread's own connection from _get_thread_http(), and keeps the retry and
+        credential refresh behaviour of a normal execute() call.
+        """
+        return await asyncio.to_thread(lambda: request.execute(http=self._get_thread_http()))
+
+    @_handle_http()
     def get_authenticated_service(self) -> (object | None):
         """
         When you call get_authenticated_service(), it will initiate the OAuth 2.0 authentication 
@@ -227,32 +1007,119 @@ class YouTubeDataAPIv3Tools:
         # instance can be accessed outside of get_authenticated_service.
         import pickle
         credentials = None
-        try:
-            # Check if credentials are stored in a local file (to avoid re-authentication)
-            if os.path.exists(self.TOKEN_FILE):
-                with open(self.TOKEN_FILE, "rb") as token_file:
-                    credentials = pickle.load(token_file)
-
-            # If no credentials found, perform the OAuth 2.0 flow
-            if not credentials or not credentials.valid:
-                flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
-                    self.CLIENT_SECRETS_JSON_FILE, self.api_scopes)
-                credentials = flow.run_local_server(port=0)
+        # Check if credentials are stored in a local file (to avoid re-authentication)
+        if os.path.exists(self.TOKEN_FILE):
+            with open(self.TOKEN_FILE, "rb") as token_file:
+                credentials = pickle.load(token_file)
+
+        # If no credentials found, perform the OAuth 2.0 flow
+        if not credentials or not credentials.valid:
+            import google_auth_oauthlib.flow
+
+            flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
+                self.CLIENT_SECRETS_JSON_FILE, self.api_scopes)
+            credentials = flow.run_local_server(port=0)
             
-                with open(self.TOKEN_FILE, "wb") as token_file:
-                    pickle.dump(credentials, token_file)
-            youtube_service = self._get_authenticated_service(credentials)
-            return youtube_service
-        except googleapiclient.errors.HttpError as e:
-            print(f"An API error occurred: {e}")
-            return None
+            with open(self.TOKEN_FILE, "wb") as token_file:
+                pickle.dump(credentials, token_file)
+        youtube_service = self._get_authenticated_service(credentials)
+        return youtube_service
             
     #//////////// CHANNEL ////////////
     class Channel:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
         
         #////// UTILITY METHODS //////
+        def _fetch_channel(self, part: str, your_channel: bool=True, channel_id: str=None) -> (dict | None):
+            """
+            Fetches the given part of either your channel or the channel specified by 
+            channel_id, reusing the copy held in the metadata cache when there is one.
+            Otherwise the channel is requested with a conditional GET, so an unchanged 
+            channel doesn't have to be downloaded again. Returns the channel resource or 
+            None if no channel was found.
+            """
+            key = ("channel", "mine" if your_channel else channel_id, part)
+            channel = metadata_cache.get(key)
+            if channel is None:
+                if your_channel:
+                    response = _etag_execute(self.service.channels().list(part=part, mine=True), key)
+                else:
+                    response = _etag_execute(self.service.channels().list(part=part, id=channel_id), key)
+                if not response.get("items"):
+                    return None
+                channel = response["items"][0]
+                metadata_cache.set(key, channel)
+            return channel
+
+        def _invalidate_channel(self, channel_id: str) -> None:
+            """
+            Drops every metadata cache entry of the channel specified by channel_id after
+            it was modified. Your own channel may be cached under "mine" as well as under
+            its ID, so the "mine" entries are dropped too. The channel's entries in the
+            disk cache are dropped as well.
+            """
+            metadata_cache.invalidate(channel_id)
+            metadata_cache.invalidate("mine")
+            disk_cache.invalidate(channel_id)
+
+        @_handle_http()
+        def resolve_channels(self, identifiers: list[str]) -> (dict | None):
+            """
+            Resolves a list of channel IDs, @handles, channel URLs, legacy usernames or 
+            channel names to their channels. IDs are looked up 50 per channels().list 
+            call, handles and usernames cost 1 quota unit each and only plain names fall 
+            back to a 100 unit search. Returns a dictionary mapping each identifier to a 
+            dictionary with the channel's "id", "title" and "snippet". Identifiers that 
+            couldn't be resolved are left out.
+            """
+            service = self.service
+            ids = {}
+            for identifier in identifiers:
+                ident = identifier.strip()
+                match = _CHANNEL_URL_RE.search(ident)
+                if match:
+                    ident = match["id"] or match["handle"] or match["name"]
+                if _CHANNEL_ID_RE.match(ident):
+                    ids[identifier] = ident
+                    continue
+                if ident.startswith("@"):
+                    response = service.channels().list(part="id", forHandle=ident).execute()
+                else:
+                    response = service.channels().list(part="id", forUsername=ident).execute()
+                if response.get("items"):
+                    ids[identifier] = response["items"][0]["id"]
+                elif not ident.startswith("@"):
+                    channel_id = self.apitools_ref.Search(self.apitools_ref).get_channel_id_by_name(ident)
+                    if channel_id is not None:
+                        ids[identifier] = channel_id
+
+            channels = {}
+            unique_ids = iter(dict.fromkeys(ids.values()))
+            chunk = list(itertools.islice(unique_ids, MAX_IDS_PER_REQUEST))
+            while chunk:
+                response = service.channels().list(
+                    part="snippet",
+                    id=",".join(chunk)
+                ).execute()
+                for item in response.get("items", []):
+                    channels[item["id"]] = item
+                    metadata_cache.set(("channel", item["id"], "snippet"), item)
+                chunk = list(itertools.islice(unique_ids, MAX_IDS_PER_REQUEST))
+
+            resolved = {}
+            for identifier, channel_id in ids.items():
+                if channel_id in channels:
+                    snippet = channels[channel_id]["snippet"]
+                    resolved[identifier] = {
+                        "id": channel_id,
+                        "title": snippet["title"],
+                        "snippet": snippet
+                    }
+            return resolved
+
+        @_handle_http()
         def get_channel_numbers(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets channel statistics for either your channel or a channel 
@@ -294,9 +1161,6 @@ class YouTubeDataAPIv3Tools:
                     else:
                         None
                     
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -308,6 +1172,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// ENTIRE CHANNEL RESOURCE //////
+        @_handle_http()
         def get_channel(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the resource json for either your channel or a channel specified by 
@@ -337,9 +1202,6 @@ class YouTubeDataAPIv3Tools:
                     else:
                         return None
                     
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no channels with the given ID.\n{e}")
                 return None
@@ -351,36 +1213,18 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL KIND //////
+        @_handle_http()
         def get_channel_kind(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the kind of channel for either your channel or a channel specified 
             by channel_id. Returns the kind of channel if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        kind = channel["items"][0]["kind"]
-                        return kind
-                    else:
-                        return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        kind = channel["items"][0]["kind"]
-                        return kind
-                    else:
-                        return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                kind = channel["kind"]
+                return kind
             except IndexError as e:
                 print(f"There are no channels with the given ID.\n{e}")
                 return None
@@ -392,36 +1236,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL ETAG //////
+        @_handle_http()
         def get_etag(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the etag for either your channel or a channel specified by channel_id.
             Returns the etag of the channel if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        etag = channel["items"][0]["etag"]
-                        return etag
-                    else:
-                        return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        etag = channel["items"][0]["etag"]
-                        return etag
-                    else:
-                        return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                etag = channel["etag"]
+                return etag
             except IndexError as e:
                 print(f"There are no channels with the given ID.\n{e}")
                 return None
@@ -433,6 +1259,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL ID //////
+        @_handle_http()
         def get_id(self, your_channel: bool=True, channel_name: str=None) -> (str | None):
             """
             Gets the ID for either your channel or a channel specified by channel_name.
@@ -460,9 +1287,6 @@ class YouTubeDataAPIv3Tools:
                         return id
                     else:
                         return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"No channel ID.\n{ie}")
                 return None
@@ -474,37 +1298,20 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL SNIPPET //////
+        @_handle_http()
         def get_snippet(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the snippet part for either your channel or a channel specified by channel_id.
             Returns the snippet part of the channel resource json if successful and
             None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        snippet = channel["items"][0]["snippet"]
-                        return snippet
-                    else:
-                        return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is not None:
+                    snippet = channel["snippet"]
+                    return snippet
                 else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        snippet = channel["items"][0]["snippet"]
-                        return snippet
-                    else:
-                        return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                    return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -516,34 +1323,18 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL TITLE //////
+        @_handle_http()
         def get_channel_name(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the title for either your channel or a channel specified by channel_id.
             Returns the channel title if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["snippet"]["title"]
-                        return title
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["snippet"]["title"]
-                        return title
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is not None:
+                    title = channel["snippet"]["title"]
+                    return title
+                else: return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -554,6 +1345,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def set_channel_name(self, new_name: str, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Sets the title of either your channel or the channel specified by channel_id.
@@ -578,6 +1370,7 @@ class YouTubeDataAPIv3Tools:
                                 "snippet": snippet
                             }
                         ).execute()
+                        self._invalidate_channel(channel["items"][0]["id"])
                         return True
                     else: return False
                 else:
@@ -596,11 +1389,9 @@ class YouTubeDataAPIv3Tools:
                                 "snippet": snippet
                             }
                         ).execute()
+                        self._invalidate_channel(channel["items"][0]["id"])
                         return True
                     else: return False
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -612,6 +1403,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL DESCRIPTION //////
+        @_handle_http()
         def get_description(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the description for either your channel or a channel specified by 
@@ -639,9 +1431,6 @@ class YouTubeDataAPIv3Tools:
                         return desc
                     else: return None
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -652,6 +1441,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def set_description(self, new_description: str, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Sets the channel description of the channel specified by channel_id.
@@ -675,6 +1465,7 @@ class YouTubeDataAPIv3Tools:
                                 "snippet": snippet
                             }
                         ).execute()
+                        self._invalidate_channel(channel["items"][0]["id"])
                         return True
                     else: return False
                 else:
@@ -693,13 +1484,11 @@ class YouTubeDataAPIv3Tools:
                                 "snippet": snippet
                             }
                         ).execute()
+                        self._invalidate_channel(channel["items"][0]["id"])
                         return True
                     else: return False
                     
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -711,35 +1500,19 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL CUSTOM URL //////
+        @_handle_http()
         def get_custom_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the custom URL for either your channel or a channel specified by 
             channel_id.
             Returns the channels custom URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["customUrl"]
-                        return url
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["customUrl"]
-                        return url
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                url = channel["snippet"]["customUrl"]
+                return url
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -751,35 +1524,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL PUBLISHED DATE //////
+        @_handle_http()
         def get_time_published_at(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the datetime either your channel or a channel specified by channel_id was
             published at.
             Returns the datetime the channel was published at if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        date = channel["items"][0]["snippet"]["publishedAt"]
-                        return date
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        date = channel["items"][0]["snippet"]["publishedAt"]
-                        return date
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                date = channel["snippet"]["publishedAt"]
+                return date
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -791,34 +1548,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL THUMBNAILS //////
+        @_handle_http()
         def get_thumbnails(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the thumbnails for either your channel or a channel specified by channel_id.
             Returns a dictionary containing the thumbnails if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnails = channel["items"][0]["snippet"]["thumbnails"]
-                        return thumbnails
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnails = channel["items"][0]["snippet"]["thumbnails"]
-                        return thumbnails
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnails = channel["snippet"]["thumbnails"]
+                return thumbnails
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -830,34 +1571,18 @@ class YouTubeDataAPIv3Tools:
                 return None
            
         #////// CHANNEL DEFAULT RES THUMBNAIL //////
+        @_handle_http()
         def get_default_res_thumbnail(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Get the default res thumbnail for either your channel or a channel specified by channel_id.
             Returns a dictionary containing the default thumbnail if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["default"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["default"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["default"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -868,34 +1593,18 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_default_res_thumbnail_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Get thedefault res thumbnail URL for either your channel or a channel specified by channel_id.
             Returns the default res thumbnail URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["default"]["url"]
-                        return url
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["default"]["url"]
-                        return url
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                url = channel["snippet"]["thumbnails"]["default"]["url"]
+                return url
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -906,35 +1615,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_default_res_thumbnail_width(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the default res thumbnail width for either your channel or a channel specified 
             by channel_id.
             Returns the default thumbnail width if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["default"]["width"]
-                        return int(width)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["default"]["width"]
-                        return int(width)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                width = channel["snippet"]["thumbnails"]["default"]["width"]
+                return int(width)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -945,35 +1638,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_default_res_thumbnail_height(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the default res thumbnail height for either your channel or a channel specified 
             by channel_id.
             Returns the default thumbnail height if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["default"]["height"]
-                        return int(height)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["default"]["height"]
-                        return int(height)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                height = channel["snippet"]["thumbnails"]["default"]["height"]
+                return int(height)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -985,6 +1662,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// CHANNEL MEDIUM RES THUMBNAIL //////
+        @_handle_http()
         def get_medium_res_thumbnail(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the medium res thumbnail for either your channel or a channel specified by 
@@ -992,29 +1670,12 @@ class YouTubeDataAPIv3Tools:
             Returns a dictionary containing the medium res thumbnail if successful and None 
             otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["medium"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["medium"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["medium"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1025,35 +1686,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the medium res thumbnail URL for either your channel or a channel specified 
             by channel_id.
             Returns the medium res thumbnail URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["medium"]["url"]
-                        return url
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["medium"]["url"]
-                        return url
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                url = channel["snippet"]["thumbnails"]["medium"]["url"]
+                return url
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1064,35 +1709,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_medium_res_thumbnail_width(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets a the medium res thumbnail width for either your channel or a channel specified 
             by channel_id.
             Returns the medium res thumbnail width if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["medium"]["width"]
-                        return int(width)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["medium"]["width"]
-                        return int(width)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                width = channel["snippet"]["thumbnails"]["medium"]["width"]
+                return int(width)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1103,35 +1732,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_medium_res_thumbnail_height(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the medium res thumbnail height for either your channel or a channel specified 
             by channel_id.
             Returns the medium res thumbnail height if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["medium"]["height"]
-                        return int(height)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["medium"]["height"]
-                        return int(height)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                height = channel["snippet"]["thumbnails"]["medium"]["height"]
+                return int(height)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1143,6 +1756,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// CHANNEL HIGH RES THUMBNAIL //////
+        @_handle_http()
         def get_high_res_thumbnail(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the high res thumbnail for either your channel or a channel specified 
@@ -1150,29 +1764,12 @@ class YouTubeDataAPIv3Tools:
             Returns a dictionary containing the high res thumbnail if successful and None 
             otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["high"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["high"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["high"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1183,35 +1780,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the high res thumbnail URL for either your channel or a channel specified 
             by channel_id.
             Returns the high res thumbnail URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["high"]["url"]
-                        return url
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
                     return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        url = channel["items"][0]["snippet"]["thumbnails"]["high"]["url"]
-                        return url
-                    return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                url = channel["snippet"]["thumbnails"]["high"]["url"]
+                return url
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1222,35 +1803,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_high_res_thumbnail_width(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the high res thumbnail width for either your channel or a channel specified 
             by channel_id.
             Returns the high res thumbnail width if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["high"]["width"]
-                        return int(width)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["high"]["width"]
-                        return int(width)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                width = channel["snippet"]["thumbnails"]["high"]["width"]
+                return int(width)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1261,35 +1826,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_high_res_thumbnail_height(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the high res thumbnail height for either your channel or a channel specified 
             by channel_id.
             Returns the high res thumbnail height if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["high"]["height"]
-                        return int(height)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["high"]["height"]
-                        return int(height)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                height = channel["snippet"]["thumbnails"]["high"]["height"]
+                return int(height)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1301,6 +1850,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// CHANNEL STANDARD RES THUMBNAIL //////
+        @_handle_http()
         def get_standard_res_thumbnail(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the standard res thumbnail for either your channel or a channel specified 
@@ -1328,9 +1878,6 @@ class YouTubeDataAPIv3Tools:
                         thumbnail = channel["items"][0]["snippet"]["thumbnails"]["standard"]
                         return thumbnail
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1341,35 +1888,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the standard res thumbnail URL for either your channel or a channel specified 
             by channel_id.
             Returns the standard res thumbnail URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["standard"]["url"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["standard"]["url"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["standard"]["url"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1380,35 +1911,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_standard_res_thumbnail_width(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the standard res thumbnail width for either your channel or a channel specified 
             by channel_id.
             Returns the standard res thumbnail width if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["standard"]["width"]
-                        return int(width)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["standard"]["width"]
-                        return int(width)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                width = channel["snippet"]["thumbnails"]["standard"]["width"]
+                return int(width)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1419,35 +1934,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_standard_res_thumbnail_height(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the standard res thumbnail height for either your channel or a channel specified 
             by channel_id.
             Returns the standard res thumbnail height if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["standard"]["height"]
-                        return int(height)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["standard"]["height"]
-                        return int(height)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                height = channel["snippet"]["thumbnails"]["standard"]["height"]
+                return int(height)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1459,34 +1958,18 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// CHANNEL MAX RES THUMBNAIL //////
+        @_handle_http()
         def get_max_res_thumbnail(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the max res thumbnail for either your channel or a channel specified by channel_id.
             Returns a dictionary containing the max res thumbnail if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["maxres"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["maxres"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["maxres"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1497,35 +1980,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_max_res_thumbnail_url(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the max res thumbnail URL for either your channel or a channel specified 
             by channel_id.
             Returns the max res thumbnail URL if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["url"]
-                        return thumbnail
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        thumbnail = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["url"]
-                        return thumbnail
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                thumbnail = channel["snippet"]["thumbnails"]["maxres"]["url"]
+                return thumbnail
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1536,35 +2003,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_max_res_thumbnail_width(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the max res thumbnail width for either your channel or a channel specified 
             by channel_id.
             Returns the max res thumbnail width if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["width"]
-                        return int(width)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        width = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["width"]
-                        return int(width)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                width = channel["snippet"]["thumbnails"]["maxres"]["width"]
+                return int(width)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1575,35 +2026,19 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_max_res_thumbnail_height(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets teh max res thumbnail height for either your channel or a channel specified 
             by channel_id.
             Returns the max res thumbnail height if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["height"]
-                        return int(height)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        height = channel["items"][0]["snippet"]["thumbnails"]["maxres"]["height"]
-                        return int(height)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                height = channel["snippet"]["thumbnails"]["maxres"]["height"]
+                return int(height)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1615,35 +2050,19 @@ class YouTubeDataAPIv3Tools:
                 return None
                 
         #////// CHANNEL DEFAULT LANGUAGE //////
+        @_handle_http()
         def get_default_language(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the default language for either your channel or a channel specified 
             by channel_id.
             Returns the default language if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        lang = channel["items"][0]["snippet"]["defaultLanguage"]
-                        return lang
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        lang = channel["items"][0]["snippet"]["defaultLanguage"]
-                        return lang
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                lang = channel["snippet"]["defaultLanguage"]
+                return lang
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1655,34 +2074,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LOCALIZED DATA //////
+        @_handle_http()
         def get_localized_data(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the localized data for either your channel or a channel specified by channel_id.
             Returns the localized data in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        data = channel["items"][0]["snippet"]["localized"]
-                        return data
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        data = channel["items"][0]["snippet"]["localized"]
-                        return data
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                data = channel["snippet"]["localized"]
+                return data
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1694,34 +2097,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LOCALIZED TITLE //////
+        @_handle_http()
         def get_localized_title(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the localized title for either your channel or a channel specified by channel_id.
             Returns the localized title if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["snippet"]["localized"]["title"]
-                        return title
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["snippet"]["localized"]["title"]
-                        return title
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                title = channel["snippet"]["localized"]["title"]
+                return title
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1733,34 +2120,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL LOCALIZED DESCRIPTION //////
+        @_handle_http()
         def get_localized_description(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the localized description for either your channel or a channel specified by channel_id.
             Returns the localized description if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["snippet"]["localized"]["description"]
-                        return description
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["snippet"]["localized"]["description"]
-                        return description
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                description = channel["snippet"]["localized"]["description"]
+                return description
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1772,34 +2143,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL COUNTRY //////
+        @_handle_http()
         def get_origin_country(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the country for either your channel or a channel specified by channel_id.
             Returns the country code if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="snippet",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        country = channel["items"][0]["snippet"]["country"]
-                        return country
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="snippet",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        country = channel["items"][0]["snippet"]["country"]
-                        return country
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("snippet", your_channel, channel_id)
+                if channel is None:
+                    return None
+                country = channel["snippet"]["country"]
+                return country
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1811,34 +2166,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL CONTENT DETAILS //////
+        @_handle_http()
         def get_content_details(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the content details for either your channel or a channel specified by channel_id.
             Returns the content details part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["contentDetails"]
-                        return details
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["contentDetails"]
-                        return details
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                details = channel["contentDetails"]
+                return details
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1850,34 +2189,18 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL RELATED PLAYLISTS //////
+        @_handle_http()
         def get_related_playlists(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the related playlists for either your channel or a channel specified by channel_id.
             Returns the playlists if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        playlists = channel["items"][0]["contentDetails"]["relatedPlaylists"]
-                        return playlists
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        playlists = channel["items"][0]["contentDetails"]["relatedPlaylists"]
-                        return playlists
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                playlists = channel["contentDetails"]["relatedPlaylists"]
+                return playlists
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1889,34 +2212,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LIKES //////
+        @_handle_http()
         def get_likes(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the likes for either your channel or a channel specified by channel_id.
             Returns the likes if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        likes = channel["items"][0]["contentDetails"]["relatedPlaylists"]["likes"]
-                        return likes
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        likes = channel["items"][0]["contentDetails"]["relatedPlaylists"]["likes"]
-                        return likes
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                likes = channel["contentDetails"]["relatedPlaylists"]["likes"]
+                return likes
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1928,34 +2235,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL FAVORITES //////
+        @_handle_http()
         def get_favorites(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the favorites for either your channel or a channel specified by channel_id.
             Returns the favorites if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        favs = channel["items"][0]["contentDetails"]["relatedPlaylists"]["favorites"]
-                        return favs
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        favs = channel["items"][0]["contentDetails"]["relatedPlaylists"]["favorites"]
-                        return favs
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                favs = channel["contentDetails"]["relatedPlaylists"]["favorites"]
+                return favs
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -1967,34 +2258,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL UPLOADS //////
+        @_handle_http()
         def get_uploads(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the uploads for either your channel or a channel specified by channel_id.
             Returns the uploads if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        uploads = channel["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-                        return uploads
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        uploads = channel["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-                        return uploads
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                uploads = channel["contentDetails"]["relatedPlaylists"]["uploads"]
+                return uploads
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2006,34 +2281,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL STATISTICS //////
+        @_handle_http()
         def get_statistics(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the statistics for either your channel or a channel specified by channel_id.
             Returns the statistics part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="statistics",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        statistics = channel["items"][0]["statistics"]
-                        return statistics
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="statistics",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        statistics = channel["items"][0]["statistics"]
-                        return statistics
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("statistics", your_channel, channel_id)
+                if channel is None:
+                    return None
+                statistics = channel["statistics"]
+                return statistics
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2045,34 +2304,20 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL VIEW COUNT //////
+        @_handle_http()
         def get_view_count(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the view count for either your channel or a channel specified by channel_id.
             Returns the count if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="statistics",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["viewCount"]
-                        return int(count)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="statistics",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["viewCount"]
-                        return int(count)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("statistics", your_channel, channel_id)
+                if channel is None:
+                    return None
+                try:
+                    return int(channel["statistics"]["viewCount"])
+                except KeyError:
+                    return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2084,34 +2329,20 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL SUBSCRIBER COUNT //////
+        @_handle_http()
         def get_subscriber_count(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the subscriber count for either your channel or a channel specified by channel_id.
             Returns the count if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="statistics",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["subscriberCount"]
-                        return int(count)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="statistics",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["subscriberCount"]
-                        return int(count)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("statistics", your_channel, channel_id)
+                if channel is None:
+                    return None
+                try:
+                    return int(channel["statistics"]["subscriberCount"])
+                except KeyError:
+                    return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2122,36 +2353,47 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
     
+        @_handle_http()
+        def get_subscriber_counts(self, channel_ids: typing.Iterable[str]) -> (dict | None):
+            """
+            Returns a dictionary mapping each of the given channel IDs, which can be any 
+            iterable, to its subscriber count. The IDs are consumed 50 at a time and each 
+            group is looked up with a single channels().list call. Channels that hide 
+            their subscriber count are left out.
+            """
+            counts = {}
+            ids = iter(channel_ids)
+            chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            while chunk:
+                response = self.service.channels().list(
+                    part="statistics",
+                    id=",".join(chunk),
+                    fields="items(id,statistics/subscriberCount)"
+                ).execute()
+                for item in response.get("items", []):
+                    try:
+                        counts[item["id"]] = int(item["statistics"]["subscriberCount"])
+                    except KeyError:
+                        pass
+                chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            return counts
+    
         #////// CHANNEL HIDDEN SUBSCRIBER COUNT //////
+        @_handle_http()
         def has_hidden_subscriber_count(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Returns True if either your channel or a channel specified by channel_id has a 
             hidden subscriber count and False otherwise. Returns None if field doesn't exist
             and upon error.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="statistics",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        has = channel["items"][0]["statistics"]["hidenSubscriberCount"]
-                        return bool(has)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="statistics",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        has = channel["items"][0]["statistics"]["hidenSubscriberCount"]
-                        return bool(has)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("statistics", your_channel, channel_id)
+                if channel is None:
+                    return None
+                try:
+                    return bool(channel["statistics"]["hiddenSubscriberCount"])
+                except KeyError:
+                    return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2163,34 +2405,20 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL VIDEO COUNT //////
+        @_handle_http()
         def get_video_count(self, your_channel: bool=True, channel_id: str=None) -> (int | None):
             """
             Gets the video count for either your channel or a channel specified by channel_id.
             Returns the count if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="statistics",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["videoCount"]
-                        return int(count)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="statistics",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        count = channel["items"][0]["statistics"]["videoCount"]
-                        return int(count)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("statistics", your_channel, channel_id)
+                if channel is None:
+                    return None
+                try:
+                    return int(channel["statistics"]["videoCount"])
+                except KeyError:
+                    return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2202,34 +2430,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL TOPIC DETAILS //////
+        @_handle_http()
         def get_topic_details(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the topic details for either your channel or a channel specified by channel_id.
             Returns the topic details part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["topicDetails"]
-                        return details
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["topicDetails"]
-                        return details
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("topicDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                details = channel["topicDetails"]
+                return details
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2241,34 +2453,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL TOPIC IDS //////
+        @_handle_http()
         def get_topic_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             """
             Gets the topic IDs for either your channel or a channel specified by channel_id.
             Returns the IDs in a list if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        ids = channel["items"][0]["topicDetails"]["topicIds"]
-                        return ids
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        ids = channel["items"][0]["topicDetails"]["topicIds"]
-                        return ids
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("topicDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                ids = channel["topicDetails"]["topicIds"]
+                return ids
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2280,34 +2476,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL TOPIC CATEGORIES //////
+        @_handle_http()
         def get_topic_categories(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             """
             Gets the topic categories for either your channel or a channel specified by channel_id.
             Returns the categories in a list if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        cats = channel["items"][0]["topicDetails"]["topicCategories"]
-                        return cats
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="topicDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        cats = channel["items"][0]["topicDetails"]["topicCategories"]
-                        return cats
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("topicDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                cats = channel["topicDetails"]["topicCategories"]
+                return cats
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2319,34 +2499,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL STATUS //////
+        @_handle_http()
         def get_status(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the status part for either your channel or a channel specified by channel_id.
             Returns the status part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="status",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        status = channel["items"][0]["status"]
-                        return status
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="status",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        status = channel["items"][0]["status"]
-                        return status
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("status", your_channel, channel_id)
+                if channel is None:
+                    return None
+                status = channel["status"]
+                return status
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2358,6 +2522,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL PRIVACY STATUS //////
+        @_handle_http()
         def get_privacy_status(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the privacy status for either your channel or a channel specified by channel_id.
@@ -2383,9 +2548,6 @@ class YouTubeDataAPIv3Tools:
                         status = channel["items"][0]["status"]["privacyStatus"]
                         return status
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2397,37 +2559,19 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL IS LINKED //////
+        @_handle_http()
         def is_linked(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Returns True if either your channel or a channel specified by channel_id is 
             linked and False otherwise. Returns None if field doesn't exist
             and upon error.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="status",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        linked = channel["items"][0]["status"]["isLinked"]
-                        return bool(linked) 
-                    else:
-                        return None
-                else:
-                    channel = service.channels().list(
-                        part="status",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        linked = channel["items"][0]["status"]["isLinked"]
-                        return bool(linked) 
-                    else:
-                        return None 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("status", your_channel, channel_id)
+                if channel is None:
+                    return None
+                linked = channel["status"]["isLinked"]
+                return bool(linked)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2439,34 +2583,18 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL LONG UPLOADS STATUS //////
+        @_handle_http()
         def get_long_uploads_status(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the long upload status for either your channel or a channel specified by channel_id.
             Returns the status if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="status",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        status = channel["items"][0]["status"]["longUploadsStatus"]
-                        return status
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="status",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        status = channel["items"][0]["status"]["longUploadsStatus"]
-                        return status
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("status", your_channel, channel_id)
+                if channel is None:
+                    return None
+                status = channel["status"]["longUploadsStatus"]
+                return status
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2478,37 +2606,19 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL MADE FOR KIDS //////
+        @_handle_http()
         def is_made_for_kids(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Returns True if either your channel or a channel specified by channel_id is 
             made for kids and False otherwise. Returns None if field doesn't exist
             and upon error.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="status",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        kids = channel["items"][0]["status"]["madeForKids"]
-                        return bool(kids) 
-                    else:
-                        return None
-                else:
-                    channel = service.channels().list(
-                        part="status",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        kids = channel["items"][0]["status"]["madeForKids"]
-                        return bool(kids) 
-                    else:
-                        return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("status", your_channel, channel_id)
+                if channel is None:
+                    return None
+                kids = channel["status"]["madeForKids"]
+                return bool(kids) 
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2520,35 +2630,19 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL SELF DECLARED MADE FOR KIDS //////
+        @_handle_http()
         def is_self_declared_made_for_kids(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Returns True if either your channel or a channel specified by channel_id is self 
             declared made for kids and False otherwise. Returns None if field doesn't exist
             and upon error.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="status",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        kids = channel["items"][0]["status"]["selfDeclaredMadeForKids"]
-                        return bool(kids) 
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="status",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        kids = channel["items"][0]["status"]["selfDeclaredMadeForKids"]
-                        return bool(kids) 
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("status", your_channel, channel_id)
+                if channel is None:
+                    return None
+                kids = channel["status"]["selfDeclaredMadeForKids"]
+                return bool(kids) 
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2560,34 +2654,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL BRANDING SETTINGS //////
+        @_handle_http()
         def get_branding_settings(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the branding settings for either your channel or a channel specified by channel_id.
             Returns the settings part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        settings = channel["items"][0]["brandingSettings"]
-                        return settings
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        settings = channel["items"][0]["brandingSettings"]
-                        return settings
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                settings = channel["brandingSettings"]
+                return settings
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2599,34 +2677,18 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL BRANDING //////
+        @_handle_http()
         def get_branding(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the branding for either your channel or a channel specified by channel_id.
             Returns the branding part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        branding = channel["items"][0]["brandingSettings"]["channel"]
-                        return branding
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        branding = channel["items"][0]["brandingSettings"]["channel"]
-                        return branding
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                branding = channel["brandingSettings"]["channel"]
+                return branding
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2638,34 +2700,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL BRAND TITLE //////
+        @_handle_http()
         def get_brand_name(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the channel brand title for either your channel or a channel specified by channel_id.
             Returns the title if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["brandingSettings"]["channel"]["title"]
-                        return title
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["brandingSettings"]["channel"]["title"]
-                        return title
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                title = channel["brandingSettings"]["channel"]["title"]
+                return title
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2677,34 +2723,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL BRAND DESCRIPTION //////
+        @_handle_http()
         def get_brand_description(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the channel brand description for either your channel or a channel specified by channel_id.
             Returns the description if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["brandingSettings"]["channel"]["description"]
-                        return description
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["brandingSettings"]["channel"]["description"]
-                        return description
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                description = channel["brandingSettings"]["channel"]["description"]
+                return description
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2716,34 +2746,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL KEYWORDS //////
+        @_handle_http()
         def get_channel_hashtags(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             """
             Gets the keywrds for either your channel or a channel specified by channel_id.
             Returns the keywords in a list if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        keywords = channel["items"][0]["brandingSettings"]["channel"]["keywords"]
-                        return keywords
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        keywords = channel["items"][0]["brandingSettings"]["channel"]["keywords"]
-                        return keywords
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                keywords = channel["brandingSettings"]["channel"]["keywords"]
+                return keywords
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2755,35 +2769,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL TRACKING ANALYTICS ACCOUNT ID //////
+        @_handle_http()
         def get_tracking_analytics_account_id(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the tracking analytics account ID for either your channel or a channel 
             specified by channel_id.
             Returns the ID if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        id = channel["items"][0]["brandingSettings"]["channel"]["trackingAnalyticsAccountId"]
-                        return id
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        id = channel["items"][0]["brandingSettings"]["channel"]["trackingAnalyticsAccountId"]
-                        return id
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                id = channel["brandingSettings"]["channel"]["trackingAnalyticsAccountId"]
+                return id
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2795,34 +2793,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL HAS MODERATE COMMENTS //////
+        @_handle_http()
         def has_moderate_comments(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Returns True if either your channel or the channel specified by channel_id has 
             moderate comments and False otherwise. Returns None upon error.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        moderate = channel["items"][0]["brandingSettings"]["channel"]["moderateComments"]
-                        return bool(moderate)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        moderate = channel["items"][0]["brandingSettings"]["channel"]["moderateComments"]
-                        return bool(moderate)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                moderate = channel["brandingSettings"]["channel"]["moderateComments"]
+                return bool(moderate)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2834,34 +2816,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL UNSUBSCRIBED TRAILER //////
+        @_handle_http()
         def get_unsubscribed_trailer(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the unsubscribed trailer for either your channel or a channel specified by channel_id.
             Returns the trailer if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        trailer = channel["items"][0]["brandingSettings"]["channel"]["unsubscribedTrailer"]
-                        return trailer
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        trailer = channel["items"][0]["brandingSettings"]["channel"]["unsubscribedTrailer"]
-                        return trailer
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                trailer = channel["brandingSettings"]["channel"]["unsubscribedTrailer"]
+                return trailer
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2873,34 +2839,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL BRAND DEFAULT LANGUAGE //////
+        @_handle_http()
         def get_brand_default_language(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the channel brands default language for either your channel or a channel specified by channel_id.
             Returns the default lnguage if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        lang = channel["items"][0]["brandingSettings"]["channel"]["defaultLanguage"]
-                        return lang
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        lang = channel["items"][0]["brandingSettings"]["channel"]["defaultLanguage"]
-                        return lang
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                lang = channel["brandingSettings"]["channel"]["defaultLanguage"]
+                return lang
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2912,34 +2862,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL BRAND COUNTRY //////
+        @_handle_http()
         def get_brand_origin_country(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the channel brands country for either your channel or a channel specified by channel_id.
             Returns the country if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        country = channel["items"][0]["brandingSettings"]["channel"]["country"]
-                        return country
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        country = channel["items"][0]["brandingSettings"]["channel"]["country"]
-                        return country
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                country = channel["brandingSettings"]["channel"]["country"]
+                return country
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2951,34 +2885,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL WATCH DATA //////
+        @_handle_http()
         def get_watch_data(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the channel watch data for either your channel or a channel specified by channel_id.
             Returns the channel watch data part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        watch = channel["items"][0]["brandingSettings"]["watch"]
-                        return watch
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        watch = channel["items"][0]["brandingSettings"]["watch"]
-                        return watch
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                watch = channel["brandingSettings"]["watch"]
+                return watch
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -2990,34 +2908,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL WATCH TEXT COLOR //////
+        @_handle_http()
         def get_watch_text_color(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the watch text color for either your channel or a channel specified by channel_id.
             Returns the watch text color if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        color = channel["items"][0]["brandingSettings"]["watch"]["textColor"]
-                        return color
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        color = channel["items"][0]["brandingSettings"]["watch"]["textColor"]
-                        return color
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                color = channel["brandingSettings"]["watch"]["textColor"]
+                return color
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3029,34 +2931,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL WATCH BACKGROUND COLOR //////
+        @_handle_http()
         def get_watch_background_color(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the watch background color for either your channel or a channel specified by channel_id.
             Returns the watch background color if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:    
-                        color = channel["items"][0]["brandingSettings"]["watch"]["backgroundColor"]
-                        return color
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:    
-                        color = channel["items"][0]["brandingSettings"]["watch"]["backgroundColor"]
-                        return color
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                color = channel["brandingSettings"]["watch"]["backgroundColor"]
+                return color
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3068,34 +2954,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL FEATURED PLAYLIST ID //////
+        @_handle_http()
         def get_featured_playlist_id(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the featured playlist ID for either your channel or a channel specified by channel_id.
             Returns the featured playlist ID if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        id = channel["items"][0]["brandingSettings"]["watch"]["featuredPlaylistId"]
-                        return id
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="brandingSettings",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        id = channel["items"][0]["brandingSettings"]["watch"]["featuredPlaylistId"]
-                        return id
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("brandingSettings", your_channel, channel_id)
+                if channel is None:
+                    return None
+                id = channel["brandingSettings"]["watch"]["featuredPlaylistId"]
+                return id
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3107,34 +2977,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL AUDIT DETAILS //////
+        @_handle_http()
         def get_audit_details(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the audit details for either your channel or a channel specified by channel_id.
             Returns the audit details part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="auditDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["auditDetails"]
-                        return details
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="auditDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["auditDetails"]
-                        return details
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("auditDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                details = channel["auditDetails"]
+                return details
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3146,35 +3000,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL OVERALL GOOD STANDING //////
+        @_handle_http()
         def has_overall_good_standing(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Checks if either your channel or a channel specified by channel_id is in overall
             good standing.
             Returns True if so and False otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="auditDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        standing = channel["items"][0]["auditDetails"]["overallGoodStanding"]
-                        return bool(standing)
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="auditDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        standing = channel["items"][0]["auditDetails"]["overallGoodStanding"]
-                        return bool(standing)
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("auditDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                standing = channel["auditDetails"]["overallGoodStanding"]
+                return bool(standing)
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3186,6 +3024,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL COMMUNITY GUIDELINES GOOD STANDING //////
+        @_handle_http()
         def has_community_guidelines_good_standing(self, your_channel: bool=True, channel_id: str=None) -> (bool | None):
             """
             Checks if either your channel or a channel specified by channel_id is in good standing
@@ -3212,9 +3051,6 @@ class YouTubeDataAPIv3Tools:
                         details = channel["items"][0]["contentOwnerDetails"]
                         return details
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3226,34 +3062,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL CONTENT OWNER DETAILS //////
+        @_handle_http()
         def get_content_owner_details(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the content owner details for either your channel or a channel specified by channel_id.
             Returns the content owner details part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["contentOwnerDetails"]
-                        return details
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        details = channel["items"][0]["contentOwnerDetails"]
-                        return details
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentOwnerDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                details = channel["contentOwnerDetails"]
+                return details
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3265,34 +3085,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL CONTENT OWNER //////
+        @_handle_http()
         def get_content_owner(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the content owner for either your channel or a channel specified by channel_id.
             Returns the content owner if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        owner = channel["items"][0]["contentOwnerDetails"]["contentOwner"]
-                        return owner
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        owner = channel["items"][0]["contentOwnerDetails"]["contentOwner"]
-                        return owner
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentOwnerDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                owner = channel["contentOwnerDetails"]["contentOwner"]
+                return owner
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3304,34 +3108,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL TIME LINKED //////
+        @_handle_http()
         def get_time_linked(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the time a channel was linked for either your channel or a channel specified by channel_id.
             Returns the time linked if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        time = channel["items"][0]["contentOwnerDetails"]["timeLinked"]
-                        return time
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="contentOwnerDetails",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        time = channel["items"][0]["contentOwnerDetails"]["timeLinked"]
-                        return time
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("contentOwnerDetails", your_channel, channel_id)
+                if channel is None:
+                    return None
+                time = channel["contentOwnerDetails"]["timeLinked"]
+                return time
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3343,34 +3131,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LOCALIZATIONS //////
+        @_handle_http()
         def get_localizations_data(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Gets the localizations data for either your channel or a channel specified by channel_id.
             Returns the localizations data part in a dictionary if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="localizations",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        data = channel["items"][0]["localizations"]
-                        return data
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="localizations",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        data = channel["items"][0]["localizations"]
-                        return data
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("localizations", your_channel, channel_id)
+                if channel is None:
+                    return None
+                data = channel["localizations"]
+                return data
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3382,34 +3154,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LOCALIZATIONS TITLE //////
+        @_handle_http()
         def get_localizations_title(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the localizations title for either your channel or a channel specified by channel_id.
             Returns the localizations title if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="localizations",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["localizations"]["title"]
-                        return title
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="localizations",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        title = channel["items"][0]["localizations"]["title"]
-                        return title
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("localizations", your_channel, channel_id)
+                if channel is None:
+                    return None
+                title = channel["localizations"]["title"]
+                return title
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3421,34 +3177,18 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL LOCALIZATIONS DESCRIPTION //////
+        @_handle_http()
         def get_localizations_description(self, your_channel: bool=True, channel_id: str=None) -> (str | None):
             """
             Gets the localiztions description for either your channel or a channel specified by channel_id.
             Returns the localiztions description if successful and None otherwise.
             """
-            service = self.service
             try:
-                if not your_channel:
-                    channel = service.channels().list(
-                        part="localizations",
-                        id=channel_id
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["localizations"]["description"]
-                        return description
-                    else: return None
-                else:
-                    channel = service.channels().list(
-                        part="localizations",
-                        mine=your_channel
-                    ).execute()
-                    if "items" in channel:
-                        description = channel["items"][0]["localizations"]["description"]
-                        return description
-                    else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                channel = self._fetch_channel("localizations", your_channel, channel_id)
+                if channel is None:
+                    return None
+                description = channel["localizations"]["description"]
+                return description
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3485,6 +3225,7 @@ class YouTubeDataAPIv3Tools:
             self.service = ytd_api_tools.service
         
         #////// UTILITY METHODS //////
+        @_handle_http()
         def iterate_channel_sections(self, channel_id: str, func: object) -> (list[str] | None):
             service = self.service
             try:
@@ -3497,9 +3238,6 @@ class YouTubeDataAPIv3Tools:
                 for item in response["items"]:
                     func(item)
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no channels with the given ID.\n{e}")
                 return None
@@ -3511,6 +3249,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL SECTION //////
+        @_handle_http()
         def get_section(self, section_id: str) -> (dict | None):
             service = self.service
             try:
@@ -3523,9 +3262,6 @@ class YouTubeDataAPIv3Tools:
                     return channel
                 else: return None
                 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3536,6 +3272,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_section_by_index(self, index: int, channel_id: str=None) -> (dict | None):
             service = self.service
             try:
@@ -3557,9 +3294,6 @@ class YouTubeDataAPIv3Tools:
                         channel = channel["items"][index]
                         return channel
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3570,6 +3304,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_sections(self, your_channel: bool=True, channel_id: str=None) -> (dict | None):
             """
             Returns all of the channel sections for either your channel or 
@@ -3601,9 +3336,6 @@ class YouTubeDataAPIv3Tools:
                             sections.append(section)
                         return sections
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3615,6 +3347,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL SECTION KIND //////
+        @_handle_http()
         def get_kind(self, section_id: str) -> (str | None):
             """
             Returns the channel section kind for the channel section specified
@@ -3630,9 +3363,6 @@ class YouTubeDataAPIv3Tools:
                     kind = channel["items"][0]["kind"]
                     return kind
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3644,6 +3374,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL SECTION ETAG //////
+        @_handle_http()
         def get_etag(self, section_id) -> (str | None):
             """
             Returns the channel section etag for the channel section specified
@@ -3660,9 +3391,6 @@ class YouTubeDataAPIv3Tools:
                     etag = channel["items"][0]["etag"]
                     return etag
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3674,6 +3402,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL SECTION ID //////
+        @_handle_http()
         def get_id_by_index(self, channel_id: str, section_index) -> (str | None):
             """
             Returns the channel section id for the channel section specified
@@ -3690,9 +3419,6 @@ class YouTubeDataAPIv3Tools:
                     id = channel["items"][section_index]["id"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no more sections. The last section is at index {section_index - 1}\n{ie}")
                 return None
@@ -3703,6 +3429,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_id_by_type(self, channel_id: str, section_type: str) -> (str | None):
             """
             Returns the channel section IDs for the channel section type specified
@@ -3723,9 +3450,6 @@ class YouTubeDataAPIv3Tools:
                             sections.append(channel["items"][i]["id"])
                     return sections
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3736,6 +3460,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_ids(self, channel_id: str) -> (list[str] | None):
             """
             Returns the channel section IDs for the channel specified by channel_id. 
@@ -3755,9 +3480,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(id)
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3769,6 +3491,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL SECTION SNIPPET //////
+        @_handle_http()
         def get_snippet(self, section_id) -> (str | None):
             """
             Returns the channel section snippet for the channel section specified
@@ -3784,9 +3507,6 @@ class YouTubeDataAPIv3Tools:
                     snippet = channel["items"][0]["snippet"]
                     return snippet
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3798,6 +3518,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CHANNEL SECTION TYPE //////
+        @_handle_http()
         def get_type(self, section_id) -> (str | None):
             """
             Returns the channel section type for the channel section specified
@@ -3813,9 +3534,6 @@ class YouTubeDataAPIv3Tools:
                     type = channel["items"][0]["snippet"]["type"]
                     return type
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3827,6 +3545,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL SECTION CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, section_id) -> (str | None):
             """
             Returns the channel section ID for the channel section specified
@@ -3842,9 +3561,6 @@ class YouTubeDataAPIv3Tools:
                     id = channel["items"][0]["snippet"]["channelId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3856,6 +3572,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL SECTION TITLE //////
+        @_handle_http()
         def get_title(self, section_id) -> (str | None):
             """
             Returns the channel section title for the channel section specified
@@ -3865,15 +3582,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 channel = service.channelSections().list(
                     part="snippet",
-                    id=section_id
+                    id=section_id,
+                    fields="items/snippet/title"
                 ).execute()
                 if "items" in channel:
-                    title = channel["items"][0]["snippet"]
+                    title = channel["items"][0]["snippet"]["title"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3885,6 +3600,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL SECTION POSITION //////
+        @_handle_http()
         def get_position(self, section_id) -> (int | None):
             """
             Returns the channel section position for the channel section specified
@@ -3900,9 +3616,6 @@ class YouTubeDataAPIv3Tools:
                     position = channel["items"][0]["snippet"]["position"]
                     return int(position)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3914,6 +3627,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL SECTION CONTENT DETAILS //////
+        @_handle_http()
         def get_details(self, section_id) -> (dict | None):
             """
             Returns the channel section content details for the channel section specified
@@ -3929,9 +3643,6 @@ class YouTubeDataAPIv3Tools:
                     details = channel["items"][0]["contentDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3943,6 +3654,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// CHANNEL SECTION PLAYLISTS //////
+        @_handle_http()
         def get_playlists(self, section_id) -> (list[str] | None):
             """
             Returns the channel section playlists for the channel section specified
@@ -3958,9 +3670,6 @@ class YouTubeDataAPIv3Tools:
                     playlists = channel["items"][0]["contentDetails"]["playlists"]
                     return playlists
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -3972,6 +3681,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CHANNEL SECTION CHANNELS //////
+        @_handle_http()
         def get_channels(self, section_id) -> (list[str] | None):
             """
             Returns the channel section channels for the channel section specified
@@ -3981,15 +3691,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 channel = service.channelSections().list(
                     part="contentDetails",
-                    id=section_id
+                    id=section_id,
+                    fields="items/contentDetails/channels"
                 ).execute()
                 if "items" in channel:
-                    channels = channel["items"][0]["contentDetails"]["channels"]
-                    return channels
+                    channels = channel["items"][0].get("contentDetails", {}).get("channels", [])
+                    return list(dict.fromkeys(channels))
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -4000,6 +3708,31 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
+        def get_featured_channels(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
+            """
+            Returns the IDs of every channel featured in the channel sections of either 
+            your channel or the channel specified by channel_id, without duplicates and in
+            the order they first appear. Returns None if unsuccessful.
+            """
+            service = self.service
+            if not your_channel:
+                response = service.channelSections().list(
+                    part="contentDetails",
+                    channelId=channel_id,
+                    fields="items/contentDetails/channels"
+                ).execute()
+            else:
+                response = service.channelSections().list(
+                    part="contentDetails",
+                    mine=True,
+                    fields="items/contentDetails/channels"
+                ).execute()
+            featured = []
+            for section in response.get("items", []):
+                featured.extend(section.get("contentDetails", {}).get("channels", []))
+            return list(dict.fromkeys(featured))
+
     #//////////// CHANNEL BANNER  ////////////
     class ChannelBanner:
         def __init__(self):
@@ -4029,6 +3762,7 @@ class YouTubeDataAPIv3Tools:
             self.service = ytd_api_tools.service
 
         #////// PLAYLIST UTILITIES //////
+        @_handle_http()
         def create(self, title: str, description: str, privacy_status: str="public") -> (dict | None):
             """
             Creates a new playlist with the given title and description and returns the 
@@ -4054,9 +3788,6 @@ class YouTubeDataAPIv3Tools:
                     "id": response['id']
                 }
                 return new_playlist
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4067,6 +3798,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
                 
+        @_handle_http()
         def delete(self, playlist_id: str) -> (bool | None):
             """
             Deletes a playlist with the given ID. Returns True if the playlist
@@ -4078,9 +3810,6 @@ class YouTubeDataAPIv3Tools:
                     id=playlist_id
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4091,6 +3820,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def save(self, source_playlist_id: str, destination_playlist_id: str) -> (bool | None):
             """
             Saves the playlist represented by source_playlist_id to the destination 
@@ -4114,9 +3844,6 @@ class YouTubeDataAPIv3Tools:
                         }
                     ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4127,6 +3854,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
     
+        @_handle_http()
         def update_details(self, playlist_id: str, new_title: str=None, new_description: str=None) -> (bool | None):
             """
             Allows you to update the title and description of a playlist with the specified playlist_id.
@@ -4154,9 +3882,6 @@ class YouTubeDataAPIv3Tools:
                     }
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4168,6 +3893,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST ID //////    
+        @_handle_http()
         def get_id(self, playlist_title: str, channel_id: str=None, max_results: int=1) -> (str | None):
             """
             Returns the ID of the playlist specified by playlist_title from a channel specified
@@ -4187,9 +3913,6 @@ class YouTubeDataAPIv3Tools:
                     playlist_id = response["items"][0]["id"]["playlistId"]
                     return playlist_id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4200,6 +3923,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_ids(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist IDs for either your channel or the channel specified
@@ -4233,9 +3957,6 @@ class YouTubeDataAPIv3Tools:
                             ids.append(playlist["id"])
                         return ids
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4247,6 +3968,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// ENTIRE PLAYLIST RESOURCE //////
+        @_handle_http()
         def get_playlist(self, your_playlist: bool, playlist_name: str, channel_id: str=None, playlist_id: str=None) -> (dict | None):
             """
             Returns a playlist specified by playlist_name from either your channel or the 
@@ -4282,9 +4004,6 @@ class YouTubeDataAPIv3Tools:
                                 return response["items"][i]
                         return None
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4295,6 +4014,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_playlists(self, your_channel: bool, channel_id: str=None, max_results: int=10) -> (list | None):
             """
             Gets all playlists from either your channel or from a channel specified by 
@@ -4328,9 +4048,6 @@ class YouTubeDataAPIv3Tools:
                             playlists.append(playlist)
                         return playlists
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4341,6 +4058,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_liked_videos_playlist(self) -> (dict | None):
             """
             Get your own channels "Liked Videos" playlist. Returns the playlist
@@ -4360,9 +4078,6 @@ class YouTubeDataAPIv3Tools:
                             liked_playlist = item
                             return liked_playlist
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4374,6 +4089,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST KIND //////
+        @_handle_http()
         def get_kind_of_playlist(self, playlist_id: str) -> (str | None):
             """
             Returns the kind of playlist specified by playlist_id if 
@@ -4388,9 +4104,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 playlist_kind = response['kind']
                 return playlist_kind
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4401,6 +4114,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
             
+        @_handle_http()
         def get_all_kinds(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist kinds for either your channel or the channel specified
@@ -4434,9 +4148,6 @@ class YouTubeDataAPIv3Tools:
                             kinds.append(playlist["kind"])
                         return kinds
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4448,6 +4159,7 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// PLAYLIST ETAG //////
+        @_handle_http()
         def get_etag(self, playlist_id: str) -> (str | None):
             """
             Returns the etag of the playlist specified by playlist_id if 
@@ -4462,9 +4174,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 playlist_kind = response['kind']
                 return playlist_kind
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4475,6 +4184,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_etags(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None): 
             """
             Returns all playlist etags for either your channel or the channel specified
@@ -4492,7 +4202,6 @@ class YouTubeDataAPIv3Tools:
                     response = request.execute()
                     if "items" in response:
                         etags = []
-                        print(response['items'])
                         for playlist in response["items"]:
                             etags.append(playlist["etag"])
                         return etags
@@ -4506,14 +4215,10 @@ class YouTubeDataAPIv3Tools:
                     response = request.execute()
                     if "items" in response:
                         etags = []
-                        print(response['items'])
                         for playlist in response["items"]:
                             etags.append(playlist["etag"])
                         return etags
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4525,6 +4230,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST SNIPPET //////
+        @_handle_http()
         def get_snippet(self, playlist_id: str) -> (str | None):
             """
             Returns the snippet part of the playlist resource for the playlist specified 
@@ -4542,9 +4248,6 @@ class YouTubeDataAPIv3Tools:
                 playlist_snippet_info = response["items"][0]["snippet"]
                 return playlist_snippet_info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4555,6 +4258,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_snippets(self, your_playlists: bool, channel_id: str=None, max_results=10):
             """
             Returns all playlist snippets for either your channel or the channel specified
@@ -4588,9 +4292,6 @@ class YouTubeDataAPIv3Tools:
                             snippets.append(playlist["snippet"])
                         return snippets
                     else: return None 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4602,6 +4303,7 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// PLAYLIST PUBLISHED DATETIME //////
+        @_handle_http()
         def get_date_published(self, playlist_id: str) -> (str | None):
             """
             Returns the publish date of the playlist specified by playlist_id if 
@@ -4617,9 +4319,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["publishedAt"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4630,6 +4329,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_publish_dates(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (str | None):
             """
             Returns all playlist IDs for either your channel or the channel specified
@@ -4663,9 +4363,6 @@ class YouTubeDataAPIv3Tools:
                             published_dates.append(playlist["snippet"]["publishedAt"])
                         return published_dates
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4677,6 +4374,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, playlist_id: str):
             """
             Returns the channel ID of the playlist specified by playlist_id if 
@@ -4686,9 +4384,6 @@ class YouTubeDataAPIv3Tools:
                 playlist_info = self.get_playlist_snippet(playlist_id)
                 if playlist_info is not None:
                     return playlist_info["channelId"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4700,6 +4395,7 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// PLAYLIST TITLE //////                
+        @_handle_http()
         def get_title(self, playlist_id: str) -> (str | None):
             """
             Returns the title of the playlist specified by playlist_id if 
@@ -4715,9 +4411,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["title"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4728,6 +4421,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_titles(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist names for either your channel or the channel specified
@@ -4761,9 +4455,6 @@ class YouTubeDataAPIv3Tools:
                             titles.append(playlist["snippet"]["title"])
                         return titles
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4774,6 +4465,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def set_title(self, playlist_id, new_title=None) -> bool:
             service = self.service
 
@@ -4797,9 +4489,6 @@ class YouTubeDataAPIv3Tools:
 
                 return True
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4811,6 +4500,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST DESCRIPTION //////
+        @_handle_http()
         def get_description(self, playlist_id: str) -> (str | None):
             """
             Returns the description of the playlist specified by playlist_id if 
@@ -4826,9 +4516,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["description"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4839,6 +4526,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_descriptions(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist descriptions for either your channel or the channel specified
@@ -4872,9 +4560,6 @@ class YouTubeDataAPIv3Tools:
                             descriptions.append(playlist["snippet"]["description"])
                         return descriptions
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4885,6 +4570,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def set_description(self, playlist_id, new_description: str=None) -> bool:
             
             service = self.service
@@ -4907,9 +4593,6 @@ class YouTubeDataAPIv3Tools:
                     }
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4921,6 +4604,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST THUMBNAIL //////
+        @_handle_http()
         def get_thumbnails(self, playlist_id: str) -> (str | None):
             """
             Returns the thumbnails part of the playlist resource for the playlist specified by playlist_id if 
@@ -4930,15 +4614,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4949,6 +4631,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist thumbnails for either your channel or the channel specified
@@ -4959,6 +4642,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -4972,6 +4656,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -4982,9 +4667,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -4996,6 +4678,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST DEFAULT RES THUMBNAIL //////
+        @_handle_http()
         def get_default_res_thumbnail(self, playlist_id: str) -> (dict | None):
             """
             Returns the default res thumbnail of the playlist specified by playlist_id if 
@@ -5005,15 +4688,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
-                    return response["items"][0]["snippet"]["default"]
+                    return response["items"][0]["snippet"]["thumbnails"]["default"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5024,6 +4705,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_default_res_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist default res thumbnails for either your channel or the channel specified
@@ -5034,6 +4716,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5047,6 +4730,7 @@ class YouTubeDataAPIv3Tools:
                 else: 
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5057,9 +4741,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["default"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5070,6 +4751,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_default_res_thumbnail_url(self, playlist_id: str) -> (dict | None):
             """
             Returns the default res thumbnail url of the playlist specified by playlist_id if 
@@ -5079,15 +4761,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["default"]["url"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5098,6 +4778,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_default_res_thumbnail_urls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist default res thumbnail urls for either your channel or the channel specified
@@ -5108,6 +4789,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5121,6 +4803,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5131,9 +4814,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["default"]["url"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5144,6 +4824,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_default_res_thumbnail_width(self, playlist_id: str) -> (int | None):
             """
             Returns the default res thumbnail width of the playlist specified by playlist_id if 
@@ -5153,15 +4834,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["default"]["width"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5181,6 +4860,7 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
@@ -5195,6 +4875,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// PLAYLIST MEDIUM RES THUMBNAIL //////
+        @_handle_http()
         def get_medium_res_thumbnail(self, playlist_id: str) -> (dict | None):
             """
             Returns the medium res thumbnail of the playlist specified by playlist_id if 
@@ -5204,15 +4885,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["medium"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5223,6 +4902,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_medium_res_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist medium res thumbnails for either your channel or the channel specified
@@ -5233,6 +4913,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5246,6 +4927,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5256,9 +4938,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["medium"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5269,6 +4948,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_url(self, playlist_id: str) -> (dict | None):
             """
             Returns the medium res thumbnail url of the playlist specified by playlist_id if 
@@ -5278,15 +4958,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["medium"]["url"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5297,6 +4975,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_medium_res_thumbnail_urls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist medium res thumbnail urls for either your channel or the channel specified
@@ -5307,6 +4986,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5320,6 +5000,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5330,9 +5011,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["medium"]["url"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5343,6 +5021,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_width(self, playlist_id: str) -> (int | None):
             """
             Returns the medium res thumbnail width of the playlist specified by playlist_id if 
@@ -5352,15 +5031,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["medium"]["width"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5371,6 +5048,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_medium_res_thumbnail_height(self, playlist_id: str) -> (int | None):
             """
             Returns the medium res thumbnail of the playlist specified by playlist_id if 
@@ -5380,15 +5058,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["default"]["height"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5400,6 +5076,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST HIGH RES THUMBNAIL //////
+        @_handle_http()
         def get_high_res_thumbnail(self, playlist_id: str) -> (dict | None):
             """
             Returns the high res thumbnail of the playlist specified by playlist_id if 
@@ -5409,15 +5086,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["high"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5428,6 +5103,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_high_res_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist high res thumbnails for either your channel or the channel specified
@@ -5438,6 +5114,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5451,6 +5128,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5461,9 +5139,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["high"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5474,6 +5149,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_url(self, playlist_id: str) -> (dict | None):
             """
             Returns the high res thumbnail url of the playlist specified by playlist_id if 
@@ -5483,15 +5159,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["high"]["url"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5502,6 +5176,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_high_res_thumbnail_urls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist high res thumbnail urls for either your channel or the channel specified
@@ -5512,6 +5187,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5525,6 +5201,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5535,9 +5212,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["high"]["url"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5548,6 +5222,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_width(self, playlist_id: str) -> (int | None):
             """
             Returns the high res thumbnail width of the playlist specified by playlist_id if 
@@ -5557,15 +5232,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["high"]["width"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5576,6 +5249,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_high_res_thumbnail_height(self, playlist_id: str) -> (int | None):
             """
             Returns the high res thumbnail height of the playlist specified by playlist_id if 
@@ -5585,15 +5259,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["high"]["height"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5605,6 +5277,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST STANDARD THUMBNAIL //////
+        @_handle_http()
         def get_standard_res_thumbnail(self, playlist_id: str) -> (dict | None):
             """
             Returns the standard res thumbnail of the playlist specified by playlist_id if 
@@ -5614,15 +5287,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["standard"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5633,6 +5304,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_standard_res_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist standard res thumbnails for either your channel or the channel specified
@@ -5643,6 +5315,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5656,6 +5329,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5666,9 +5340,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["standard"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5679,6 +5350,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_url(self, playlist_id: str) -> (dict | None):
             """
             Returns the standard res thumbnail url of the playlist specified by playlist_id if 
@@ -5688,15 +5360,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["standard"]["url"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5707,6 +5377,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_standard_res_thumbnail_urls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist standard res thumbnail urls for either your channel or the channel specified
@@ -5717,6 +5388,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5730,6 +5402,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5740,9 +5413,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["standard"]["url"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5753,6 +5423,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_width(self, playlist_id: str) -> (int | None):
             """
             Returns the standard res thumbnail width of the playlist specified by playlist_id if 
@@ -5762,15 +5433,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["standard"]["width"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5781,6 +5450,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_standard_res_thumbnail_height(self, playlist_id: str) -> (int | None):
             """
             Returns the standard res thumbnail height of the playlist specified by playlist_id if 
@@ -5790,15 +5460,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["standard"]["height"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5810,6 +5478,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST MAX RES THUMBNAIL //////
+        @_handle_http()
         def get_max_res_thumbnail(self, playlist_id: str) -> (dict | None):
             """
             Returns the max res thumbnail of the playlist specified by playlist_id if 
@@ -5819,15 +5488,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["maxres"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5838,6 +5505,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_max_res_thumbnails(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist max res thumbnails for either your channel or the channel specified
@@ -5848,6 +5516,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5861,6 +5530,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5871,9 +5541,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["maxres"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5884,6 +5551,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_max_res_thumbnail_url(self, playlist_id: str) -> (dict | None):
             """
             Returns the max res thumbnail url of the playlist specified by playlist_id if 
@@ -5893,15 +5561,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["maxres"]["url"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5912,6 +5578,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_max_res_thumbnail_urls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist max res thumbnail urls for either your channel or the channel specified
@@ -5922,6 +5589,7 @@ class YouTubeDataAPIv3Tools:
                 if not your_playlists:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         channelId=channel_id,
                         maxResults=max_results
                     )
@@ -5935,6 +5603,7 @@ class YouTubeDataAPIv3Tools:
                 else:
                     request = service.playlists().list(
                         part="snippet",
+                        fields="items/snippet/thumbnails",
                         mine=True,
                         maxResults=max_results
                     )
@@ -5945,9 +5614,6 @@ class YouTubeDataAPIv3Tools:
                             thumbnails.append(playlist["snippet"]["thumbnails"]["maxres"]["url"])
                         return thumbnails
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5958,6 +5624,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_max_res_thumbnail_width(self, playlist_id: str) -> (int | None):
             """
             Returns the max res thumbnail width of the playlist specified by playlist_id if 
@@ -5967,15 +5634,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["maxres"]["width"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -5986,6 +5651,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_max_res_thumbnail_height(self, playlist_id: str) -> (int | None):
             """
             Returns the max res thumbnail height of the playlist specified by playlist_id if 
@@ -5995,15 +5661,13 @@ class YouTubeDataAPIv3Tools:
             try:
                 request = service.playlists().list(
                     part="snippet",
+                    fields="items/snippet/thumbnails",
                     id=playlist_id
                 )
                 response = request.execute()
                 if "items" in response:
                     return response["items"][0]["snippet"]["thumbnails"]["maxres"]["height"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6015,6 +5679,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST CHANNEL NAME //////
+        @_handle_http()
         def get_channel_name(self, playlist_id: str) -> (str | None):
             """
             Returns the channel name of the playlist specified by playlist_id if 
@@ -6030,9 +5695,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["channelTitle"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6044,6 +5706,7 @@ class YouTubeDataAPIv3Tools:
                 return None
            
         #////// PLAYLIST DEFAULT LANGUAGE //////
+        @_handle_http()
         def get_default_language(self, playlist_id: str) -> (str | None):
             """
             Returns the default language of the playlist specified by playlist_id if 
@@ -6059,9 +5722,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["defaultLanguage"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6072,6 +5732,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_default_languages(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist default languages for either your channel or the channel specified
@@ -6105,9 +5766,6 @@ class YouTubeDataAPIv3Tools:
                             langs.append(playlist["snippet"]["defaultLanguage"])
                         return langs
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6119,6 +5777,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST LOCALIZED DATA //////
+        @_handle_http()
         def get_localized_data(self, playlist_id: str) -> (str | None):
             """
             Returns the localized data part of the playlist resource for the playlist specified 
@@ -6134,9 +5793,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["localized"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6147,6 +5803,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
             
+        @_handle_http()
         def get_all_localized_data(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlists localized data for either your channel or the channel specified
@@ -6180,9 +5837,6 @@ class YouTubeDataAPIv3Tools:
                             titles.append(playlist["snippet"]["localized"])
                         return titles
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6194,6 +5848,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST LOCALIZED TITLE //////
+        @_handle_http()
         def get_localized_title(self, playlist_id: str) -> (str | None):
             """
             Returns the localized title of the playlist specified by playlist_id if 
@@ -6209,9 +5864,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["localized"]["title"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6222,6 +5874,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_localized_titles(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist localized titles for either your channel or the channel specified
@@ -6255,9 +5908,6 @@ class YouTubeDataAPIv3Tools:
                             titles.append(playlist["snippet"]["localized"]["title"])
                         return titles
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6269,6 +5919,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST LOCALIZED DESCRIPTION //////
+        @_handle_http()
         def get_localized_description(self, playlist_id: str) -> (str | None):
             """
             Returns the localized description of the playlist specified by playlist_id if 
@@ -6284,9 +5935,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["localized"]["description"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6297,6 +5945,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_localized_descriptions(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list | None):
             """
             Returns all playlist localized description for either your channel or the channel specified
@@ -6330,9 +5979,6 @@ class YouTubeDataAPIv3Tools:
                             descriptions.append(playlist["snippet"]["localized"]["description"])
                         return descriptions
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6344,6 +5990,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST STATUS //////
+        @_handle_http()
         def get_status(self, playlist_id: str) -> (str | None):
             """
             Returns the status part of the playlist resource for the playlist specified 
@@ -6359,9 +6006,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["status"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6372,6 +6016,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_statuses(self, your_playlists: bool, channel_id: str=None, max_results=10):
             """
             Returns all playlist statuses for either your channel or the channel specified
@@ -6405,9 +6050,6 @@ class YouTubeDataAPIv3Tools:
                             snippets.append(playlist["status"])
                         return snippets
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6419,6 +6061,7 @@ class YouTubeDataAPIv3Tools:
                 return None
        
         #////// PLAYLIST PRIVACY STATUS //////
+        @_handle_http()
         def get_privacy_status(self, playlist_id: str) -> (str | None):
             """
             Returns the privacy status of the playlist specified by playlist_id if 
@@ -6434,13 +6077,11 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["status"]["privacyStatus"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except KeyError as ke:
                 print(f"Key error: No privacy status field available.\n {ke}")
                 return None
 
+        @_handle_http()
         def get_all_privacy_statuses(self, your_playlists: bool, channel_id: str=None, max_results=10):
             """
             Returns all playlist privacy statuses for either your channel or the channel specified
@@ -6474,41 +6115,34 @@ class YouTubeDataAPIv3Tools:
                             snippets.append(playlist["status"]["privacyStatus"])
                         return snippets
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-                return None
             except KeyError as ke:
                 print(f"Key error: No privacy status field available.\n {ke}")
                 return None
         
+        @_handle_http(False)
         def set_privacy_status(self, playlist_id, privacy_status):
-        
+            """
+            Sets the privacy status of the playlist specified by playlist_id. The status 
+            part only holds the privacy status so it is sent directly without listing the 
+            playlist first. Returns True if successful and False otherwise.
+            """
             service = self.service
 
-            try:
-                playlist = service.playlists().list(
-                    part="status",
-                    id=playlist_id
-                ).execute()
-
-                status = playlist["items"][0]["status"]
-                status["privacyStatus"] = privacy_status
-
-                service.playlists().update(
-                    part="status",
-                    body={
-                        "id": playlist_id,
-                        "status": status
+            service.playlists().update(
+                part="status",
+                body={
+                    "id": playlist_id,
+                    "status": {
+                        "privacyStatus": privacy_status
                     }
-                ).execute()
+                }
+            ).execute()
 
-                return True
+            return True
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-                return False
         
         #////// PLAYLIST CONTENT DETAILS //////
+        @_handle_http()
         def get_content_details(self, playlist_id: str) -> (str | None):
             """
             Returns the content details of the playlist specified by playlist_id if 
@@ -6524,13 +6158,11 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["contentDetails"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except KeyError as ke:
                 print(f"Key error: No content details field available.\n {ke}")
                 return None
 
+        @_handle_http()
         def get_all_content_details(self, your_playlists: bool, channel_id: str=None, max_results=10): 
             """
             Returns all playlist content details for either your channel or the channel specified
@@ -6565,9 +6197,6 @@ class YouTubeDataAPIv3Tools:
                             details.append(playlist["contentDetails"])
                         return details
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6579,6 +6208,7 @@ class YouTubeDataAPIv3Tools:
                 return None
        
         #////// PLAYLIST ITEM COUNT //////
+        @_handle_http()
         def get_item_count(self, playlist_id: str) -> (int | None):
             """
             Returns the item count of the playlist specified by playlist_id if 
@@ -6594,9 +6224,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["contentDetails"]["itemCount"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6607,6 +6234,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_item_counts(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list[int] | None):
             """
             Returns all playlist item counts for either your channel or the channel specified
@@ -6640,9 +6268,6 @@ class YouTubeDataAPIv3Tools:
                             counts.append(playlist["contentDetails"]["itemCount"])
                         return counts
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6654,6 +6279,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST PLAYER //////
+        @_handle_http()
         def get_player(self, playlist_id: str) -> (str | None):
             """
             Returns the player part of the playlist resource for the playlist specified by 
@@ -6669,9 +6295,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["player"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6682,6 +6305,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_players(self, your_playlists: bool, channel_id: str=None, max_results=10):
             """
             Returns all playlist players for either your channel or the channel specified
@@ -6715,9 +6339,6 @@ class YouTubeDataAPIv3Tools:
                             details.append(playlist["contentDetails"])
                         return details
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6729,6 +6350,7 @@ class YouTubeDataAPIv3Tools:
                 return None
        
         #////// PLAYLIST EMBED HTML //////
+        @_handle_http()
         def get_embed_html(self, playlist_id: str) -> (int | None):
             """
             Returns the embed HTML of the playlist specified by playlist_id if 
@@ -6744,9 +6366,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["player"]["embedHtml"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6757,6 +6376,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_embed_htmls(self, your_playlists: bool, channel_id: str=None, max_results=10) -> (list[int] | None):
             """
             Returns all playlist embed htmls for either your channel or the channel specified
@@ -6790,9 +6410,6 @@ class YouTubeDataAPIv3Tools:
                             counts.append(playlist["player"]["embedHtml"])
                         return counts
                     else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6808,6 +6425,7 @@ class YouTubeDataAPIv3Tools:
         def __init__(self, ytd_api_tools: object) -> None:
             self.service = ytd_api_tools.service
         
+        @_handle_http()
         def get_playlist_items(self, playlist_id: str, max_results: int=10) -> (list[dict] | None):
             service = self.service
             try:
@@ -6823,9 +6441,6 @@ class YouTubeDataAPIv3Tools:
                         videos.append(video)
                     return videos
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6836,6 +6451,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def reorder_items(self, playlist_id: str, video_ids: list) -> (bool | None):
             """
             Allows you to reorder videos in a playlist by providing a list of video_ids. 
@@ -6872,9 +6488,6 @@ class YouTubeDataAPIv3Tools:
                         request.execute()
                     return True
                 else: return False
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6885,6 +6498,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def save_to_playlist(self, playlist_id: str, video_id: str) -> (bool | None):
             """
             This method allows you to save a video specified by ID to a playlist
@@ -6908,9 +6522,6 @@ class YouTubeDataAPIv3Tools:
 
                 return True
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"IndexError:\n{e}")
                 return None
@@ -6921,6 +6532,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
+        @_handle_http()
         def remove_from_playlist(self, playlist_item_id: str) -> (bool | None):        
             """
             Removes the play list video specified by playlist_item_id from the 
@@ -6934,9 +6546,6 @@ class YouTubeDataAPIv3Tools:
                     id=playlist_item_id
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6947,6 +6556,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def iterate_items_in_playlist(self, playlist_id: str, func=None) -> (bool | None):
             try:
                 if func is not None:
@@ -6959,9 +6569,6 @@ class YouTubeDataAPIv3Tools:
                         print(f"Unable to fetch videos in playlist with ID {playlist_id}.")
                         return False
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -6973,6 +6580,7 @@ class YouTubeDataAPIv3Tools:
                 return None
              
         #////// ENTIRE PLAYLIST ITEM RESOURCE //////
+        @_handle_http()
         def get_item_by_index(self, playlist_id: str, index: int=0) -> (str | None):
             """
             Returns the playlist item resource of the item specified by index
@@ -6993,9 +6601,6 @@ class YouTubeDataAPIv3Tools:
                     playlist_item = response["items"][index]
                     return playlist_item
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7006,6 +6611,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_item_by_id(self, item_id: str=None) -> (list[dict] | None):
             """
             Returns the playlist item resource of the item specified by item ID if
@@ -7023,9 +6629,6 @@ class YouTubeDataAPIv3Tools:
                     playlist_item = response["items"][0]
                     return playlist_item
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist item with the given ID.\n{ie}")
                 return None
@@ -7036,6 +6639,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_all_items(self, playlist_id: str) -> (str | None):
             """
             Returns all playlist items from the playlist specified by playlist_id.
@@ -7057,9 +6661,6 @@ class YouTubeDataAPIv3Tools:
                     return items
                 else: return None
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7070,6 +6671,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_item(self, item_id: str) -> (str | None):
             """
             Returns the item resource associated with the given item_id. Returns None
@@ -7086,9 +6688,6 @@ class YouTubeDataAPIv3Tools:
                     playlist_item = response["items"]
                     return playlist_item
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7100,6 +6699,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST ITEM KIND //////
+        @_handle_http()
         def get_kind_of_item(self, item_id: str) -> (str | None):
             """
             Returns the item kind associated with the given item_id. Returns None
@@ -7116,9 +6716,6 @@ class YouTubeDataAPIv3Tools:
                     kind = response["items"][0]["kind"]
                     return kind
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7129,6 +6726,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_kind_of_all_items(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7144,9 +6742,6 @@ class YouTubeDataAPIv3Tools:
                         kinds.append(pitem["kind"])
                     return kinds
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7158,6 +6753,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM ETAG //////
+        @_handle_http()
         def get_etag(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7170,9 +6766,6 @@ class YouTubeDataAPIv3Tools:
                     etag = response["items"][0]["etag"]
                     return etag
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7183,6 +6776,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_etags(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7198,9 +6792,6 @@ class YouTubeDataAPIv3Tools:
                         etags.append(pitem["etag"])
                     return etags
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7212,6 +6803,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM ETAG //////
+        @_handle_http()
         def get_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7224,9 +6816,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["id"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7237,6 +6826,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_ids(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7252,9 +6842,6 @@ class YouTubeDataAPIv3Tools:
                         id.append(pitem["id"])
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7266,6 +6853,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM SNIPPETS //////
+        @_handle_http()
         def get_snippet(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7278,9 +6866,6 @@ class YouTubeDataAPIv3Tools:
                     snippet = response["items"][0]["snippet"]
                     return snippet
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7291,6 +6876,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_snippets(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7306,9 +6892,6 @@ class YouTubeDataAPIv3Tools:
                         snippets.append(pitem["snippet"])
                     return snippets
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7320,6 +6903,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM PUBLISH DATES //////
+        @_handle_http()
         def get_published_date(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7332,9 +6916,6 @@ class YouTubeDataAPIv3Tools:
                     date = response["items"][0]["snippet"]["publishedAt"]
                     return date
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7345,6 +6926,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_publish_dates(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7360,9 +6942,6 @@ class YouTubeDataAPIv3Tools:
                         dates.append(pitem["snippet"]["publishedAt"])
                     return dates
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7374,6 +6953,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7386,9 +6966,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["snippet"]["channelId"]
                     return id
                 else: return None 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7399,6 +6976,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_channel_ids(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7414,9 +6992,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["snippet"]["channelId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7428,6 +7003,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM TITLE //////
+        @_handle_http()
         def get_title(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7440,9 +7016,6 @@ class YouTubeDataAPIv3Tools:
                     title = response["items"][0]["snippet"]["title"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7453,6 +7026,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_titles(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7468,9 +7042,6 @@ class YouTubeDataAPIv3Tools:
                         titles.append(pitem["snippet"]["title"])
                     return titles
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7482,6 +7053,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM DESCRIPTION //////
+        @_handle_http()
         def get_description(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7494,9 +7066,6 @@ class YouTubeDataAPIv3Tools:
                     description = response["items"][0]["snippet"]["description"]
                     return description
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7507,6 +7076,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_descriptions(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7522,9 +7092,6 @@ class YouTubeDataAPIv3Tools:
                         descriptions.append(pitem["snippet"]["description"])
                     return descriptions
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7536,6 +7103,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM THUMBNAILS //////
+        @_handle_http()
         def get_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -7548,9 +7116,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7561,6 +7126,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -7576,9 +7142,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7590,6 +7153,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM DEFAULT RES THUMBNAIL //////
+        @_handle_http()
         def get_default_res_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -7602,9 +7166,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]["default"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7615,6 +7176,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_default_res_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -7630,9 +7192,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"]["default"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7643,6 +7202,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_default_res_thumbnail_url(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7655,9 +7215,6 @@ class YouTubeDataAPIv3Tools:
                     url = response["items"][0]["snippet"]["thumbnails"]["default"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7668,6 +7225,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_default_res_thumbnail_urls(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7683,9 +7241,6 @@ class YouTubeDataAPIv3Tools:
                         urls.append(pitem["snippet"]["thumbnails"]["default"]["url"])
                     return urls
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7696,6 +7251,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_default_res_thumbnail_width(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -7708,9 +7264,6 @@ class YouTubeDataAPIv3Tools:
                     width = response["items"][0]["snippet"]["thumbnails"]["default"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7721,6 +7274,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_default_res_thumbnail_widths(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -7736,9 +7290,6 @@ class YouTubeDataAPIv3Tools:
                         widths.append(pitem["snippet"]["thumbnails"]["default"]["width"])
                     return widths
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7749,6 +7300,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_default_res_thumbnail_height(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -7761,9 +7313,6 @@ class YouTubeDataAPIv3Tools:
                     height = response["items"][0]["snippet"]["thumbnails"]["default"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7774,6 +7323,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_default_res_thumbnail_heights(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -7789,9 +7339,6 @@ class YouTubeDataAPIv3Tools:
                         heights.append(pitem["snippet"]["thumbnails"]["default"]["height"])
                     return heights
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7803,6 +7350,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM MEDIUM RES THUMBNAIL //////
+        @_handle_http()
         def get_medium_res_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -7815,9 +7363,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]["medium"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7828,6 +7373,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_medium_res_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -7843,9 +7389,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"]["medium"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7856,6 +7399,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_url(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -7868,9 +7412,6 @@ class YouTubeDataAPIv3Tools:
                     url = response["items"][0]["snippet"]["thumbnails"]["medium"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7881,6 +7422,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_medium_res_thumbnail_urls(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -7896,9 +7438,6 @@ class YouTubeDataAPIv3Tools:
                         urls.append(pitem["snippet"]["thumbnails"]["medium"]["url"])
                     return urls
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7909,6 +7448,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_width(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -7921,9 +7461,6 @@ class YouTubeDataAPIv3Tools:
                     width = response["items"][0]["snippet"]["thumbnails"]["medium"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7934,6 +7471,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_medium_res_thumbnail_widths(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -7949,9 +7487,6 @@ class YouTubeDataAPIv3Tools:
                         widths.append(pitem["snippet"]["thumbnails"]["medium"]["width"])
                     return widths
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -7962,6 +7497,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_height(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -7974,9 +7510,6 @@ class YouTubeDataAPIv3Tools:
                     height = response["items"][0]["snippet"]["thumbnails"]["medium"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -7987,6 +7520,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_medium_res_thumbnail_heights(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8002,9 +7536,6 @@ class YouTubeDataAPIv3Tools:
                         heights.append(pitem["snippet"]["thumbnails"]["medium"]["height"])
                     return heights
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8016,6 +7547,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM HIGH RES THUMBNAIL //////
+        @_handle_http()
         def get_high_res_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -8028,9 +7560,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]["high"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8041,6 +7570,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_high_res_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -8056,9 +7586,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"]["high"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8069,6 +7596,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_url(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8081,9 +7609,6 @@ class YouTubeDataAPIv3Tools:
                     url = response["items"][0]["snippet"]["thumbnails"]["high"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8094,6 +7619,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_high_res_thumbnail_urls(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8109,9 +7635,6 @@ class YouTubeDataAPIv3Tools:
                         urls.append(pitem["snippet"]["thumbnails"]["high"]["url"])
                     return urls
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8122,6 +7645,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_width(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8134,9 +7658,6 @@ class YouTubeDataAPIv3Tools:
                     width = response["items"][0]["snippet"]["thumbnails"]["high"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8147,6 +7668,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_high_res_thumbnail_widths(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8162,9 +7684,6 @@ class YouTubeDataAPIv3Tools:
                         widths.append(pitem["snippet"]["thumbnails"]["high"]["width"])
                     return widths
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8175,6 +7694,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_height(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8187,9 +7707,6 @@ class YouTubeDataAPIv3Tools:
                     height = response["items"][0]["snippet"]["thumbnails"]["high"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8200,6 +7717,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_high_res_thumbnail_heights(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8215,9 +7733,6 @@ class YouTubeDataAPIv3Tools:
                         heights.append(pitem["snippet"]["thumbnails"]["high"]["height"])
                     return heights
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8229,6 +7744,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM STANDARD RES THUMBNAIL //////
+        @_handle_http()
         def get_standard_res_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -8241,9 +7757,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]["standard"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8254,6 +7767,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_standard_res_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -8269,9 +7783,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"]["standard"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8282,6 +7793,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_url(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8294,9 +7806,6 @@ class YouTubeDataAPIv3Tools:
                     url = response["items"][0]["snippet"]["thumbnails"]["standard"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8307,6 +7816,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_standard_res_thumbnail_urls(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8322,9 +7832,6 @@ class YouTubeDataAPIv3Tools:
                         urls.append(pitem["snippet"]["thumbnails"]["standard"]["url"])
                     return urls
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8335,6 +7842,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_width(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8347,9 +7855,6 @@ class YouTubeDataAPIv3Tools:
                     width = response["items"][0]["snippet"]["thumbnails"]["standard"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8360,6 +7865,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_standard_res_thumbnail_widths(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8375,9 +7881,6 @@ class YouTubeDataAPIv3Tools:
                         widths.append(pitem["snippet"]["thumbnails"]["standard"]["width"])
                     return widths
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8388,6 +7891,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_height(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8400,9 +7904,6 @@ class YouTubeDataAPIv3Tools:
                     height = response["items"][0]["snippet"]["thumbnails"]["standard"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8413,6 +7914,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_standard_res_thumbnail_heights(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8428,9 +7930,6 @@ class YouTubeDataAPIv3Tools:
                         heights.append(pitem["snippet"]["thumbnails"]["standard"]["height"])
                     return heights
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8442,6 +7941,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM MAX RES THUMBNAIL //////
+        @_handle_http()
         def get_max_res_thumbnail(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -8454,9 +7954,6 @@ class YouTubeDataAPIv3Tools:
                     thumb = response["items"][0]["snippet"]["thumbnails"]["maxres"]
                     return thumb
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8467,6 +7964,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_max_res_thumbnails(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -8482,9 +7980,6 @@ class YouTubeDataAPIv3Tools:
                         thumbs.append(pitem["snippet"]["thumbnails"]["maxres"])
                     return thumbs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8495,6 +7990,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
                    
+        @_handle_http()
         def get_max_res_thumbnail_url(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8507,9 +8003,6 @@ class YouTubeDataAPIv3Tools:
                     url = response["items"][0]["snippet"]["thumbnails"]["maxres"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8520,6 +8013,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_max_res_thumbnail_urls(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8535,9 +8029,6 @@ class YouTubeDataAPIv3Tools:
                         urls.append(pitem["snippet"]["thumbnails"]["maxres"]["url"])
                     return urls
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8548,6 +8039,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
              
+        @_handle_http()
         def get_max_res_thumbnail_width(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8560,9 +8052,6 @@ class YouTubeDataAPIv3Tools:
                     width = response["items"][0]["snippet"]["thumbnails"]["maxres"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8573,6 +8062,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_max_res_thumbnail_widths(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8588,9 +8078,6 @@ class YouTubeDataAPIv3Tools:
                         widths.append(pitem["snippet"]["thumbnails"]["maxres"]["width"])
                     return widths
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8601,6 +8088,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_max_res_thumbnail_height(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8613,9 +8101,6 @@ class YouTubeDataAPIv3Tools:
                     height = response["items"][0]["snippet"]["thumbnails"]["maxres"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8626,6 +8111,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_max_res_thumbnail_heights(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8641,9 +8127,6 @@ class YouTubeDataAPIv3Tools:
                         heights.append(pitem["snippet"]["thumbnails"]["maxres"]["height"])
                     return heights
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8655,6 +8138,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM CHANNEL TITLE //////
+        @_handle_http()
         def get_channel_title(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8667,9 +8151,6 @@ class YouTubeDataAPIv3Tools:
                     title = response["items"][0]["snippet"]["channelTitle"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8680,6 +8161,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_channel_titles(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8695,9 +8177,6 @@ class YouTubeDataAPIv3Tools:
                         titles.append(pitem["snippet"]["channelTitle"])
                     return titles
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8709,6 +8188,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM VIDEO OWNER CHANNEL TITLE //////
+        @_handle_http()
         def get_owners_channel_title(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8721,9 +8201,6 @@ class YouTubeDataAPIv3Tools:
                     title = response["items"][0]["snippet"]["videoOwnerChannelTitle"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8734,6 +8211,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_owner_channel_titles(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8749,9 +8227,6 @@ class YouTubeDataAPIv3Tools:
                         titles.append(pitem["snippet"]["videoOwnerChannelTitle"])
                     return titles
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8763,6 +8238,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM VIDEO OWNER CHANNEL ID //////
+        @_handle_http()
         def get_owners_channel_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8775,9 +8251,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["snippet"]["videoOwnerChannelId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8788,6 +8261,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_owner_channel_ids(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8803,9 +8277,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["snippet"]["videoOwnerChannelId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8817,6 +8288,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM PLAYLIST ID //////
+        @_handle_http()
         def get_playlist_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8829,9 +8301,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["snippet"]["playlistId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8843,6 +8312,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM POSITION //////
+        @_handle_http()
         def get_position(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8855,9 +8325,6 @@ class YouTubeDataAPIv3Tools:
                     position = response["items"][0]["snippet"]["position"]
                     return int(position)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8868,6 +8335,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_positions(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8883,9 +8351,6 @@ class YouTubeDataAPIv3Tools:
                         positions.append(pitem["snippet"]["position"])
                     return positions
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8897,6 +8362,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// PLAYLIST ITEM RESOURCE ID //////
+        @_handle_http()
         def get_resource_id(self, item_id: str) -> (int | None):
             service = self.service
             try:
@@ -8909,9 +8375,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["snippet"]["resourceId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8922,6 +8385,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_resource_ids(self, playlist_id: str) -> (list[int] | None):
             service = self.service
             try:
@@ -8937,9 +8401,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["snippet"]["resourceId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -8951,6 +8412,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM RESOURCE ID KIND //////
+        @_handle_http()
         def get_resource_id_kind(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -8963,9 +8425,6 @@ class YouTubeDataAPIv3Tools:
                     kind = response["items"][0]["snippet"]["resourceId"]["kind"]
                     return kind
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -8976,6 +8435,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_resource_id_kinds(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -8991,9 +8451,6 @@ class YouTubeDataAPIv3Tools:
                         kinds.append(pitem["snippet"]["resourceId"]["kind"])
                     return kinds
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9005,6 +8462,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM RESOURCE VIDEO ID //////
+        @_handle_http()
         def get_resource_video_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9017,9 +8475,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["snippet"]["resourceId"]["videoId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9030,6 +8485,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_resource_video_ids(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9045,9 +8501,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["snippet"]["resourceId"]["videoId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9059,6 +8512,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM CONTENT DETAILS //////
+        @_handle_http()
         def get_content_details(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -9071,9 +8525,6 @@ class YouTubeDataAPIv3Tools:
                     details = response["items"][0]["contentDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9084,6 +8535,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_content_details(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -9099,9 +8551,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["contentDetails"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9113,6 +8562,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM VIDEO ID //////
+        @_handle_http()
         def get_video_id(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9125,9 +8575,6 @@ class YouTubeDataAPIv3Tools:
                     id = response["items"][0]["contentDetails"]["videoId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9138,6 +8585,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_video_ids(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9153,9 +8601,6 @@ class YouTubeDataAPIv3Tools:
                         ids.append(pitem["contentDetails"]["videoId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9167,6 +8612,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM START AT //////
+        @_handle_http()
         def get_start_at_time(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9179,9 +8625,6 @@ class YouTubeDataAPIv3Tools:
                     time = response["items"][0]["contentDetails"]["startAt"]
                     return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9192,6 +8635,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_start_at_times(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9207,9 +8651,6 @@ class YouTubeDataAPIv3Tools:
                         times.append(pitem["contentDetails"]["startAt"])
                     return times
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9221,6 +8662,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM END AT //////
+        @_handle_http()
         def get_end_at_time(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9233,9 +8675,6 @@ class YouTubeDataAPIv3Tools:
                     time = response["items"][0]["contentDetails"]["endAt"]
                     return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9246,6 +8685,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_end_at_times(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9261,9 +8701,6 @@ class YouTubeDataAPIv3Tools:
                         times.append(pitem["contentDetails"]["endAt"])
                     return times
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9275,6 +8712,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM _NOTE //////
+        @_handle_http()
         def get_note(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9287,9 +8725,6 @@ class YouTubeDataAPIv3Tools:
                     note = response["items"][0]["contentDetails"]["note"]
                     return note
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9300,6 +8735,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_notes(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9315,9 +8751,6 @@ class YouTubeDataAPIv3Tools:
                         notes.append(pitem["contentDetails"]["note"])
                     return notes
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9329,6 +8762,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM VIDEO PUBLISHED DATE //////
+        @_handle_http()
         def get_published_date(self, item_id: str) -> (str | None):
             service = self.service
             try:
@@ -9341,9 +8775,6 @@ class YouTubeDataAPIv3Tools:
                     date = response["items"][0]["contentDetails"]["videoPublishedAt"]
                     return date
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9354,6 +8785,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_published_dates(self, playlist_id: str) -> (list[str] | None):
             service = self.service
             try:
@@ -9369,9 +8801,6 @@ class YouTubeDataAPIv3Tools:
                         dates.append(pitem["contentDetails"]["videoPublishedAt"])
                     return dates
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9383,6 +8812,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM STATUS //////
+        @_handle_http()
         def get_status(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -9395,9 +8825,6 @@ class YouTubeDataAPIv3Tools:
                     status = response["items"][0]["status"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9408,6 +8835,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_statuses(self, playlist_id: str) -> (list[dict] | None):
             service = self.service
             try:
@@ -9423,9 +8851,6 @@ class YouTubeDataAPIv3Tools:
                         statuses.append(pitem["status"])
                     return statuses
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9437,6 +8862,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// PLAYLIST ITEM PRIVACY STATUS //////
+        @_handle_http()
         def get_privacy_status(self, item_id: str) -> (dict | None):
             service = self.service
             try:
@@ -9449,9 +8875,6 @@ class YouTubeDataAPIv3Tools:
                     status = response["items"][0]["status"]["privacyStatus"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlist items with the given ID.\n{ie}")
                 return None
@@ -9462,6 +8885,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_privacy_statuses(self, playlist_id: str) -> (list[dict] | None): 
             service = self.service
             try:
@@ -9477,9 +8901,6 @@ class YouTubeDataAPIv3Tools:
                         statuses.append(pitem["status"]["privacyStatus"])
                     return statuses
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -9494,9 +8915,117 @@ class YouTubeDataAPIv3Tools:
     class Video:
 
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
 
-        #////// UTILITY METHODS //////                    
+        #////// UTILITY METHODS //////
+        def _fetch_videos(self, video_ids: list[str], part: str=VIDEO_ALL_PARTS, region_code: str=None, fields: str=None, http: object=None, num_retries: int=0) -> dict:
+            """
+            Fetches the video resources for all of the given video IDs, packing up to 50 IDs 
+            into each videos().list call. Videos found in the metadata cache aren't 
+            requested again, and snippets are also kept in the disk cache for a day. If 
+            fields is given it is sent as a partial response mask so only those 
+            properties are returned. A single video is requested with a conditional GET
+            so an unchanged video isn't downloaded again. Pass http to send the requests
+            over a different http object than the service's own, e.g. one owned by a 
+            worker thread, and num_retries to retry rate limit and server errors with 
+            backoff. Returns a dictionary mapping each video ID to its video resource. 
+            IDs that don't belong to a video are left out.
+            """
+            videos = {}
+            missing = []
+            for video_id in video_ids:
+                key = ("video", video_id, part, region_code, fields)
+                video = metadata_cache.get(key)
+                if video is None and part == VIDEO_SNIPPET:
+                    video = disk_cache.get(key)
+                    if video is not None:
+                        metadata_cache.set(key, video)
+                if video is not None:
+                    videos[video_id] = video
+                else:
+                    missing.append(video_id)
+            ids = iter(missing)
+            chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            while chunk:
+                request = self.service.videos().list(
+                    part=part,
+                    id=",".join(chunk),
+                    regionCode=region_code,
+                    fields=fields
+                )
+                if len(chunk) == 1:
+                    key = ("video", chunk[0], part, region_code, fields)
+                    response = _etag_execute(request, key, http=http, num_retries=num_retries)
+                else:
+                    response = request.execute(http=http, num_retries=num_retries)
+                for item in response.get("items", []):
+                    key = ("video", item["id"], part, region_code, fields)
+                    videos[item["id"]] = item
+                    metadata_cache.set(key, item)
+                    if part == VIDEO_SNIPPET:
+                        disk_cache.set(key, item, VIDEO_SNIPPET_TTL)
+                chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            return videos
+
+        def _fetch_video(self, video_id: str, part: str=VIDEO_ALL_PARTS, region_code: str=None, fields: str=None) -> (dict | None):
+            """
+            Fetches a single video resource. Returns None if no video has the given ID.
+            """
+            return self._fetch_videos([video_id], part=part, region_code=region_code, fields=fields).get(video_id)
+
+        @_handle_http()
+        def get_videos_bulk(self, video_ids: list[str], part: str=VIDEO_ALL_PARTS, region_code: str="US", fields: str=None) -> (dict | None):
+            """
+            Returns a dictionary mapping each of the given video IDs to its video resource. 
+            The IDs are requested 50 at a time so N videos only cost N / 50 API calls. An
+            optional fields mask such as "items(id,snippet/title)" limits what is returned.
+            Returns None if unsuccessful.
+            """
+            try:
+                return self._fetch_videos(video_ids, part=part, region_code=region_code, fields=fields)
+            except TypeError as te:
+                print(f"Type error: You may have forgotten a required argument or passed the wrong type!\n{te}")
+                return None
+            except KeyError as ke:
+                print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
+                return None
+
+        @_handle_http()
+        def get_videos_bulk_parallel(self, video_ids: list[str], part: str=VIDEO_ALL_PARTS, region_code: str="US", fields: str=None, workers: int=8) -> (dict | None):
+            """
+            Same as get_videos_bulk() but the groups of 50 IDs are requested concurrently
+            by a pool of worker threads, each with its own connection. Rate limit and server
+            errors are retried with exponential backoff. Returns a dictionary mapping each 
+            video ID to its video resource if successful and None otherwise.
+            """
+            ids = iter(video_ids)
+            chunks = list(iter(lambda: list(itertools.islice(ids, MAX_IDS_PER_REQUEST)), []))
+
+            def fetch(chunk: list[str]) -> dict:
+                return self._fetch_videos(
+                    chunk, 
+                    part=part, 
+                    region_code=region_code, 
+                    fields=fields, 
+                    http=self.apitools_ref._get_thread_http(),
+                    num_retries=3
+                )
+
+            try:
+                videos = {}
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    for found in executor.map(fetch, chunks):
+                        videos.update(found)
+                return videos
+            except TypeError as te:
+                print(f"Type error: You may have forgotten a required argument or passed the wrong type!\n{te}")
+                return None
+            except KeyError as ke:
+                print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
+                return None
+
+        @_handle_http()
         def upload_video(self, video_path: str, title: str, description: str, privacy_status: str="public") -> (bool | None):
             """
             Uploads a video specified by video_path with the given details to YouTube. The 
@@ -9550,9 +9079,6 @@ class YouTubeDataAPIv3Tools:
             except OSError as e:
                 print(f"An OS error occurred: {e}")
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"IndexError:\n{e}")
                 return None
@@ -9568,19 +9094,9 @@ class YouTubeDataAPIv3Tools:
             Checks if the video specified by video_id exists or not.
             If so returns True otherwise returns False.
             """
-            try:
-                if self.get_video(video_id) is not None:
-                    return True
-                return False                    
-            except googleapiclient.errors.HttpError as e:
-                return False
-            except IndexError as e:
-                return False
-            except TypeError as te:
-                return False
-            except KeyError as ke:
-                return False
+            return self.get_video(video_id) is not None
                           
+        @_handle_http()
         def delete(self, video_id: str) -> (bool | None):
             """
             Deletes the video specified by video_id after checking that it exists.
@@ -9593,14 +9109,12 @@ class YouTubeDataAPIv3Tools:
                     service.videos().delete(
                         id=video_id
                     ).execute()
-
+                    metadata_cache.invalidate(video_id)
+                    disk_cache.invalidate(video_id)
                     return True
                 except OSError as e:
                     print(f"An OS error occurred: {e}")
                     None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as e:
                     print(f"IndexError:\n{e}")
                     return None
@@ -9612,6 +9126,7 @@ class YouTubeDataAPIv3Tools:
                     return None
             else: return None
 
+        @_handle_http()
         def like(self, video_id: str) -> (bool | None):
             """
             Positively rates the video specified by video_id and returns True. Returns
@@ -9626,9 +9141,6 @@ class YouTubeDataAPIv3Tools:
                     ).execute()
                     return True
 
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as e:
                     print(f"IndexError:\n{e}")
                     return None
@@ -9640,6 +9152,7 @@ class YouTubeDataAPIv3Tools:
                     return None
             else: return False
 
+        @_handle_http()
         def unlike(self, video_id: str) -> (bool | None):
             """
             Negatively rates the video specified by video_id and returns True. Returns
@@ -9653,9 +9166,6 @@ class YouTubeDataAPIv3Tools:
                         rating="none"
                     ).execute()
                     return True
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as e:
                     print(f"IndexError:\n{e}")
                     return None
@@ -9667,34 +9177,55 @@ class YouTubeDataAPIv3Tools:
                     return None
             else: return False
         
-        def update_privacy_status(self, video_id: str, privacy_status: str="public") -> (bool | None):
+        @_handle_http()
+        def update_video(self, video_id: str, *, title: str=None, description: str=None, tags: list[str]=None, privacy_status: str=None) -> (bool | None):
             """
-            Updates the privacy status of a video specified by video_id. The privacy_status 
-            can be set to "private," "public," or "unlisted." Returns None if no video
-            with he given ID exists.
+            Updates any combination of the title, description, tags and privacy status of
+            the video specified by video_id with a single read and a single write. Only 
+            the parts that actually change are sent and the update is made conditional on 
+            the ETag that was read so a concurrent edit isn't silently overwritten. Only 
+            arguments left as None are kept as they are, so description="" or tags=[] 
+            clears that field. Returns True if the update was successful and None otherwise.
             """
             service = self.service
             try:
                 video = service.videos().list(
-                    part="status",
-                    id=video_id
+                    part="snippet,status",
+                    id=video_id,
+                    fields="items(etag,snippet,status)"
                 ).execute()
-                if "items" in video:
-                    status = video["items"][0]["status"]
+                if not video.get("items"):
+                    return None
+                item = video["items"][0]
+                snippet = item["snippet"]
+                status = item["status"]
+                parts = []
+                if title is not None or description is not None or tags is not None:
+                    if title is not None:
+                        snippet["title"] = title
+                    if description is not None:
+                        snippet["description"] = description
+                    if tags is not None:
+                        snippet["tags"] = tags
+                    parts.append("snippet")
+                if privacy_status is not None:
                     status["privacyStatus"] = privacy_status
-                    
-                    service.videos().update(
-                        part="status",
-                        body={
-                            "id": video_id,
-                            "status": status
-                        }
-                    ).execute()
+                    parts.append("status")
+                if not parts:
                     return True
-                else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+
+                body = {"id": video_id}
+                for part in parts:
+                    body[part] = item[part]
+                request = service.videos().update(
+                    part=",".join(parts),
+                    body=body
+                )
+                request.headers["If-Match"] = item["etag"]
+                request.execute()
+                metadata_cache.invalidate(video_id)
+                disk_cache.invalidate(video_id)
+                return True
             except IndexError as e:
                 print(f"IndexError:\n{e}")
                 return None
@@ -9705,53 +9236,27 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        def update_privacy_status(self, video_id: str, privacy_status: str="public") -> (bool | None):
+            """
+            Updates the privacy status of a video specified by video_id. The privacy_status 
+            can be set to "private," "public," or "unlisted." Returns None if no video
+            with he given ID exists.
+            """
+            return self.update_video(video_id, privacy_status=privacy_status)
+
         def update_details(self, video_id: str, new_title: str=None, new_description: str=None, new_tags: list[str]=None) -> (bool | None):
             """
             Update the title, description and tags for a video specified by video_id.
             Returns True if the update was successful and None otherwise.
             """
-            service = self.service
-
-            try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id
-                ).execute()
-                if "items" in video:
-                    snippet = video["items"][0]["snippet"]
-                    if new_title:
-                        snippet["title"] = new_title
-                    if new_description:
-                        snippet["description"] = new_description
-                    if new_tags:
-                        snippet["tags"] = new_tags
-                    service.videos().update(
-                        part="snippet",
-                        body={
-                            "id": video_id,
-                            "snippet": snippet
-                        }
-                    ).execute()
-                    return True
-                else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
-            except IndexError as e:
-                print(f"IndexError:\n{e}")
-                return None
-            except TypeError as e:
-                print(f"Type error: You may have forgotten a required argument or passed the wrong type!\n{e}")
-                return None
-            except KeyError as e:
-                print(f"Key error: Bad key. Field doesn't exists!\n{e}")
-                return None
+            return self.update_video(video_id, title=new_title, description=new_description, tags=new_tags)
       
+        @_handle_http()
         def get_trending_videos(self, region_code: str="US", max_results: int=10) -> (list[dict] | None):
             service = self.service
             try:
                 request = service.videos().list(
-                    part="snippet",
+                    part=VIDEO_SNIPPET,
                     chart="mostPopular",
                     regionCode=region_code,
                     maxResults=max_results
@@ -9763,9 +9268,6 @@ class YouTubeDataAPIv3Tools:
                         trending.append(item)
                     return trending
                 else: return None 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"IndexError:\n{e}")
                 return None
@@ -9777,21 +9279,13 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// ENTIRE VIDEO RESOURCE //////
+        @_handle_http()
         def get_video(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    video_resource = video["items"][0]
-                    return video_resource
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    return video
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9802,24 +9296,16 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None 
             
+        @_handle_http()
         def get_videos_by_id(self, video_ids: list[str], region_code: str="US") -> (list[dict] | None):
-            service = self.service
-            videos = []
             try:
+                found = self._fetch_videos(video_ids, part=VIDEO_SNIPPET, region_code=region_code)
+                videos = []
                 for id in video_ids:
-                    video = service.videos().list(
-                        part="snippet",
-                        id=id,
-                        regionCode=region_code
-                    ).execute()
-                    if "items" in video:
-                        video_resource = video["items"][0]
-                        videos.append(video_resource)
-                    else: return None
+                    if id not in found:
+                        return None
+                    videos.append(found[id])
                 return videos
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9830,11 +9316,12 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
             
+        @_handle_http()
         def get_videos(self, max_results: int=10,  region_code: str="US") -> (list[dict] | None):
             service = self.service
             try:
                 request = service.videos().list(
-                    part="snippet",
+                    part=VIDEO_SNIPPET,
                     mine=True,
                     maxResults=max_results,
                     regionCode=region_code
@@ -9846,9 +9333,6 @@ class YouTubeDataAPIv3Tools:
                         videos.append(video)
                     return videos
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9860,21 +9344,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO KIND //////
+        @_handle_http()
         def get_kind_of_video(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    kind = video["items"][0]["kind"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    kind = video["kind"]
                     return kind
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9886,21 +9363,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO ETAG //////
+        @_handle_http()
         def get_etag(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    etag = video["items"][0]["etag"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    etag = video["etag"]
                     return etag
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9912,21 +9382,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO ID //////
+        @_handle_http()
         def get_id(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    id = video["items"][0]["id"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    id = video["id"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9938,22 +9401,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO SNIPPET PART //////
+        @_handle_http()
         def get_snippet(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
-
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    snippet = video["items"][0]["snippet"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    snippet = video["snippet"]
                     return snippet
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9965,21 +9420,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO PUBLISHED DATETIME //////
+        @_handle_http()
         def get_date_published(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    snippet = video["items"][0]["snippet"]["publishedAt"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_PUBLISHED_AT)
+                if video is not None:
+                    snippet = video["snippet"]["publishedAt"]
                     return snippet
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -9991,21 +9439,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    id = video["items"][0]["snippet"]["channelId"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    id = video["snippet"]["channelId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10017,21 +9458,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO TITLE //////
+        @_handle_http()
         def get_title(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    title = video["items"][0]["snippet"]["title"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_TITLE)
+                if video is not None:
+                    title = video["snippet"]["title"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10043,21 +9477,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO DESCRIPTION //////
+        @_handle_http()
         def get_description(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    description = video["items"][0]["snippet"]["description"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_DESCRIPTION)
+                if video is not None:
+                    description = video["snippet"]["description"]
                     return description
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10069,21 +9496,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO THUMBNAILS //////
+        @_handle_http()
         def get_thumbnails(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnails = video["items"][0]["snippet"]["thumbnails"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnails = video["snippet"]["thumbnails"]
                     return thumbnails
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10094,6 +9514,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
            
+        @_handle_http()
         def update_thumbnail_with_url(self, video_id: str, thumbnail_url: str) -> (bool | None):
             """
             Update the thumbnail of a video specified by video_id using a custom image URL
@@ -10102,7 +9523,7 @@ class YouTubeDataAPIv3Tools:
             service = self.service
             try:
                 service.videos().update(
-                    part="snippet",
+                    part=VIDEO_SNIPPET,
                     body={
                         "id": video_id,
                         "snippet": {
@@ -10114,10 +9535,9 @@ class YouTubeDataAPIv3Tools:
                         }
                     }
                 ).execute()
+                metadata_cache.invalidate(video_id)
+                disk_cache.invalidate(video_id)
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10128,22 +9548,26 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        #////// VIDEO THUMBNAIL URLS //////
+        def get_thumbnail_urls_fast(self, video_id: str) -> dict:
+            """
+            Returns a dictionary mapping each thumbnail resolution, e.g. "default" or 
+            "maxres", to its URL for the video specified by video_id. The URLs are built
+            from YouTube's fixed thumbnail URL scheme, so no API request is made and no 
+            quota is used. The standard and maxres thumbnails only exist for videos that
+            were uploaded in a high enough resolution.
+            """
+            return {size: THUMBNAIL_URL.format(video_id=video_id, name=name) for size, name in _THUMBNAIL_NAMES.items()}
+
         #////// VIDEO DEFAULT RES THUMBNAIL //////
+        @_handle_http()
         def get_default_res_thumbnail(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["default"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["default"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10154,21 +9578,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_default_res_thumbnail_url(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    url = video["items"][0]["snippet"]["thumbnails"]["default"]["url"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    url = video["snippet"]["thumbnails"]["default"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10179,21 +9596,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_default_res_thumbnail_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["snippet"]["thumbnails"]["default"]["width"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    width = video["snippet"]["thumbnails"]["default"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10204,21 +9614,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_default_res_thumbnail_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["snippet"]["thumbnails"]["default"]["height"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    height = video["snippet"]["thumbnails"]["default"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10230,21 +9633,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO MEDIUM RES THUMBNAIL //////
+        @_handle_http()
         def get_medium_res_thumbnail(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["medium"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["medium"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10255,21 +9651,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_medium_res_thumbnail_url(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    url = video["items"][0]["snippet"]["thumbnails"]["medium"]["url"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    url = video["snippet"]["thumbnails"]["medium"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10280,21 +9669,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_medium_res_thumbnail_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["snippet"]["thumbnails"]["medium"]["width"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    width = video["snippet"]["thumbnails"]["medium"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10305,21 +9687,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_medium_res_thumbnail_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["snippet"]["thumbnails"]["medium"]["height"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    height = video["snippet"]["thumbnails"]["medium"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10331,21 +9706,14 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// VIDEO HIGH RES THUMBNAIL //////
+        @_handle_http()
         def get_high_res_thumbnail(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["high"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["high"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10356,21 +9724,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_high_res_thumbnail_url(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    url = video["items"][0]["snippet"]["thumbnails"]["high"]["url"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    url = video["snippet"]["thumbnails"]["high"]["url"]
                     return url
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10381,21 +9742,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_high_res_thumbnail_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["snippet"]["thumbnails"]["high"]["width"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    width = video["snippet"]["thumbnails"]["high"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10406,21 +9760,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_high_res_thumbnail_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["snippet"]["thumbnails"]["high"]["height"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    height = video["snippet"]["thumbnails"]["high"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10432,21 +9779,14 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// VIDEO STANDARD RES THUMBNAIL //////
+        @_handle_http()
         def get_standard_res_thumbnail(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["standard"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["standard"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10457,21 +9797,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_standard_res_thumbnail_url(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["standard"]["url"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["standard"]["url"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10482,21 +9815,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_standard_res_thumbnail_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["snippet"]["thumbnails"]["standard"]["width"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    width = video["snippet"]["thumbnails"]["standard"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10507,21 +9833,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_standard_res_thumbnail_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["snippet"]["thumbnails"]["standard"]["height"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    height = video["snippet"]["thumbnails"]["standard"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10533,21 +9852,14 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// VIDEO MAX RES THUMBNAIL //////
+        @_handle_http()
         def get_max_res_thumbnail(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["maxres"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["maxres"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10558,21 +9870,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_max_res_thumbnail_url(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    thumbnail = video["items"][0]["snippet"]["thumbnails"]["maxres"]["url"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    thumbnail = video["snippet"]["thumbnails"]["maxres"]["url"]
                     return thumbnail
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10583,21 +9888,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
          
+        @_handle_http()
         def get_max_res_thumbnail_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["snippet"]["thumbnails"]["maxres"]["width"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    width = video["snippet"]["thumbnails"]["maxres"]["width"]
                     return int(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10608,21 +9906,14 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
           
+        @_handle_http()
         def get_max_res_thumbnail_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:    
-                    height = video["items"][0]["snippet"]["thumbnails"]["maxres"]["height"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    height = video["snippet"]["thumbnails"]["maxres"]["height"]
                     return int(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10634,21 +9925,14 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// VIDEO CHANNEL TITLE //////
+        @_handle_http()
         def get_channel_title(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    id = video["items"][0]["snippet"]["channelTitle"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_CHANNEL_TITLE)
+                if video is not None:
+                    id = video["snippet"]["channelTitle"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10660,21 +9944,14 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// VIDEO TAGS //////
+        @_handle_http()
         def get_tags(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    tags = video["items"][0]["snippet"]["tags"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_TAGS)
+                if video is not None:
+                    tags = video["snippet"]["tags"]
                     return tags
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10685,23 +9962,16 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def video_has_tag(self, video_id: str, tag: str, region_code: str="US") -> bool:
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    tags = video["items"][0]["snippet"]["tags"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_TAGS)
+                if video is not None:
+                    tags = video["snippet"]["tags"]
                     for item in range(len(tags)):
                         if tags[item] == tag:
                             return True
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10717,55 +9987,17 @@ class YouTubeDataAPIv3Tools:
             This method allows you to set the tags for a video with 
             the specified video_id. Provide a list of tags to update the video's tags.
             """
-            service = self.service
-
-            try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id
-                ).execute()
-                if "items" in video:
-                    snippet = video["items"][0]["snippet"]
-                    snippet["tags"] = tags
-                else: return None
-                service.videos().update(
-                    part="snippet",
-                    body={
-                        "id": video_id,
-                        "snippet": snippet
-                    }
-                ).execute()
-
-                return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
-            except IndexError as e:
-                print(f"IndexError:\n{e}")
-                return None
-            except TypeError as e:
-                print(f"Type error: You may have forgotten a required argument or passed the wrong type!\n{e}")
-                return None
-            except KeyError as e:
-                print(f"Key error: Bad key. Field doesn't exists!\n{e}")
-                return None
+            return self.update_video(video_id, tags=tags)
         
         #////// VIDEO CATEGORY ID //////
+        @_handle_http()
         def get_category_id(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    category_id = video["items"][0]["snippet"]["categoryId"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code, fields=_FIELDS_CATEGORY_ID)
+                if video is not None:
+                    category_id = video["snippet"]["categoryId"]
                     return category_id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10777,21 +10009,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE BROADCASTING CONTENT //////
+        @_handle_http()
         def get_live_broadcast_content(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    content = video["items"][0]["snippet"]["liveBroadcastContent"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    content = video["snippet"]["liveBroadcastContent"]
                     return content
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10803,21 +10028,14 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// VIDEO DEFAULT LANGUAGE //////
+        @_handle_http()
         def get_default_language(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    lang = video["items"][0]["snippet"]["defaultLanguage"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    lang = video["snippet"]["defaultLanguage"]
                     return lang
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10829,21 +10047,14 @@ class YouTubeDataAPIv3Tools:
                 return None   
         
         #////// VIDEO LOCALIZED DATA //////
+        @_handle_http()
         def get_localized_data(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    data = video["items"][0]["snippet"]["localized"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    data = video["snippet"]["localized"]
                     return data
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10855,21 +10066,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LOCALIZED TITLE //////
+        @_handle_http()
         def get_localized_title(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    title = video["items"][0]["snippet"]["localized"]["title"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    title = video["snippet"]["localized"]["title"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10881,21 +10085,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LOCALIZED DESCRIPTION //////
+        @_handle_http()
         def get_localized_description(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    desc = video["items"][0]["snippet"]["localized"]["description"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    desc = video["snippet"]["localized"]["description"]
                     return desc
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10907,21 +10104,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DEFAULT AUDIO LANGUAGE //////
+        @_handle_http()
         def get_default_audio_language(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="snippet",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    lang = video["items"][0]["snippet"]["defaultAudioLanguage"]
+                video = self._fetch_video(video_id, part=VIDEO_SNIPPET, region_code=region_code)
+                if video is not None:
+                    lang = video["snippet"]["defaultAudioLanguage"]
                     return lang
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10933,21 +10123,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO CONTENT DETAILS PART //////
+        @_handle_http()
         def get_content_details(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["contentDetails"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    details = video["contentDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10959,21 +10142,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DURATION //////
+        @_handle_http()
         def get_duration(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    duration = video["items"][0]["contentDetails"]["duration"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code, fields=_FIELDS_DURATION)
+                if video is not None:
+                    duration = video["contentDetails"]["duration"]
                     return duration
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -10985,21 +10161,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DIMENSION //////
+        @_handle_http()
         def get_dimension(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    dimension = video["items"][0]["contentDetails"]["dimension"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    dimension = video["contentDetails"]["dimension"]
                     return dimension
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11011,21 +10180,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DEFINITION //////
+        @_handle_http()
         def get_definition(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    definition = video["items"][0]["contentDetails"]["definition"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    definition = video["contentDetails"]["definition"]
                     return definition
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11037,21 +10199,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO CAPTION //////
+        @_handle_http()
         def get_caption(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    caption = video["items"][0]["contentDetails"]["caption"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    caption = video["contentDetails"]["caption"]
                     return caption
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11063,21 +10218,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LICENSED CONTENT //////
+        @_handle_http()
         def get_licensed_content(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    content = video["items"][0]["contentDetails"]["licensedContent"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    content = video["contentDetails"]["licensedContent"]
                     return bool(content)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11089,21 +10237,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO REGION RESTRICTION //////
+        @_handle_http()
         def get_region_restriction(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    restriction = video["items"][0]["contentDetails"]["regionRestriction"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    restriction = video["contentDetails"]["regionRestriction"]
                     return restriction
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11115,21 +10256,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO REGION RESTRICTION ALLOWED //////
+        @_handle_http()
         def is_allowed_in_region(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    allowed = video["items"][0]["contentDetails"]["regionRestriction"]["allowed"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    allowed = video["contentDetails"]["regionRestriction"]["allowed"]
                     return allowed
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11141,21 +10275,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO REGION RESTRICTION BLOCKED //////
+        @_handle_http()
         def is_blocked_in_region(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    blocked = video["items"][0]["contentDetails"]["regionRestriction"]["blocked"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    blocked = video["contentDetails"]["regionRestriction"]["blocked"]
                     return blocked
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11167,21 +10294,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO CONTENT RATING //////
+        @_handle_http()
         def get_content_rating(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    rating = video["items"][0]["contentDetails"]["contentRating"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    rating = video["contentDetails"]["contentRating"]
                     return rating
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11193,21 +10313,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROJECTION //////
+        @_handle_http()
         def get_projection(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    projection = video["items"][0]["contentDetails"]["projection"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    projection = video["contentDetails"]["projection"]
                     return projection
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11219,21 +10332,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO HAS CUSTOM THUMBNAIL //////
+        @_handle_http()
         def has_custom_thumbnail(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="contentDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    custom = video["items"][0]["contentDetails"]["hasCustomThumbnail"]
+                video = self._fetch_video(video_id, part="contentDetails", region_code=region_code)
+                if video is not None:
+                    custom = video["contentDetails"]["hasCustomThumbnail"]
                     return bool(custom)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11245,21 +10351,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STATUS PART //////
+        @_handle_http()
         def get_status(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    status = video["items"][0]["status"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    status = video["status"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11271,21 +10370,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO UPLOAD STATUS //////
+        @_handle_http()
         def get_upload_status(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    status = video["items"][0]["status"]["uploadStatus"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    status = video["status"]["uploadStatus"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11297,21 +10389,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FAILURE REASON //////
+        @_handle_http()
         def get_failure_reason(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    reason = video["items"][0]["status"]["failureReason"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    reason = video["status"]["failureReason"]
                     return reason
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11323,21 +10408,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO REJECTION REASON //////
+        @_handle_http()
         def get_rejection_reason(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    reason = video["items"][0]["status"]["rejectionReason"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    reason = video["status"]["rejectionReason"]
                     return reason
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11349,21 +10427,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PRIVACY STATUS //////
+        @_handle_http()
         def get_privacy_status(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    status = video["items"][0]["status"]["privacyStatus"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code, fields=_FIELDS_PRIVACY_STATUS)
+                if video is not None:
+                    status = video["status"]["privacyStatus"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11375,21 +10446,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PUBLISHED STATUS //////
+        @_handle_http()
         def get_publish_status(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    published = video["items"][0]["status"]["publishAt"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    published = video["status"]["publishAt"]
                     return published
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11401,21 +10465,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LICENSE //////
+        @_handle_http()
         def get_license(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    license = video["items"][0]["status"]["license"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    license = video["status"]["license"]
                     return license
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11427,21 +10484,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO EMBEDDABLE //////
+        @_handle_http()
         def is_embeddable(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    embeddable = video["items"][0]["status"]["embeddable"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    embeddable = video["status"]["embeddable"]
                     return bool(embeddable)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11453,21 +10503,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO PUBLIC STATS VIEWABLE //////
+        @_handle_http()
         def public_stats_viewable(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    viewable = video["items"][0]["status"]["publicStatsViewable"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    viewable = video["status"]["publicStatsViewable"]
                     return bool(viewable)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11479,21 +10522,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO MADE FOR KIDS //////
+        @_handle_http()
         def is_made_for_kids(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    for_kids = video["items"][0]["status"]["license"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    for_kids = video["status"]["license"]
                     return bool(for_kids)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11505,21 +10541,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO SELF DECLARED MADE FOR KIDS //////
+        @_handle_http()
         def self_declared_for_kids(self, video_id: str, region_code: str="US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="status",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    for_kids = video["items"][0]["status"]["license"]
+                video = self._fetch_video(video_id, part="status", region_code=region_code)
+                if video is not None:
+                    for_kids = video["status"]["license"]
                     return bool(for_kids)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11531,21 +10560,14 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// VIDEO STATISTICS PART //////
+        @_handle_http()
         def get_statistics(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    rating = video["items"][0]["statistics"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code)
+                if video is not None:
+                    rating = video["statistics"]
                     return rating
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11557,21 +10579,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO VIEW COUNT //////
+        @_handle_http()
         def get_view_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["statistics"]["viewCount"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code, fields=_FIELDS_STATS)
+                if video is not None:
+                    count = video["statistics"]["viewCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11583,21 +10598,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIKE COUNT //////
+        @_handle_http()
         def get_like_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["statistics"]["likeCount"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code, fields=_FIELDS_STATS)
+                if video is not None:
+                    count = video["statistics"]["likeCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11609,21 +10617,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DISLIKE COUNT //////
+        @_handle_http()
         def get_dislike_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["statistics"]["dislikeCount"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code, fields=_FIELDS_STATS)
+                if video is not None:
+                    count = video["statistics"]["dislikeCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11635,21 +10636,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FAVORITE COUNT //////
+        @_handle_http()
         def get_favorite_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["statistics"]["favoriteCount"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code, fields=_FIELDS_STATS)
+                if video is not None:
+                    count = video["statistics"]["favoriteCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11661,21 +10655,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO COMMENT COUNT //////
+        @_handle_http()
         def get_comment_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="statistics",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["statistics"]["commentCount"]
+                video = self._fetch_video(video_id, part=VIDEO_STATS, region_code=region_code, fields=_FIELDS_STATS)
+                if video is not None:
+                    count = video["statistics"]["commentCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11687,21 +10674,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PLAYER PART //////
+        @_handle_http()
         def get_player(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="player",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    player = video["items"][0]["player"]
+                video = self._fetch_video(video_id, part="player", region_code=region_code)
+                if video is not None:
+                    player = video["player"]
                     return player
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11713,21 +10693,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PLAYER EMBED HTML //////
+        @_handle_http()
         def get_embed_html(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="player",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    html = video["items"][0]["player"]["embedHtml"]
+                video = self._fetch_video(video_id, part="player", region_code=region_code)
+                if video is not None:
+                    html = video["player"]["embedHtml"]
                     return html
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11739,21 +10712,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PLAYER EMBED HEIGHT //////
+        @_handle_http()
         def get_embed_height(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="player",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["player"]["embedHeight"]
+                video = self._fetch_video(video_id, part="player", region_code=region_code)
+                if video is not None:
+                    height = video["player"]["embedHeight"]
                     return float(height)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11765,21 +10731,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PLAYER EMBED WIDTH //////
+        @_handle_http()
         def get_embed_width(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="player",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["player"]["embedWidth"]
+                video = self._fetch_video(video_id, part="player", region_code=region_code)
+                if video is not None:
+                    width = video["player"]["embedWidth"]
                     return float(width)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11791,21 +10750,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO TOPIC DETAILS PART //////
+        @_handle_http()
         def get_topic_details(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="topicDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["topicDetails"]
+                video = self._fetch_video(video_id, part="topicDetails", region_code=region_code)
+                if video is not None:
+                    details = video["topicDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11817,21 +10769,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO TOPIC IDS //////
+        @_handle_http()
         def get_topic_ids(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="topicDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    ids = video["items"][0]["topicDetails"]["topicIds"]
+                video = self._fetch_video(video_id, part="topicDetails", region_code=region_code)
+                if video is not None:
+                    ids = video["topicDetails"]["topicIds"]
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11843,21 +10788,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO RELEVANT TOPIC IDS //////
+        @_handle_http()
         def get_relevant_topic_ids(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="topicDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    ids = video["items"][0]["topicDetails"]["relevantTopicIds"]
+                video = self._fetch_video(video_id, part="topicDetails", region_code=region_code)
+                if video is not None:
+                    ids = video["topicDetails"]["relevantTopicIds"]
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11869,21 +10807,14 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// VIDEO TOPIC CATEGORIES //////
+        @_handle_http()
         def get_topic_categories(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="topicDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    cats = video["items"][0]["topicDetails"]["topicCategories"]
+                video = self._fetch_video(video_id, part="topicDetails", region_code=region_code)
+                if video is not None:
+                    cats = video["topicDetails"]["topicCategories"]
                     return cats
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11895,21 +10826,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO RECORDING DETAILS PART //////
+        @_handle_http()
         def get_recording_details(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="recordingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["recordingDetails"]
+                video = self._fetch_video(video_id, part="recordingDetails", region_code=region_code)
+                if video is not None:
+                    details = video["recordingDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11921,21 +10845,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO RECORDING DATE //////
+        @_handle_http()
         def get_recording_date(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="recordingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    date = video["items"][0]["recordingDetails"]["recordingDate"]
+                video = self._fetch_video(video_id, part="recordingDetails", region_code=region_code)
+                if video is not None:
+                    date = video["recordingDetails"]["recordingDate"]
                     return date
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11947,21 +10864,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FILE DETAILS PART //////
+        @_handle_http()
         def get_video_file_details(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["fileDetails"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    details = video["fileDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11973,21 +10883,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FILE NAME //////
+        @_handle_http()
         def get_video_file_name(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    name = video["items"][0]["fileDetails"]["fileName"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    name = video["fileDetails"]["fileName"]
                     return name
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -11999,21 +10902,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FILE SIZE //////
+        @_handle_http()
         def get_video_file_size(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    size = video["items"][0]["fileDetails"]["fileSize"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    size = video["fileDetails"]["fileSize"]
                     return size
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12025,21 +10921,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO FILE TYPE //////
+        @_handle_http()
         def get_video_file_type(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    type = video["items"][0]["fileDetails"]["fileType"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    type = video["fileDetails"]["fileType"]
                     return type
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12051,21 +10940,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO CONTAINER //////
+        @_handle_http()
         def get_container(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    container = video["items"][0]["fileDetails"]["container"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    container = video["fileDetails"]["container"]
                     return container
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12077,21 +10959,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS //////
+        @_handle_http()
         def get_streams(self, video_id: str, region_code: str="US") -> (list[dict] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    stream = video["items"][0]["fileDetails"]["videoStreams"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    stream = video["fileDetails"]["videoStreams"]
                     return stream
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12103,21 +10978,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS PIXEL WIDTH //////
+        @_handle_http()
         def get_streams_pixel_width(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    width = video["items"][0]["fileDetails"]["videoStreams"][0]["widthPixels"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    width = video["fileDetails"]["videoStreams"][0]["widthPixels"]
                     return width
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12129,21 +10997,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS PIXEL HEIGHT //////
+        @_handle_http()
         def get_streams_pixel_height(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    height = video["items"][0]["fileDetails"]["videoStreams"][0]["heightPixels"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    height = video["fileDetails"]["videoStreams"][0]["heightPixels"]
                     return height
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12155,21 +11016,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS FRAMERATE FPS //////
+        @_handle_http()
         def get_streams_framerate_fps(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    fps = video["items"][0]["fileDetails"]["videoStreams"][0]["frameRateFps"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    fps = video["fileDetails"]["videoStreams"][0]["frameRateFps"]
                     return fps
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12181,21 +11035,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS ASPECT RATIO //////
+        @_handle_http()
         def get_streams_aspect_ratio(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    ratio = video["items"][0]["fileDetails"]["videoStreams"][0]["aspectRatio"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    ratio = video["fileDetails"]["videoStreams"][0]["aspectRatio"]
                     return ratio
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12207,21 +11054,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS CODEC //////
+        @_handle_http()
         def get_streams_codec(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    codec = video["items"][0]["fileDetails"]["videoStreams"][0]["codec"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    codec = video["fileDetails"]["videoStreams"][0]["codec"]
                     return codec
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12233,21 +11073,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS BITRATE BPS //////
+        @_handle_http()
         def get_streams_bitrate_bps(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    bps = video["items"][0]["fileDetails"]["videoStreams"][0]["bitrateBps"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    bps = video["fileDetails"]["videoStreams"][0]["bitrateBps"]
                     return float(bps)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12259,21 +11092,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS ROTATION //////
+        @_handle_http()
         def get_streams_rotation(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    rotation = video["items"][0]["fileDetails"]["videoStreams"][0]["rotation"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    rotation = video["fileDetails"]["videoStreams"][0]["rotation"]
                     return rotation
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12285,21 +11111,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO STREAMS VENDOR //////
+        @_handle_http()
         def get_streams_vendor(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    vendor = video["items"][0]["fileDetails"]["videoStreams"][0]["vendor"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    vendor = video["fileDetails"]["videoStreams"][0]["vendor"]
                     return vendor
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12311,21 +11130,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// AUDIO STREAMS //////
+        @_handle_http()
         def get_audio_streams(self, video_id: str, region_code: str="US") -> (list[dict] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    stream = video["items"][0]["fileDetails"]["audioStreams"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    stream = video["fileDetails"]["audioStreams"]
                     return stream
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12337,21 +11149,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// AUDIO STREAMS CHANNEL COUNT //////
+        @_handle_http()
         def get_audio_streams_channel_count(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["fileDetails"]["audioStreams"][0]["channelCount"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    count = video["fileDetails"]["audioStreams"][0]["channelCount"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12363,21 +11168,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// AUDIO STREAMS CODEC //////
+        @_handle_http()
         def get_audio_streams_codec(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    codec = video["items"][0]["fileDetails"]["audioStreams"][0]["codec"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    codec = video["fileDetails"]["audioStreams"][0]["codec"]
                     return codec
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12389,21 +11187,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// AUDIO STREAMS BITRATE BPS //////
+        @_handle_http()
         def get_audio_streams_bitrate_bps(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    bps = video["items"][0]["fileDetails"]["audioStreams"][0]["bitrateBps"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    bps = video["fileDetails"]["audioStreams"][0]["bitrateBps"]
                     return float(bps)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12415,21 +11206,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// AUDIO STREAMS VENDOR //////
+        @_handle_http()
         def get_audio_streams_vendor(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    vendor = video["items"][0]["fileDetails"]["audioStreams"][0]["vendor"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    vendor = video["fileDetails"]["audioStreams"][0]["vendor"]
                     return vendor
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12441,21 +11225,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO DURATION MS //////
+        @_handle_http()
         def get_duration_ms(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    count = video["items"][0]["fileDetails"]["durationMs"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    count = video["fileDetails"]["durationMs"]
                     return int(count)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12467,21 +11244,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO BITRATE BPS //////
+        @_handle_http()
         def get_bitrate_bps(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    bps = video["items"][0]["fileDetails"]["bitrateBps"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    bps = video["fileDetails"]["bitrateBps"]
                     return int(bps)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12493,21 +11263,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO CREATION TIME //////
+        @_handle_http()
         def get_creation_time(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="fileDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    time = video["items"][0]["fileDetails"]["creationTime"]
+                video = self._fetch_video(video_id, part="fileDetails", region_code=region_code)
+                if video is not None:
+                    time = video["fileDetails"]["creationTime"]
                     return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12519,21 +11282,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING DETAILS PART //////
+        @_handle_http()
         def get_processing_deatils(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["processingDetails"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    details = video["processingDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12545,21 +11301,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING STATUS //////
+        @_handle_http()
         def get_processing_status(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    status = video["items"][0]["processingDetails"]["processingStatus"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    status = video["processingDetails"]["processingStatus"]
                     return status
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12571,21 +11320,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROGRESS //////
+        @_handle_http()
         def get_processing_progress(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    progress = video["items"][0]["processingDetails"]["processingProgress"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    progress = video["processingDetails"]["processingProgress"]
                     return progress
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12597,21 +11339,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROGRESS PARTS TOTAL //////
+        @_handle_http()
         def get_processing_progress_parts_total(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    parts_total = video["items"][0]["processingDetails"]["processingProgress"]["partsTotal"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    parts_total = video["processingDetails"]["processingProgress"]["partsTotal"]
                     return parts_total
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12623,21 +11358,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROGRESS PARTS PROCESSED //////
+        @_handle_http()
         def get_processing_progress_parts_processed(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    parts_processed = video["items"][0]["processingDetails"]["processingProgress"]["partsProcessed"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    parts_processed = video["processingDetails"]["processingProgress"]["partsProcessed"]
                     return parts_processed
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12649,21 +11377,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROGRESS TIME LEFT MS //////
+        @_handle_http()
         def get_processing_progress_time_left_ms(self, video_id: str, region_code: str="US") -> (float | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    time = video["items"][0]["processingDetails"]["processingProgress"]["timeLeftMs"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    time = video["processingDetails"]["processingProgress"]["timeLeftMs"]
                     return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12675,21 +11396,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROCESSING FAILURE REASON //////
+        @_handle_http()
         def get_processing_failure_reason(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    reason = video["items"][0]["processingDetails"]["processingFailureReason"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    reason = video["processingDetails"]["processingFailureReason"]
                     return reason
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12701,21 +11415,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING PROCESSING FILE DETAILS AVAILABILITY //////
+        @_handle_http()
         def get_processing_file_details_availability(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    availability = video["items"][0]["processingDetails"]["fileDetailsAvailability"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    availability = video["processingDetails"]["fileDetailsAvailability"]
                     return availability
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12727,21 +11434,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING ISSUES AVAILABILITY //////
+        @_handle_http()
         def get_processing_issues_availability(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    availability = video["items"][0]["processingDetails"]["processingIssuesAvailability"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    availability = video["processingDetails"]["processingIssuesAvailability"]
                     return availability
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12753,21 +11453,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING TAG SUGGESTIONS AVAILABILITY //////
+        @_handle_http()
         def get_processing_tag_suggestions_availability(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    availability = video["items"][0]["processingDetails"]["tagSuggestionsAvailability"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    availability = video["processingDetails"]["tagSuggestionsAvailability"]
                     return availability
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12779,21 +11472,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING EDITOR SUGGESTIONS AVAILABILITY //////
+        @_handle_http()
         def get_processing_editor_suggestions_availability(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    availability = video["items"][0]["processingDetails"]["editorSuggestionsAvailability"]
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    availability = video["processingDetails"]["editorSuggestionsAvailability"]
                     return availability
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12805,21 +11491,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO PROCESSING THUMBNAILS AVAILABILITY //////
+        @_handle_http()
         def get_processing_thumbnails_availability(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="processingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    availability = video["items"][0]["processingDetails"]["thumbnailsAvailability"]
-                    return availability 
+                video = self._fetch_video(video_id, part="processingDetails", region_code=region_code)
+                if video is not None:
+                    availability = video["processingDetails"]["thumbnailsAvailability"]
+                    return availability
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12831,21 +11510,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO SUGGESTIONS PART //////
+        @_handle_http()
         def get_suggestions(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    suggestions_part = video["items"][0]["suggestions"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    suggestions_part = video["suggestions"]
                     return suggestions_part
                 else: return None    
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12857,21 +11529,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO SUGGESTIONS PROCESSING ERRORS //////
+        @_handle_http()
         def get_suggestions_processing_errors(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    errors = video["items"][0]["suggestions"]["processingErrors"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    errors = video["suggestions"]["processingErrors"]
                     return errors
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12883,21 +11548,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO SUGGESTIONS PROCESSING WARNINGS //////
+        @_handle_http()
         def get_suggestions_processing_warnings(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    warns = video["items"][0]["suggestions"]["processingWarnings"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    warns = video["suggestions"]["processingWarnings"]
                     return warns
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12909,21 +11567,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO SUGGESTIONS PROCESSING HINTS //////
+        @_handle_http()
         def get_suggestions_processing_hints(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    hints = video["items"][0]["suggestions"]["processingHints"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    hints = video["suggestions"]["processingHints"]
                     return hints
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12935,21 +11586,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO TAG SUGGESTIONS //////
+        @_handle_http()
         def get_tag_suggestions(self, video_id: str, region_code: str="US") -> (list[dict] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    suggestions = video["items"][0]["suggestions"]["tagSuggestions"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    suggestions = video["suggestions"]["tagSuggestions"]
                     return suggestions
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12961,21 +11605,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO EDITOR SUGGESTIONS //////
+        @_handle_http()
         def get_editor_suggestions(self, video_id: str, region_code: str="US") -> (list[str] | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="suggestions",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    suggestions = video["items"][0]["suggestions"]["editorSuggestions"]
+                video = self._fetch_video(video_id, part="suggestions", region_code=region_code)
+                if video is not None:
+                    suggestions = video["suggestions"]["editorSuggestions"]
                     return suggestions
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -12987,21 +11624,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING DETAILS PART //////
+        @_handle_http()
         def get_live_streaming_details(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    details = video["items"][0]["liveStreamingDetails"]
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    details = video["liveStreamingDetails"]
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13013,21 +11643,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING ACTUAL START TIME //////
+        @_handle_http()
         def get_live_streaming_actual_start_time(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    time = video["items"][0]["liveStreamingDetails"]["actualStartTime"]
-                    return time 
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    time = video["liveStreamingDetails"]["actualStartTime"]
+                    return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13039,21 +11662,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING ACTUAL END TIME //////
+        @_handle_http()
         def get_live_streaming_actual_end_time(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    time = video["items"][0]["liveStreamingDetails"]["actualEndTime"]
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    time = video["liveStreamingDetails"]["actualEndTime"]
                     return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13065,22 +11681,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING SCHEDULED START TIME //////
+        @_handle_http()
         def get_live_streaming_scheduled_start_time(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
-
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    time = video["items"][0]["liveStreamingDetails"]["scheduledStartTime"]
-                    return time     
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    time = video["liveStreamingDetails"]["scheduledStartTime"]
+                    return time
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13092,21 +11700,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING CONCURRENT VIEWERS //////
+        @_handle_http()
         def get_live_streaming_concurrent_viewers(self, video_id: str, region_code: str="US") -> (int | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "itesm" in video:
-                    viewers = video["items"][0]["liveStreamingDetails"]["concurrentViewers"]
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    viewers = video["liveStreamingDetails"]["concurrentViewers"]
                     return viewers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13118,21 +11719,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LIVE STREAMING ACTIVE LIVE CHAT ID //////
+        @_handle_http()
         def get_live_streaming_active_live_chat_id(self, video_id: str, region_code: str="US") -> (str | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    id = video["items"][0]["liveStreamingDetails"]["activeLiveChatId"]
-                    return id 
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    id = video["liveStreamingDetails"]["activeLiveChatId"]
+                    return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13144,21 +11738,14 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// VIDEO LOCALIZATIONS PART //////
+        @_handle_http()
         def get_localizations(self, video_id: str, region_code: str="US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videos().list(
-                    part="liveStreamingDetails",
-                    id=video_id,
-                    regionCode=region_code
-                ).execute()
-                if "items" in video:
-                    local = video["items"][0]["localizations"]
-                    return local 
+                video = self._fetch_video(video_id, part="liveStreamingDetails", region_code=region_code)
+                if video is not None:
+                    local = video["localizations"]
+                    return local
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -13178,29 +11765,42 @@ class YouTubeDataAPIv3Tools:
         #   self.HL = hl
  
         #////// UTILITY METHODS //////
+        def _list_categories(self, **params) -> dict:
+            """
+            Executes a videoCategories().list call with the given parameters and keeps 
+            the response in the metadata cache for CATEGORY_TTL seconds, since categories 
+            almost never change. The API accepts only one of id and regionCode, so 
+            regionCode is dropped when an id is given.
+            """
+            if params.get("id") is not None:
+                params.pop("regionCode", None)
+            key = ("video_categories", json.dumps(params, sort_keys=True))
+            response = metadata_cache.get(key)
+            if response is None:
+                response = self.service.videoCategories().list(**params).execute()
+                metadata_cache.set(key, response, CATEGORY_TTL)
+            return response
+
+        @_handle_http()
         def get_all_categories(self, region_code: str="US", hl: str="en_US") -> (list[dict] | None):
             """
             This method retrieves all video categories available in a specific 
             region (identified by the regionCode). It prints information about 
             each category, including its ID and title.
             """
-            service = self.service
             try:
-                request = service.videoCategories().list(
+                response = self._list_categories(
                     part="snippet",
                     regionCode=region_code,
-                    hl=hl
+                    hl=hl,
+                    fields="items/snippet/title"
                 )
-                response = request.execute()
                 if "items" in response:
                     cats = []
                     for item in response["items"]:
                         cats.append(item["snippet"]["title"])
                     return cats    
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no categories.\n{ie}")
                 return None
@@ -13211,26 +11811,22 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_category_by_id(self, category_id: str, hl: str="en_US") -> (dict | None):
             """
             Retrieve the resoucre for the category specified by category_id. Returns
             None if unsuccessful.
             """
-            service = self.service
             try:
-                request = service.videoCategories().list(
+                response = self._list_categories(
                     part="snippet",
                     id=category_id,
                     hl=hl
                 )
-                response = request.execute()
                 if "items" in response:
                     category = response["items"][0]
                     return category
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no categories.\n{ie}")
                 return None
@@ -13241,19 +11837,39 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
+        def get_categories_by_ids(self, category_ids: list[str], hl: str="en_US") -> (dict | None):
+            """
+            Returns a dictionary mapping each of the given category IDs to its category 
+            resource. The IDs are looked up 50 per videoCategories().list call instead 
+            of one call per category. IDs that don't belong to a category are left out.
+            """
+            categories = {}
+            ids = iter(category_ids)
+            chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            while chunk:
+                response = self.service.videoCategories().list(
+                    part="snippet",
+                    id=",".join(chunk),
+                    hl=hl
+                ).execute()
+                for item in response.get("items", []):
+                    categories[item["id"]] = item
+                chunk = list(itertools.islice(ids, MAX_IDS_PER_REQUEST))
+            return categories
+
+        @_handle_http()
         def get_category_details(self, category_id: str) -> (list[str] | None):
             """
             Retrieves details about a specific video category identified by 
             its category_id, including its title and whether it's assignable to videos.
             Returns a list of details if successful and None otherwise.
             """
-            service = self.service
             try:
-                request = service.videoCategories().list(
+                response = self._list_categories(
                     part="snippet",
                     id=category_id
                 )
-                response = request.execute()
                 if "items" in response:
                     details = []
                     category = response["items"][0]
@@ -13262,9 +11878,6 @@ class YouTubeDataAPIv3Tools:
                     details.append(category["snippet"]["assignable"])
                     return details
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no categories.\n{ie}")
                 return None
@@ -13275,26 +11888,22 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
  
-        def get_video_categories(self, region_code="US", hl: str="en_US") -> (list[str] | None):
+        @_handle_http()
+        def get_video_categories(self, region_code="US", hl: str="en_US") -> (list[dict] | None):
             """
-            Returns a list of video categories for the give region if successful
-            and None otherwise.
+            Returns a list of the video categories for the given region as dictionaries 
+            holding each category's id and title if successful and None otherwise.
             """
-            service = self.service
             try:
-                request = service.videoCategories().list(
+                response = self._list_categories(
                     part="snippet",
                     regionCode=region_code,
-                    hl=hl
+                    hl=hl,
+                    fields="items(id,snippet/title)"
                 )
-                response = request.execute()
                 if "items" in response:
-                    for item in response["items"]:
-                        print(f"{item['id']} - {item['snippet']['title']}")
+                    return [{"id": item["id"], "title": item["snippet"]["title"]} for item in response["items"]]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no categories.\n{ie}")
                 return None
@@ -13306,22 +11915,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY RESOURCE //////
+        @_handle_http()
         def get_category(self, category_id: str, region_code="US", hl: str="en_US") -> (dict | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     resource = video["items"][0]
                     return resource
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13333,22 +11939,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY KIND //////
+        @_handle_http()
         def get_kind_of_category(self, category_id: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     kind = video["items"][0]["kind"]
                     return kind 
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13360,22 +11963,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY KIND //////
+        @_handle_http()
         def get_etag(self, category_id: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     etag = video["items"][0]["etag"]
                     return etag 
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13387,23 +11987,20 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY ID //////
+        @_handle_http()
         def get_id(self, category_name: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     for item in video["items"]:
                         if item["snippet"]["title"] == category_name:
                             id = item["id"]
                             return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13415,22 +12012,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY SNIPPET //////
+        @_handle_http()
         def get_snippet(self, category_id: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     snip = video["items"][0]["snippet"]
                     return snip
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13442,22 +12036,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, category_id: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     id = video["items"][0]["snippet"]["channelId"]
                     return id
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13469,22 +12060,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY CHANNEL TITLE //////
+        @_handle_http()
         def get_title(self, category_id: str, region_code="US", hl: str="en_US") -> (str | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     title = video["items"][0]["snippet"]["title"]
                     return title
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13496,22 +12084,19 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CATEGORY ASSIGNABLE //////
+        @_handle_http()
         def is_assignable(self, category_id: str, region_code="US", hl: str="en_US") -> (bool | None):
-            service = self.service
             try:
-                video = service.videoCategories().list(
+                video = self._list_categories(
                     part="snippet",
                     id=category_id,
                     regionCode=region_code,
                     hl=hl
-                ).execute()
+                )
                 if "items" in video:
                     assignable = video["items"][0]["snippet"]["assignable"]
                     return bool(assignable)
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no video categories with the given ID.\n{ie}")
                 return None
@@ -13525,23 +12110,41 @@ class YouTubeDataAPIv3Tools:
     #//////////// CAPTION ////////////
     class Captions:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
             
         #////// UTILITY METHODS //////
+        def _list_captions(self, video_id: str) -> dict:
+            """
+            Returns the captions().list response holding every caption track of the video
+            specified by video_id. The response is kept in the metadata cache until a 
+            track is uploaded, updated or deleted.
+            """
+            key = ("captions", video_id)
+            response = metadata_cache.get(key)
+            if response is None:
+                response = self.service.captions().list(part="snippet", videoId=video_id).execute()
+                metadata_cache.set(key, response)
+            return response
 
+        @_handle_http()
         def download_track(self, track_id: str, output_file: str) -> (bool | None):
+            """
+            Downloads the caption track specified by track_id to output_file. The track 
+            is downloaded in DOWNLOAD_CHUNK_SIZE chunks, each written to the file as it 
+            arrives, so the whole track is never held in memory.
+            """
             service = self.service
             try:
                 request = service.captions().download(
                     id=track_id
                 )
                 with open(output_file, "wb") as file:
-                    file.write(request.execute())
-                    file.close()
+                    downloader = googleapiclient.http.MediaIoBaseDownload(file, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+                    done = False
+                    while not done:
+                        _, done = downloader.next_chunk()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13552,6 +12155,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def upload_track(self, video_id: str, language: str, caption_file: str) -> (bool | None):
             service = self.service
             try:
@@ -13567,10 +12171,9 @@ class YouTubeDataAPIv3Tools:
                     },
                     media_body=googleapiclient.http.MediaFileUpload(caption_file, mimetype="text/vtt", resumable=True)
                 ).execute()
+                metadata_cache.invalidate(video_id)
+                disk_cache.invalidate(video_id)
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13581,16 +12184,16 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def delete_track(self, track_id: str) -> (bool | None):
             service = self.service
             try:
                 service.captions().delete(
                     id=track_id
                 ).execute()
+                metadata_cache.invalidate_kind("captions")
+                disk_cache.invalidate_kind("caption_tracks")
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13601,6 +12204,20 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
+        def delete_tracks(self, track_ids: list[str]) -> (dict | None):
+            """
+            Deletes every caption track in track_ids, sending up to 50 deletes per batch 
+            request over the client's kept-alive connection. Returns a dictionary mapping 
+            each track ID to True if it was deleted and False otherwise.
+            """
+            requests = {track_id: self.service.captions().delete(id=track_id) for track_id in track_ids}
+            results = self.apitools_ref._execute_batch(requests)
+            metadata_cache.invalidate_kind("captions")
+            disk_cache.invalidate_kind("caption_tracks")
+            return {track_id: not isinstance(response, Exception) for track_id, response in results.items()}
+
+        @_handle_http()
         def update_track(self, track_id: str, language: str, new_name: str) -> (bool | None):
             """
             Allows you to update the language and name of an existing caption track 
@@ -13618,10 +12235,9 @@ class YouTubeDataAPIv3Tools:
                         }
                     }
                 ).execute()
+                metadata_cache.invalidate_kind("captions")
+                disk_cache.invalidate_kind("caption_tracks")
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13632,6 +12248,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_upload_status(self, track_id: str) -> (str | None):
             """
             When you upload a new caption track, you can check the upload 
@@ -13658,9 +12275,6 @@ class YouTubeDataAPIv3Tools:
                     else:
                         return "processing"
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13672,23 +12286,16 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// ENTIRE CAPTION RESOURCE //////
+        @_handle_http()
         def get_all_caption_tracks(self, video_id: str) -> (list[dict] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     tracks = []
                     for item in response["items"]:
                         tracks.append(item)
                     return tracks
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13699,6 +12306,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_caption_track(self, caption_id: str, video_id: str=None) -> (dict | None):
             service = self.service
             try:
@@ -13711,9 +12319,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13725,23 +12330,16 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CAPTION TRACK KIND //////
+        @_handle_http()
         def get_all_track_kinds(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     kinds = []
                     for item in response["items"]:
                         kinds.append(item["kind"])
                     return kinds
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13752,6 +12350,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_kind_of_track(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -13764,9 +12363,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["kind"]
                 else: return None 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13778,23 +12374,16 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CAPTION TRACK ETAGS //////
+        @_handle_http()
         def get_all_caption_etags(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     etags = []
                     for item in response["items"]:
                         etags.append(item["etag"])
                     return etags
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13805,6 +12394,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_etag(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -13817,9 +12407,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["etag"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13831,23 +12418,16 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CAPTION TRACK IDS //////
+        @_handle_http()
         def get_all_track_ids(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     ids = []
                     for item in response["items"]:
                         ids.append(item["id"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13858,6 +12438,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_id(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -13870,9 +12451,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["id"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13884,23 +12462,16 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// CAPTION TRACK SNIPPETS //////
+        @_handle_http()
         def get_all_track_snippets(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     snippets = []
                     for item in response["items"]:
                         snippets.append(item["snippet"])
                     return snippets
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13911,6 +12482,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_snippet(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -13923,9 +12495,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13937,23 +12506,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION TRACK VIDEO IDS //////
+        @_handle_http()
         def get_all_video_ids(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     ids = []
                     for item in response["items"]:
                         ids.append(item["snippet"]["videoId"])
                     return ids
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13964,6 +12526,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_captions_video_id(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -13976,9 +12539,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["videoId"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -13990,23 +12550,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION TRACK LAST UPDATED //////
+        @_handle_http()
         def get_all_last_updates(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     dates = []
                     for item in response["items"]:
                         dates.append(item["snippet"]["lastUpdated"])
                     return dates
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14017,6 +12570,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_last_update(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -14029,9 +12583,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["lastUpdated"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14043,23 +12594,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION TRACK TRACK KIND //////
+        @_handle_http()
         def get_all_track_kinds(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     kinds = []
                     for item in response["items"]:
                         kinds.append(item["snippet"]["trackKind"])
                     return kinds
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14070,6 +12614,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_track_kind(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -14082,9 +12627,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["trackKind"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14096,23 +12638,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION TRACK LANGUAGE //////
+        @_handle_http()
         def get_all_track_languages(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     langs = []
                     for item in response["items"]:
                         langs.append(item["snippet"]["language"])
                     return langs
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14123,6 +12658,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_track_language(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -14135,9 +12671,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["language"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14149,23 +12682,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION TRACK NAME //////
+        @_handle_http()
         def get_all_track_names(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     names = []
                     for item in response["items"]:
                         names.append(item["snippet"]["name"])
                     return names
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14176,6 +12702,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_track_name(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -14188,9 +12715,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["name"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14202,23 +12726,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION AUDIO TRACK TYPE //////
+        @_handle_http()
         def get_all_audio_track_types(self, video_id: str) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     types = []
                     for item in response["items"]:
                         types.append(item["snippet"]["audioTrackType"])
                     return types
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14229,6 +12746,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_audio_track_type(self, caption_id: str, video_id: str=None) -> (str | None):
             service = self.service
             try:
@@ -14241,9 +12759,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return response["items"][0]["snippet"]["audioTrackType"]
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14255,14 +12770,10 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION IS CC //////
+        @_handle_http()
         def are_cc(self, video_id: str) -> (list[dict] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
@@ -14271,9 +12782,6 @@ class YouTubeDataAPIv3Tools:
                         answers.append(answer)
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14284,6 +12792,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def is_cc(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14296,9 +12805,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["isCC"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14310,14 +12816,10 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION IS LARGE //////
+        @_handle_http()
         def are_large(self, video_id: str) -> (dict | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
@@ -14327,9 +12829,6 @@ class YouTubeDataAPIv3Tools:
                         return answers
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14340,6 +12839,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def is_large(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14352,9 +12852,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["isLarge"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14366,14 +12863,10 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION IS EASY READER //////
+        @_handle_http()
         def are_easy_readers(self, video_id: str) -> (list[dict] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
@@ -14383,9 +12876,6 @@ class YouTubeDataAPIv3Tools:
                         return answers
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14396,6 +12886,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def is_easy_reader(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14408,9 +12899,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["isEasyReader"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14422,14 +12910,10 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION IS DRAFT //////
+        @_handle_http()
         def are_drafts(self, video_id: str) -> (list[bool] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
@@ -14439,9 +12923,6 @@ class YouTubeDataAPIv3Tools:
                         return answers
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14452,6 +12933,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def is_draft(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14464,9 +12946,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["isDraft"])
                 else: return None            
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14478,14 +12957,10 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION IS AUTO SYNCED //////
+        @_handle_http()
         def are_auto_synced(self, video_id: str) -> (dict | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
@@ -14494,9 +12969,6 @@ class YouTubeDataAPIv3Tools:
                         answers.append(answers)
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14507,6 +12979,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def is_auto_synced(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14519,9 +12992,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["isAutoSynced"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14533,23 +13003,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION STATUS //////
+        @_handle_http()
         def get_all_statuses(self, video_id: str) -> (list[bool] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
                         answers.append(bool(item["snippet"]["status"]))
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14560,6 +13023,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_status(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14572,9 +13036,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["status"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14586,23 +13047,16 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// CAPTION FAILURE REASON //////
+        @_handle_http()
         def get_all_failure_reasons(self, video_id: str) -> (list[bool] | None):
-            service = self.service
             try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=video_id
-                )
-                response = request.execute()
+                response = self._list_captions(video_id)
                 if "items" in response:
                     answers = []
                     for item in response["items"]:
                         answers.append(bool(item["snippet"]["failureReason"]))
                     return answers
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14613,6 +13067,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_failure_reason(self, caption_id: str, video_id: str=None) -> (bool | None):
             service = self.service
             try:
@@ -14625,9 +13080,6 @@ class YouTubeDataAPIv3Tools:
                 if "items" in response:
                     return bool(response["items"][0]["snippet"]["failureReason"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -14643,9 +13095,18 @@ class YouTubeDataAPIv3Tools:
     #//////////// SUBSCRIPTIONS ////////////
     class Subscriptions:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
+            # Maps the ID of each channel you are subscribed to onto the ID of the 
+            # subscription, so unsubscribing doesn't have to look it up first.
+            self._subscription_ids = {}
     
+        @_handle_http()
         def subscribe_to_channel(self, channel_id: str) -> (bool | None):
+            """
+            Subscribes you to the channel specified by channel_id and remembers the ID of
+            the new subscription for unsubscribe_from_channel().
+            """
             service = self.service
 
             try:
@@ -14661,12 +13122,10 @@ class YouTubeDataAPIv3Tools:
                     }
                 )
                 response = request.execute()
+                self._subscription_ids[channel_id] = response["id"]
 
                 return True
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14677,17 +13136,35 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def unsubscribe_from_channel(self, channel_id: str) -> (bool | None):
+            """
+            Unsubscribes you from the channel specified by channel_id. The subscription ID 
+            is taken from the IDs remembered by subscribe_to_channel() and 
+            iter_subscriptions() when possible, so only the delete call is made. Otherwise 
+            it is looked up first. Returns None if you aren't subscribed to the channel.
+            """
             service = self.service
             try:
+                subscription_id = self._subscription_ids.get(channel_id)
+                if subscription_id is None:
+                    response = service.subscriptions().list(
+                        part="id",
+                        mine=True,
+                        forChannelId=channel_id,
+                        maxResults=1,
+                        fields="items/id"
+                    ).execute()
+                    if not response.get("items"):
+                        print("You aren't subscribed to this channel.")
+                        return None
+                    subscription_id = response["items"][0]["id"]
                 request = service.subscriptions().delete(
-                    id=channel_id
+                    id=subscription_id
                 )
                 response = request.execute()
+                self._subscription_ids.pop(channel_id, None)
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14698,32 +13175,98 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
     
-        def iterate_subscriptions_in_channel(self, channel_id: str, func: object):
-            """
-            Iterate over the subscriptions in a channel.
-            """
-            service = self.service
-            try:
-                subscriptions = []
-
+        @_handle_http()
+        def subscribe_to_channels(self, channel_ids: list[str]) -> (dict | None):
+            """
+            Subscribes you to every channel in channel_ids, sending up to 50 subscriptions 
+            per batch request. Returns a dictionary mapping each channel ID to True if the 
+            subscription was made and False otherwise.
+            """
+            requests = {
+                channel_id: self.service.subscriptions().insert(
+                    part="snippet",
+                    body={"snippet": {"resourceId": {"kind": "youtube#channel", "channelId": channel_id}}}
+                )
+                for channel_id in channel_ids
+            }
+            results = {}
+            for channel_id, response in self.apitools_ref._execute_batch(requests).items():
+                results[channel_id] = isinstance(response, dict)
+                if results[channel_id]:
+                    self._subscription_ids[channel_id] = response["id"]
+            return results
+
+        @_handle_http()
+        def unsubscribe_from_channels(self, channel_ids: list[str]) -> (dict | None):
+            """
+            Unsubscribes you from every channel in channel_ids, sending up to 50 deletes per
+            batch request. If the subscription ID of any channel isn't known yet your 
+            subscriptions are walked once to find them. Returns a dictionary mapping each 
+            channel ID to True if you were unsubscribed and False otherwise.
+            """
+            if any(channel_id not in self._subscription_ids for channel_id in channel_ids):
+                collections.deque(self.iter_subscriptions(), maxlen=0)
+            results = {channel_id: False for channel_id in channel_ids if channel_id not in self._subscription_ids}
+            requests = {
+                channel_id: self.service.subscriptions().delete(id=self._subscription_ids[channel_id])
+                for channel_id in channel_ids if channel_id in self._subscription_ids
+            }
+            for channel_id, response in self.apitools_ref._execute_batch(requests).items():
+                results[channel_id] = not isinstance(response, Exception)
+                if results[channel_id]:
+                    self._subscription_ids.pop(channel_id, None)
+            return results
+
+        def iter_subscriptions(self, your_channel: bool=True, channel_id: str=None):
+            """
+            Yields every subscription resource of either your channel or the channel 
+            specified by channel_id, one page of 50 at a time. The next page is prefetched
+            while the current one is consumed, so at most two pages are held in memory,
+            and callers that stop early skip every page after that. The subscription IDs
+            of your own channel are remembered for unsubscribe_from_channel(). API errors
+            are raised to the caller while iterating.
+            """
+            service = self.service
+            if not your_channel:
                 request = service.subscriptions().list(
                     part="snippet",
                     channelId=channel_id,
                     maxResults=50
                 )
-                while request is not None:
-                    response = request.execute()
+            else:
+                request = service.subscriptions().list(
+                    part="snippet",
+                    mine=True,
+                    maxResults=50
+                )
+            for response in self.apitools_ref._prefetch_pages(service.subscriptions(), request):
+                items = response.get("items", [])
+                if your_channel:
+                    for item in items:
+                        self._subscription_ids[_CHANNEL_ID(_RESOURCE_ID(_SNIPPET(item)))] = item["id"]
+                yield from items
 
-                    for item in response["items"]:
-                        func(item)
+        def iter_subscribed_channels(self):
+            """
+            Yields the title and ID of every channel you are subscribed to as a dictionary.
+            API errors are raised to the caller while iterating.
+            """
+            for snippet in map(_SNIPPET, self.iter_subscriptions()):
+                yield {"title": _TITLE(snippet), "id": _CHANNEL_ID(_RESOURCE_ID(snippet))}
+
+        @_handle_http()
+        def iterate_subscriptions_in_channel(self, channel_id: str, func: object):
+            """
+            Iterate over the subscriptions in a channel.
+            """
+            try:
+                subscriptions = []
 
-                    request = service.subscriptions().list_next(request, response)
+                for item in self.iter_subscriptions(False, channel_id):
+                    func(item)
 
                 return subscriptions
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14734,6 +13277,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_latest_subscriptions(self, max_results=10) -> (dict | None):
             service = self.service
             try:
@@ -14745,18 +13289,12 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
 
-                subscriptions = []
-                for subscription in response["items"]:
-                    channel_title = subscription["snippet"]["title"]
-                    channel_id = subscription["snippet"]["resourceId"]["channelId"]
-                    sub = {}
-                    sub["title"] = channel_title
-                    sub["id"] = channel_id
-                    subscriptions.append(sub)
+                snippets = map(_SNIPPET, response["items"])
+                subscriptions = [
+                    {"title": _TITLE(snippet), "id": _CHANNEL_ID(_RESOURCE_ID(snippet))}
+                    for snippet in snippets
+                ]
                 return subscriptions
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14767,6 +13305,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_subscribed_channels(self, max_results: int=10) -> (dict | None):
             service = self.service
             try:
@@ -14784,9 +13323,6 @@ class YouTubeDataAPIv3Tools:
                     subscribed["id"] = channel_id
                 return subscribed
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14797,25 +13333,38 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
+        def get_all_subscribed_channels(self) -> (list[dict] | None):
+            """
+            Returns the title and ID of every channel you are subscribed to as a list of
+            dictionaries. All pages of results are walked and each next page is fetched
+            while the current one is being read. Returns None if unsuccessful.
+            """
+            try:
+                return list(self.iter_subscribed_channels())
+            except TypeError as te:
+                print(f"Type error: You may have forgotten a required argument or passed the wrong type!\n{te}")
+                return None
+            except KeyError as ke:
+                print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
+                return None
+
+        @_handle_http(False)
         def is_subscribed_to_channel(self, channel_id: str) -> (bool | None):
             service = self.service
 
             try:
                 request = service.subscriptions().list(
-                    part="snippet",
+                    part="id",
                     mine=True,
-                    forChannelId=channel_id
+                    forChannelId=channel_id,
+                    maxResults=1,
+                    fields="items/id"
                 )
                 response = request.execute()
 
-                if "items" in response and len(response["items"]) > 0:
-                    return True
-                else:
-                    return False
+                return bool(response.get("items"))
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14826,6 +13375,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def get_my_subs_count(self) -> (int | None):
             service = self.service
 
@@ -14839,9 +13389,6 @@ class YouTubeDataAPIv3Tools:
                 subscription_count = response.get("pageInfo", {}).get("totalResults", 0)
                 return int(subscription_count)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14853,6 +13400,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// ENTIRE SUBSCRIPTION RESOURCE //////
+        @_handle_http()
         def get_all_subscriptions(self, your_channel: bool=True, channel_id: str=None) -> (list[dict] | None):
             service = self.service
             response = None
@@ -14878,9 +13426,6 @@ class YouTubeDataAPIv3Tools:
                     return subscriptions
                 else: return None
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14891,6 +13436,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_subscription_by_index(self, channel_id: str=None, index: int=0) -> (dict | None):
             service = self.service
             try:
@@ -14904,9 +13450,6 @@ class YouTubeDataAPIv3Tools:
                     subscription_info = response["items"][index]
                     return subscription_info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14917,6 +13460,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_subscription(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -14932,9 +13476,6 @@ class YouTubeDataAPIv3Tools:
                 subscription = response["items"][0]
                 return subscription
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -14946,6 +13487,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION KIND //////
+        @_handle_http()
         def get_kind_of_subscription(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
             try:
@@ -14960,9 +13502,6 @@ class YouTubeDataAPIv3Tools:
                     subscription = response["items"][0]["kind"]
                     return subscription
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -14973,6 +13512,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_kinds(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -14996,9 +13536,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["kind"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15010,6 +13547,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION ETAG //////
+        @_handle_http()
         def get_etag(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15025,9 +13563,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["etag"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15038,6 +13573,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_etags(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15061,9 +13597,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["etag"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15075,6 +13608,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION ID //////
+        @_handle_http()
         def get_id(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15090,9 +13624,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["id"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15103,6 +13634,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15126,9 +13658,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["id"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15140,6 +13669,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION SNIPPET //////
+        @_handle_http()
         def get_snippet(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15155,9 +13685,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15168,6 +13695,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_snippets(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15191,9 +13719,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15205,6 +13730,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION PUBLISH DATE //////
+        @_handle_http()
         def get_date_published(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15220,9 +13746,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["publishedAt"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15233,6 +13756,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_publish_dates(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15256,9 +13780,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["publishedAt"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15270,6 +13791,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION CHANNEL TITLE //////
+        @_handle_http()
         def get_channel_title(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15285,9 +13807,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["channelTitle"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15298,6 +13817,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_channel_titles(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15321,9 +13841,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["channelTitle"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15335,6 +13852,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION TITLE //////
+        @_handle_http()
         def get_title(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15350,9 +13868,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["title"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15363,6 +13878,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_titles(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15387,9 +13903,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["title"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15401,6 +13914,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION DESCRIPTION //////
+        @_handle_http()
         def get_description(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15416,9 +13930,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["description"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15429,6 +13940,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_descriptions(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15452,9 +13964,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["description"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15466,6 +13975,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION RESOURCE ID //////
+        @_handle_http()
         def get_resource_id(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15481,9 +13991,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["resourceId"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15494,6 +14001,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_resource_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15517,9 +14025,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["resourceId"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15531,6 +14036,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION RESOURCE ID KIND //////
+        @_handle_http()
         def get_resource_id_kind(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15546,9 +14052,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["resourceId"]["kind"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15559,6 +14062,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_resource_id_kinds(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15575,9 +14079,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["resourceId"]["kind"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15589,6 +14090,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION RESOURCE ID CHANNEL ID //////
+        @_handle_http()
         def get_resource_channel_id(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15604,9 +14106,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["resourceId"]["channelId"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15617,6 +14116,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_resource_channel_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15633,9 +14133,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["resourceId"]["channelIds"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15647,6 +14144,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION CHANNEL ID //////
+        @_handle_http()
         def get_channel_id(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15662,9 +14160,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["channelId"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15675,25 +14170,16 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_channel_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
-            service = self.service
-            response = None
+            """
+            Returns the channel IDs of every subscription of either your channel or the 
+            channel specified by channel_id. All pages of results are walked and each next
+            page is fetched while the current one is being read.
+            """
             try:
-                request = service.subscriptions().list(
-                    part="snippet",
-                    mine=True
-                )
-                response = request.execute()
-                if "items" in response:
-                    info = []
-                    subscription_info = response["items"]
-                    for sub in subscription_info:
-                        info.append(sub["snippet"]["channelId"])
-                    return info
-                else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                info = list(map(_CHANNEL_ID, map(_SNIPPET, self.iter_subscriptions(your_channel, channel_id))))
+                return info
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15705,6 +14191,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// SUBSCRIPTION THUMBNAIL //////
+        @_handle_http()
         def get_thumbnail(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15720,9 +14207,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["snippet"]["thumbnail"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15733,6 +14217,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_thumbnails(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15749,9 +14234,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["snippet"]["thumbnail"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15763,6 +14245,7 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// SUBSCRIPTION CONTENT DETAILS //////
+        @_handle_http()
         def get_content_details(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -15778,9 +14261,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["contentDetails"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15791,6 +14271,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_content_details(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -15807,9 +14288,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(sub["contentDetails"])
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15821,6 +14299,7 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// SUBSCRIPTION TOTAL ITEM COUNT //////
+        @_handle_http()
         def get_total_item_count(self, sub_id: str, channel_id: str=None) -> (int | None):
             service = self.service
 
@@ -15836,9 +14315,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["contentDetails"]["totalItemCount"]
                 return int(info)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15849,6 +14325,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_total_item_counts(self, your_channel: bool=True, channel_id: str=None) -> (list[int] | None):
             service = self.service
             response = None
@@ -15865,9 +14342,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["contentDetails"]["totalItemCount"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15879,6 +14353,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION NEW ITEM COUNT //////
+        @_handle_http()
         def get_new_item_count(self, sub_id: str, channel_id: str=None) -> (int | None):
             service = self.service
 
@@ -15894,9 +14369,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["contentDetails"]["newItemCount"]
                 return int(info)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15907,6 +14379,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_new_item_counts(self, your_channel: bool=True, channel_id: str=None) -> (list[int] | None):
             service = self.service
             response = None
@@ -15923,9 +14396,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["contentDetails"]["newItemCount"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15937,6 +14407,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION ACTIVITY TYPE //////
+        @_handle_http()
         def get_activity_type(self, sub_id: str, channel_id: str=None) -> (str | None):
             service = self.service
 
@@ -15952,9 +14423,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["contentDetails"]["activityType"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -15965,6 +14433,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscription_activity_types(self, your_channel: bool=True, channel_id: str=None) -> (list[int] | None):
             service = self.service
             response = None
@@ -15981,9 +14450,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["contentDetails"]["newItemCount"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -15995,6 +14461,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION SUBSCRIBER SNIPPET //////
+        @_handle_http()
         def get_subscriber_snippet(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -16010,9 +14477,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["subscriberSnippet"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -16023,6 +14487,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscriber_snippets(self, your_channel: bool=True, channel_id: str=None) -> (list[dict] | None):
             service = self.service
             response = None
@@ -16039,9 +14504,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["subscriberSnippet"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16053,6 +14515,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION SUBSCRIBER TITLE //////
+        @_handle_http()
         def get_subscriber_title(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -16068,9 +14531,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["subscriberSnippet"]["title"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -16081,6 +14541,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscriber_titles(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -16097,9 +14558,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["subscriberSnippet"]["title"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16111,6 +14569,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION SUBSCRIBER DESCRIPTION //////
+        @_handle_http()
         def get_subscriber_description(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -16126,9 +14585,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["subscriberSnippet"]["description"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -16139,6 +14595,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscriber_descriptions(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -16155,9 +14612,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["subscriberSnippet"]["description"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16169,6 +14623,7 @@ class YouTubeDataAPIv3Tools:
                 return None
           
         #////// SUBSCRIPTION SUBSCRIBER CHANNEL ID //////
+        @_handle_http()
         def get_subscriber_channel_id(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -16184,9 +14639,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["subscriberSnippet"]["channelId"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -16197,6 +14649,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscriber_channel_ids(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -16213,9 +14666,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["subscriberSnippet"]["channelId"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16227,6 +14677,7 @@ class YouTubeDataAPIv3Tools:
                 return None
          
         #////// SUBSCRIPTION SUBSCRIBER THUMBNAILS //////
+        @_handle_http()
         def get_subscriber_thumbnails(self, sub_id: str, channel_id: str=None) -> (dict | None):
             service = self.service
 
@@ -16242,9 +14693,6 @@ class YouTubeDataAPIv3Tools:
                 info = response["items"][0]["subscriberSnippet"]["thumbnails"]
                 return info
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no subscriptions with the given ID.\n{ie}")
                 return None
@@ -16255,6 +14703,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
+        @_handle_http()
         def get_all_subscriber_thumbnails(self, your_channel: bool=True, channel_id: str=None) -> (list[str] | None):
             service = self.service
             response = None
@@ -16271,9 +14720,6 @@ class YouTubeDataAPIv3Tools:
                         info.append(int(sub["subscriberSnippet"]["thumbnails"]))
                     return info
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16295,6 +14741,7 @@ class YouTubeDataAPIv3Tools:
             self.service = ytd_api_tools.service
         
         #////// ENTIRE MEMBERSHIPS LEVEL RESOURCE //////
+        @_handle_http()
         def get_memberships_level(self, channel_id: str, membership_level_id: str) -> (dict | None):
             try:
                 request = self.service.members().list(
@@ -16308,9 +14755,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16322,6 +14766,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// MEMBERSHIPS LEVEL KIND //////
+        @_handle_http()
         def get_memberships_level_kind(self, channel_id: str, membership_level_id: str) -> (str | None):
             try:
                 request = self.service.members().list(
@@ -16335,9 +14780,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["kind"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16349,6 +14791,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// MEMBERSHIPS LEVEL ETAG //////
+        @_handle_http()
         def get_memberships_level_etag(self, channel_id: str, membership_level_id: str) -> (str | None):
             try:
                 request = self.service.members().list(
@@ -16362,9 +14805,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["etag"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16376,6 +14816,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// MEMBERSHIPS LEVEL ID //////
+        @_handle_http()
         def get_memberships_level_id(self, channel_id: str, membership_level_id: str) -> (str | None):
             try:
                 request = self.service.members().list(
@@ -16389,9 +14830,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["id"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16403,6 +14841,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// MEMBERSHIPS LEVEL SNIPPET //////    
+        @_handle_http()
         def get_memberships_level_snippet(self, channel_id: str, membership_level_id: str) -> (dict | None):
             try:
                 request = self.service.members().list(
@@ -16416,9 +14855,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["snippet"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16430,6 +14866,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// MEMBERSHIPS LEVEL CREATOR CHANNEL ID //////    
+        @_handle_http()
         def get_memberships_level_creator_channel_id(self, channel_id: str, membership_level_id: str) -> (str | None):
             try:
                 request = self.service.members().list(
@@ -16443,9 +14880,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["snippet"]["creatorChannelId"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16457,6 +14891,7 @@ class YouTubeDataAPIv3Tools:
                 return None
     
         #////// MEMBERSHIPS LEVEL DETAILS //////    
+        @_handle_http()
         def get_memberships_level_details(self, channel_id: str, membership_level_id: str) -> (str | None):
             try:
                 request = self.service.members().list(
@@ -16470,9 +14905,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["snippet"]["levelDetails"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16484,6 +14916,7 @@ class YouTubeDataAPIv3Tools:
                 return None
 
         #////// MEMBERSHIPS LEVEL DISPLAY NAME //////    
+        @_handle_http()
         def get_memberships_level_display_name(self, channel_id: str, membership_level_id: str):
             try:
                 request = self.service.members().list(
@@ -16497,9 +14930,6 @@ class YouTubeDataAPIv3Tools:
                     return response["items"][0]["snippet"]["displayName"]
                 else:
                     return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -16513,25 +14943,32 @@ class YouTubeDataAPIv3Tools:
     #//////////// COMMENT ////////////
     class Comment:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
         
         #////// UTILITY METHODS //////
-        def get_comment_replies(self, comment_id: str, max_results: int=10) -> (list[dict] | None):
+        def iter_comment_replies(self, comment_id: str, limit: int=None):
+            """
+            Yields the replies to the comment specified by comment_id, walking through 
+            the pages of up to 100 replies as they are consumed. Stops after limit 
+            replies if limit is given. API errors are raised to the caller while iterating.
+            """
             service = self.service
+            request = service.comments().list(
+                part="snippet",
+                parentId=comment_id,
+                maxResults=min(limit or 100, 100)
+            )
+            yield from self.apitools_ref._paginate(service.comments(), request, limit)
+
+        @_handle_http()
+        def get_comment_replies(self, comment_id: str, max_results: int=10) -> (list[dict] | None):
+            """
+            Returns up to max_results replies to the comment specified by comment_id. 
+            More than one page is fetched if needed.
+            """
             try:
-                request = service.comments().list(
-                    part="snippet",
-                    parentId=comment_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                replies = []
-                for item in response["items"]:
-                    replies.append(item)
-                return replies
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                return list(self.iter_comment_replies(comment_id, max_results))
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -16542,22 +14979,10 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def get_comment_replies_text(self, comment_id: str, max_results: int=10) -> (list[str] | None):
-            service = self.service
             try:
-                request = service.comments().list(
-                    part="snippet",
-                    parentId=comment_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                replies = []
-                for item in response["items"]:
-                    replies.append(item["snippet"]["textDisplay"])
-                return replies
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
+                return [item["snippet"]["textDisplay"] for item in self.iter_comment_replies(comment_id, max_results)]
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -16568,6 +14993,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def reply_to_comment(self, parent_comment_id: str, reply_text: str) -> (bool | None):
             service = self.service
             try:
@@ -16585,9 +15011,6 @@ class YouTubeDataAPIv3Tools:
             except OSError as e:
                 print(f"An OS error occurred: {e}")
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -16598,7 +15021,36 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
+        @_handle_http()
+        def reply_to_comments(self, replies: list[tuple[str, str]]) -> (list[bool] | None):
+            """
+            Posts every (parent_comment_id, reply_text) pair in replies, sending up to 50 
+            replies per batch request. Returns a list holding True for each reply that was 
+            posted and False for each one that failed, in the same order as replies.
+            """
+            requests = {
+                str(index): self.service.comments().insert(
+                    part="snippet",
+                    body={"snippet": {"parentId": parent_comment_id, "textOriginal": reply_text}}
+                )
+                for index, (parent_comment_id, reply_text) in enumerate(replies)
+            }
+            results = self.apitools_ref._execute_batch(requests)
+            return [isinstance(results.get(str(index)), dict) for index in range(len(replies))]
+
+        @_handle_http()
+        def delete_comments(self, comment_ids: list[str]) -> (dict | None):
+            """
+            Deletes every comment in comment_ids, sending up to 50 deletes per batch 
+            request. Returns a dictionary mapping each comment ID to True if it was 
+            deleted and False otherwise.
+            """
+            requests = {comment_id: self.service.comments().delete(id=comment_id) for comment_id in comment_ids}
+            results = self.apitools_ref._execute_batch(requests)
+            return {comment_id: not isinstance(response, Exception) for comment_id, response in results.items()}
+        
         #////// ENTIRE COMMENT RESOURCE //////
+        @_handle_http()
         def get_comment(self, comment_id) -> (dict | None):
             service = self.service
             try:
@@ -16609,9 +15061,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 
                 return response["items"][0]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16622,6 +15071,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
     
+        @_handle_http()
         def edit_comment(self, comment_id: str, updated_text: str) -> (bool | None):
             service = self.service
             try:
@@ -16639,9 +15089,6 @@ class YouTubeDataAPIv3Tools:
             except OSError as e:
                 print(f"An OS error occurred: {e}")
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -16652,6 +15099,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
+        @_handle_http()
         def delete_comment(self, comment_id: str) -> (bool | None): 
             service = self.service
             try:
@@ -16663,9 +15111,6 @@ class YouTubeDataAPIv3Tools:
             except OSError as e:
                 print(f"An OS error occurred: {e}")
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -16677,6 +15122,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT KIND //////
+        @_handle_http()
         def get_comment_kind(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16687,9 +15133,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 
                 return response["items"][0]["kind"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16701,6 +15144,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT ETAG //////
+        @_handle_http()
         def get_comment_etag(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16711,9 +15155,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 
                 return response["items"][0]["etag"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16725,25 +15166,23 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT ID //////
+        @_handle_http([])
         def get_comment_ids_for_video(self, video_id) -> (list[str] | None):
-            try:
-                request = self.service.commentThreads().list(
-                    part="snippet",
-                    videoId=video_id,
-                    maxResults=10  # Adjust as needed
-                )
-                response = request.execute()
+            request = self.service.commentThreads().list(
+                part="snippet",
+                videoId=video_id,
+                maxResults=10  # Adjust as needed
+            )
+            response = request.execute()
                 
-                comment_ids = []
-                for item in response.get("items", []):
-                    comment_ids.append(item["snippet"]["topLevelComment"]["id"])
+            comment_ids = []
+            for item in response.get("items", []):
+                comment_ids.append(item["snippet"]["topLevelComment"]["id"])
                 
-                return comment_ids
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return []
+            return comment_ids
         
         #////// COMMENT SNIPPET //////
+        @_handle_http()
         def get_comment_snippet(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16754,9 +15193,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 
                 return response["items"][0]["snippet"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16768,6 +15204,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT AUTHOR DISPLAY NAME //////
+        @_handle_http()
         def get_comment_author_display_name(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16778,9 +15215,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 
                 return response["items"][0]["snippet"]["authorDisplayName"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16792,6 +15226,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT AUTHOR PROFILE IMAGE URL //////
+        @_handle_http()
         def get_comment_author_profile_image_url(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16801,9 +15236,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["authorProfileImageUrl"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16815,6 +15247,7 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// COMMENT AUTHOR CHANNEL URL //////
+        @_handle_http()
         def get_comment_author_channel_url(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16824,9 +15257,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["authorChannelUrl"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16838,6 +15268,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT AUTHOR CHANNEL ID //////
+        @_handle_http()
         def get_comment_author_channel_id(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16847,9 +15278,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["authorChannelId"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16861,6 +15289,7 @@ class YouTubeDataAPIv3Tools:
                 return None
             
         #////// COMMENT VALUE //////
+        @_handle_http()
         def get_comment_value(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16870,9 +15299,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["value"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16884,6 +15310,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT CHANNEL ID //////
+        @_handle_http()
         def get_comment_channel_id(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16893,9 +15320,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["channelId"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16907,6 +15331,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT VIDEO ID //////
+        @_handle_http()
         def get_comment_video_id(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16916,9 +15341,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["videoId"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16930,6 +15352,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT TEXT DISPLAY //////
+        @_handle_http()
         def get_comment_text_display(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16939,9 +15362,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["textDisplay"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16953,6 +15373,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT ORIGINAL TEXT //////
+        @_handle_http()
         def get_comment_original_text(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16962,9 +15383,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["textOriginal"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16976,6 +15394,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT PARENT ID //////
+        @_handle_http()
         def get_comment_parent_id(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -16985,9 +15404,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["parentId"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -16999,6 +15415,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT CAN RATE //////
+        @_handle_http()
         def comment_can_rate(self, comment_id) -> (bool | None):
             service = self.service
             try:
@@ -17008,9 +15425,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return bool(response["items"][0]["snippet"]["canRate"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17022,6 +15436,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT VIEWER RATING //////
+        @_handle_http()
         def get_comment_viewer_rating(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -17031,9 +15446,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["viewerRting"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17045,6 +15457,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT LIKE COUNT //////
+        @_handle_http()
         def get_comment_like_count(self, comment_id) -> (int | None):
             service = self.service
             try:
@@ -17054,9 +15467,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return int(response["items"][0]["snippet"]["likeCount"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17068,6 +15478,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT MODERATION STATUS //////
+        @_handle_http()
         def get_comment_moderation_status(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -17077,9 +15488,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["moderationStatus"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17091,6 +15499,7 @@ class YouTubeDataAPIv3Tools:
                 return None
            
         #////// COMMENT PUBLISH DATE //////
+        @_handle_http()
         def get_time_comment_published_at(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -17100,9 +15509,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["publishedAt"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17114,6 +15520,7 @@ class YouTubeDataAPIv3Tools:
                 return None
         
         #////// COMMENT UPDATED DATE //////
+        @_handle_http()
         def get_time_comment_updated_at(self, comment_id) -> (str | None):
             service = self.service
             try:
@@ -17123,9 +15530,6 @@ class YouTubeDataAPIv3Tools:
                 )
                 response = request.execute()
                 return response["items"][0]["snippet"]["updatedAt"]
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -17139,26 +15543,34 @@ class YouTubeDataAPIv3Tools:
     #//////////// COMMENT THREAD ////////////
     class CommentThread:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
+
+        def iter_video_comments(self, video_id: str, limit: int=None):
+            """
+            Yields the top level comment of every comment thread on the video specified 
+            by video_id, walking through the pages of up to 100 threads as they are 
+            consumed. Stops after limit comments if limit is given. API errors are 
+            raised to the caller while iterating.
+            """
+            service = self.service
+            request = service.commentThreads().list(
+                part="snippet",
+                videoId=video_id,
+                maxResults=min(limit or 100, 100)
+            )
+            for item in self.apitools_ref._paginate(service.commentThreads(), request, limit):
+                yield item["snippet"]["topLevelComment"]
     
+        @_handle_http()
         def get_video_comments(self, video_id: str, max_results: int=10) -> (list[dict] | None):
-            service = self.service
-
+            """
+            Returns up to max_results top level comments on the video specified by 
+            video_id. More than one page is fetched if needed.
+            """
             try:
-                request = service.commentThreads().list(
-                    part="snippet",
-                    videoId=video_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                comments = []
-                for item in response["items"]:
-                    comments.append(item["snippet"]["topLevelComment"])
+                return list(self.iter_video_comments(video_id, max_results))
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -17169,24 +15581,11 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
     
+        @_handle_http()
         def get_video_comments_text(self, video_id: str, max_results: int=10) -> (list[str] | None):
-            service = self.service
-
             try:
-                request = service.commentThreads().list(
-                    part="snippet",
-                    videoId=video_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                comments = []
-                for item in response["items"]:
-                    comments.append(item["snippet"]["topLevelComment"]["snippet"]["textDisplay"])
+                return [comment["snippet"]["textDisplay"] for comment in self.iter_video_comments(video_id, max_results)]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -17197,6 +15596,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def post_video_comment(self, video_id: str, comment_text: str) -> (bool | None):
             service = self.service
             try:
@@ -17218,9 +15618,6 @@ class YouTubeDataAPIv3Tools:
             except OSError as e:
                 print(f"An OS error occurred: {e}")
                 return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -17231,6 +15628,25 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None    
 
+        @_handle_http()
+        def post_video_comments(self, comments: list[tuple[str, str]]) -> (list[bool] | None):
+            """
+            Posts every (video_id, comment_text) pair in comments as a top level comment, 
+            sending up to 50 comments per batch request. Returns a list holding True for 
+            each comment that was posted and False for each one that failed, in the same 
+            order as comments.
+            """
+            requests = {
+                str(index): self.service.commentThreads().insert(
+                    part="snippet",
+                    body={"snippet": {"videoId": video_id, "topLevelComment": {"snippet": {"textOriginal": comment_text}}}}
+                )
+                for index, (video_id, comment_text) in enumerate(comments)
+            }
+            results = self.apitools_ref._execute_batch(requests)
+            return [isinstance(results.get(str(index)), dict) for index in range(len(comments))]
+
+        @_handle_http()
         def get_comment_thread_kind(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17244,9 +15660,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["kind"]            
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17257,6 +15670,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
                 
+        @_handle_http()
         def get_comment_thread_etag(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17270,9 +15684,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["etag"]            
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17283,6 +15694,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
            
+        @_handle_http()
         def get_comment_thread_snippet(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17296,9 +15708,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]            
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17309,6 +15718,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
                
+        @_handle_http()
         def get_comment_thread_author_display_name(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17322,9 +15732,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["authorDisplayName"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17335,6 +15742,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_author_profile_image_url(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17348,9 +15756,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["authorProfileImageUrl"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17361,6 +15766,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_author_channel_id(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17374,9 +15780,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["authorChannelId"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17387,6 +15790,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_value(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17400,9 +15804,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["value"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17413,6 +15814,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_channel_id(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17426,9 +15828,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["channelId"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17439,6 +15838,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_video_id(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17452,9 +15852,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["videoId"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17465,6 +15862,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_text_display(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17478,9 +15876,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["textDisplay"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17491,6 +15886,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
+        @_handle_http()
         def get_comment_thread_text_original(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17504,9 +15900,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["textOriginal"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17517,6 +15910,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
          
+        @_handle_http()
         def get_comment_thread_parent_id(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17530,9 +15924,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["parentId"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17543,6 +15934,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
              
+        @_handle_http()
         def comment_thread_can_rate(self, thread_id: str, video_id: str=None) -> (bool | None):
             service = self.service 
             try:
@@ -17554,9 +15946,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 resource = response["items"][0]
                 return bool(resource["snippet"]["canRate"])           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17567,6 +15956,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_viewer_rating(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17580,9 +15970,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["viewerRating"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17593,6 +15980,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_like_count(self, thread_id: str, video_id: str=None) -> (int | None):
             service = self.service
             
@@ -17606,9 +15994,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return int(resource["snippet"]["likeCount"])           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17619,6 +16004,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_comment_thread_moderation_status(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17632,9 +16018,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["moderationStatus"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17645,6 +16028,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
          
+        @_handle_http()
         def get_time_comment_thread_published_at(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17658,9 +16042,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["publishedAt"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17671,6 +16052,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
           
+        @_handle_http()
         def get_time_comment_thread_updated_at(self, thread_id: str, video_id: str=None) -> (str | None):
             service = self.service
             
@@ -17684,9 +16066,6 @@ class YouTubeDataAPIv3Tools:
 
                 resource = response["items"][0]
                 return resource["snippet"]["updatedAt"]           
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no comments with the given ID.\n{e}")
                 return None
@@ -17702,6 +16081,7 @@ class YouTubeDataAPIv3Tools:
         def __init__(self, ytd_api_tools: object) -> None:
             self.service = ytd_api_tools.service
     
+        @_handle_http()
         def upload_video_thumbnail(self, video_id: str, image_path: str) -> (bool | None):
             """
             This generator method allows you to upload a custom thumbnail image for a video. 
@@ -17712,28 +16092,21 @@ class YouTubeDataAPIv3Tools:
             service = self.service
             
             try:
-                with open(image_path, "rb") as image_file:
-                    thumbnail_data = image_file.read()
-
+                # Thumbnails are at most 2MB, so they are streamed from disk in a single 
+                # non resumable request instead of opening a resumable upload session.
                 request = service.thumbnails().set(
                     videoId=video_id,
-                    media_body=googleapiclient.http.MediaIoBaseUpload(
-                        io.BytesIO(thumbnail_data),
+                    media_body=googleapiclient.http.MediaFileUpload(
+                        image_path,
                         mimetype="image/jpeg",
-                        chunksize=-1,
-                        resumable=True
+                        resumable=False
                     )
                 )
-                response = None
-                while response is None:
-                    status, response = request.next_chunk()
-                    if status:
-                        yield int(status.progress() * 100)
+                request.execute()
+                disk_cache.invalidate(video_id)
+                yield 100
                 return True
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -17759,6 +16132,7 @@ class YouTubeDataAPIv3Tools:
             self.service = ytd_api_tools.service
             
         #////// ENTIRE WATERMARK RESOURCE //////
+        @_handle_http()
         def get_watermark(self, channel_id: str) -> (dict | None):
             service = self.service
 
@@ -17769,9 +16143,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 watermark = response["watermark"]
                 return watermark
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17783,6 +16154,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
          
         #////// WATERMARK TIMING PART //////
+        @_handle_http()
         def get_watermark_timing(self, channel_id: str) -> (dict | None):
             service = self.service
             try:
@@ -17792,9 +16164,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 watermark_timing = response["watermark"]["timing"]
                 return watermark_timing
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17806,6 +16175,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
              
         #////// WATERMARK TIMING TYPE //////
+        @_handle_http()
         def get_watermark_timing_type(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17815,9 +16185,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 _type = response["watermark"]["timing"]["type"]
                 return _type
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17829,6 +16196,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
             
         #////// WATERMARK TIMING OFFSET MS //////
+        @_handle_http()
         def get_watermark_timing_offset_ms(self, channel_id: str) -> (int | None):
             service = self.service
             try:
@@ -17838,9 +16206,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 offset = response["watermark"]["timing"]["offsetMs"]
                 return offset
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17852,6 +16217,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
          
         #////// WATERMARK TIMING DURATION MS //////
+        @_handle_http()
         def get_watermark_timing_duration_ms(self, channel_id: str) -> (int | None):
             service = self.service
             try:
@@ -17861,9 +16227,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 duration = response["watermark"]["timing"]["durationMs"]
                 return duration
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17875,6 +16238,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
         
         #////// WATERMARK POSITION PART //////
+        @_handle_http()
         def get_watermark_position(self, channel_id: str) -> (dict | None):
             service = self.service
             try:
@@ -17884,9 +16248,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 position = response["watermark"]["position"]
                 return position
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17898,6 +16259,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
              
         #////// WATERMARK POSITION TYPE //////
+        @_handle_http()
         def get_watermark_position_type(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17907,9 +16269,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 position_type = response["watermark"]["position"]["type"]
                 return position_type
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17921,6 +16280,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
             
         #////// WATERMARK CORNER POSITION //////
+        @_handle_http()
         def get_watermark_corner_position(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17930,9 +16290,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 position = response["watermark"]["position"]["cornerPosition"]
                 return position
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17944,6 +16301,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
          
         #////// WATERMARK IMAGE URL //////
+        @_handle_http()
         def get_watermark_image_url(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17953,9 +16311,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 url = response["watermark"]["imageUrl"]
                 return url
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17967,6 +16322,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
          
         #////// WATERMARK IMAGE BYTES //////
+        @_handle_http()
         def get_watermark_image_bytes(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17976,9 +16332,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 bytez = response["watermark"]["imageBytes"]
                 return bytez
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -17990,6 +16343,7 @@ class YouTubeDataAPIv3Tools:
                 return None 
          
         #////// WATERMARK TARGET CHANNEL ID //////
+        @_handle_http()
         def get_watermark_target_channel_id(self, channel_id: str) -> (str | None):
             service = self.service
             try:
@@ -17999,9 +16353,6 @@ class YouTubeDataAPIv3Tools:
                 response = request.execute()
                 id = response["watermark"]["targetChannelId"]
                 return id
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -18015,249 +16366,220 @@ class YouTubeDataAPIv3Tools:
     #//////////// ACTIVITY ////////////
     class Activity:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
-            
-        def get_my_recent_activities(self, max_results=10):
+
+        #////// UTILITY METHODS //////
+        def print_activities(self, activities: list[dict]) -> None:
             """
-            This function retrieves recent activities for the authenticated user. 
-            It prints information about uploaded videos, liked videos, and comments 
-            made by the user.
+            Prints the activities returned by one of the methods below, one line per 
+            activity.
             """
-            service = self.service
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    mine=True,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for activity in response["items"]:
-                    activity_type = activity["snippet"]["type"]
-                    if activity_type == "upload":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["upload"]["videoId"]
-                        print(f"Uploaded Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "like":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["like"]["resourceId"]["videoId"]
-                        print(f"Liked Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "comment":
-                        comment_text = activity["snippet"]["displayMessage"]
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["comment"]["videoId"]
-                        print(f"Commented on Video: {video_title} (Video ID: {video_id}) - Comment: {comment_text}")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            if activities is not None:
+                _print_lines([_ACTIVITY_FORMATS[activity["type"]](activity) for activity in activities])
 
-        def get_activities_by_type(self, activity_type, max_results=10):
+        def _activities_request(self, max_results: int=10, part: str="snippet,contentDetails", fields: str=_FIELDS_ACTIVITIES, **filters) -> object:
             """
-            This method will retrieve activities of a specific type for the authenticated user. 
-            (e.g., "upload", "like", or "comment") 
+            Returns an activities().list request for the given filters, e.g. mine=True, 
+            channelId=channel_id or home=True, passed as keyword arguments.
             """
-            service = self.service
+            return self.service.activities().list(
+                part=part,
+                fields=fields,
+                maxResults=max_results,
+                **filters
+            )
 
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    mine=True,
-                    maxResults=max_results,
-                    type=activity_type
-                )
-                response = request.execute()
+        def _list_activities(self, max_results: int=10, **filters) -> list[dict]:
+            """
+            Returns the activities matching the given filters parsed with 
+            _parse_activities(). See _activities_request() for the arguments.
+            """
+            response = self._activities_request(max_results, **filters).execute()
+            return _parse_activities(response.get("items", []))
 
-                for activity in response["items"]:
-                    if activity_type == "upload":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["upload"]["videoId"]
-                        print(f"Uploaded Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "like":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["like"]["resourceId"]["videoId"]
-                        print(f"Liked Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "comment":
-                        comment_text = activity["snippet"]["displayMessage"]
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["comment"]["videoId"]
-                        print(f"Commented on Video: {video_title} (Video ID: {video_id}) - Comment: {comment_text}")
+        #////// ACTIVITIES //////
+        @_handle_http()
+        def get_my_recent_activities(self, max_results=10) -> (list[dict] | None):
+            """
+            This function retrieves recent activities for the authenticated user. 
+            It returns the uploaded videos, liked videos, and comments made by the 
+            user as a list of dictionaries with the keys type, title, video_id and, 
+            for comments, comment.
+            """
+            return self._list_activities(max_results, mine=True)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+        @_handle_http()
+        def get_activities_by_type(self, activity_type, max_results=10) -> (list[dict] | None):
+            """
+            This method will retrieve activities of a specific type for the authenticated user. 
+            (e.g., "upload", "like", or "comment") 
+            """
+            return self._list_activities(max_results, mine=True, type=activity_type)
 
-        def get_activities_since_date(self, start_date, max_results=10):
+        @_handle_http()
+        def get_activities_since_date(self, start_date, max_results=10) -> (list[dict] | None):
             """
             This method retrieves activities for the authenticated user since a 
             specific date (provided as start_date).
             """
-            service = self.service
-
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    mine=True,
-                    maxResults=max_results,
-                    publishedAfter=start_date
-                )
-                response = request.execute()
-
-                for activity in response["items"]:
-                    activity_type = activity["snippet"]["type"]
-                    if activity_type == "upload":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["upload"]["videoId"]
-                        print(f"Uploaded Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "like":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["like"]["resourceId"]["videoId"]
-                        print(f"Liked Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "comment":
-                        comment_text = activity["snippet"]["displayMessage"]
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["comment"]["videoId"]
-                        print(f"Commented on Video: {video_title} (Video ID: {video_id}) - Comment: {comment_text}")
+            return self._list_activities(max_results, mine=True, publishedAfter=start_date)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-
-        def get_video_activities_by_channel(self, channel_id, max_results=10):
+        @_handle_http()
+        def get_video_activities_by_channel(self, channel_id, max_results=10) -> (list[dict] | None):
             """
             This method retrieves video upload activities for a specific 
             channel (identified by channel_id).
             """
-            service = self.service
-
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    channelId=channel_id,
-                    maxResults=max_results,
-                    type="upload"
-                )
-                response = request.execute()
-
-                for activity in response["items"]:
-                    video_title = activity["snippet"]["title"]
-                    video_id = activity["contentDetails"]["upload"]["videoId"]
-                    print(f"Uploaded Video: {video_title} (Video ID: {video_id})")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-
-        def get_channel_activity(self, channel_id, max_results=10):
-            service = self.service
-
-            try:
-                request = service.activities().list(
-                    part="snippet",
-                    channelId=channel_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                for activity in response["items"]:
-                    print(activity["snippet"]["title"])
+            return self._list_activities(max_results, channelId=channel_id, type="upload")
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+        @_handle_http()
+        def get_channel_activity(self, channel_id, max_results=10) -> (list[str] | None):
+            """
+            Returns the titles of the recent activities on the channel specified by 
+            channel_id.
+            """
+            response = self._activities_request(max_results, part="snippet", fields="items/snippet/title", channelId=channel_id).execute()
+            return list(map(_TITLE, map(_SNIPPET, response.get("items", []))))
 
-        def get_channel_activities(self, channel_id, max_results=10):
+        @_handle_http()
+        def get_channel_activities(self, channel_id, max_results=10) -> (list[dict] | None):
             """
             This method retrieves recent activities on a specific channel. 
-            It prints information about uploaded videos, liked videos, and 
-            comments made on the channel.
+            It returns the uploaded videos, liked videos, and comments made 
+            on the channel as a list of dictionaries.
+            """
+            return self._list_activities(max_results, channelId=channel_id)
+
+        @_handle_http()
+        def get_subscription_activity(self, max_results=10) -> (list[dict] | None):
+            """
+            Returns the uploads from the channels you are subscribed to as a list of 
+            dictionaries with the keys title, video_id and url. Other activities in the
+            feed, like likes and comments, are skipped.
+            """
+            response = self._activities_request(
+                max_results, 
+                fields="items(snippet(type,title),contentDetails/upload/videoId)", 
+                home=True
+            ).execute()
+            uploads = []
+            for activity in response.get("items", []):
+                snippet = activity["snippet"]
+                if snippet["type"] != "upload":
+                    continue
+                video_id = activity["contentDetails"]["upload"]["videoId"]
+                uploads.append({
+                    "title": snippet["title"],
+                    "video_id": video_id,
+                    "url": f"https://www.youtube.com/watch?v={video_id}"
+                })
+            return uploads
+
+        @_handle_http()
+        def get_activities_from_playlist(self, playlist_id, max_results=10) -> (list[dict] | None):
+            """
+            This method retrieves activities (videos) from a specific playlist. 
+            It returns the title and video ID of every video contained within the 
+            playlist as a list of dictionaries.
             """
             service = self.service
+            request = service.playlistItems().list(
+                part="snippet",
+                fields="items/snippet(title,resourceId/videoId)",
+                playlistId=playlist_id,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return [{"title": item["snippet"]["title"], "video_id": item["snippet"]["resourceId"]["videoId"]} for item in response["items"]]
 
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    channelId=channel_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                for activity in response["items"]:
-                    activity_type = activity["snippet"]["type"]
-                    if activity_type == "upload":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["upload"]["videoId"]
-                        print(f"Uploaded Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "like":
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["like"]["resourceId"]["videoId"]
-                        print(f"Liked Video: {video_title} (Video ID: {video_id})")
-                    elif activity_type == "comment":
-                        comment_text = activity["snippet"]["displayMessage"]
-                        video_title = activity["snippet"]["title"]
-                        video_id = activity["contentDetails"]["comment"]["videoId"]
-                        print(f"Commented on Video: {video_title} (Video ID: {video_id}) - Comment: {comment_text}")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-
-        def get_subscription_activity(self, max_results=10):
-            service = self.service
-
-            try:
-                request = service.activities().list(
-                    part="snippet,contentDetails",
-                    home=True,
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                for activity in response["items"]:
-                    channel_title = activity["snippet"]["title"]
-                    video_id = activity["contentDetails"]["upload"]["videoId"]
-                    print(f"New Upload from {channel_title}: https://www.youtube.com/watch?v={video_id}")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-
-        def get_activities_from_playlist(self, playlist_id, max_results=10):
+        async def get_channels_activities_async(self, channel_ids: list[str], max_results: int=10, max_concurrency: int=16) -> dict:
             """
-            This method retrieves activities (videos) from a specific playlist. 
-            It prints information about videos contained within the playlist.
+            Returns a dictionary mapping each of the given channel IDs to its recent 
+            activities, parsed the same way as get_channel_activities(). The channels are 
+            requested concurrently, at most max_concurrency at a time, with every request 
+            running on a worker thread so it can be awaited. A channel whose request 
+            failed is mapped to the exception instead.
+            
+                activities = asyncio.run(tube.Activity(tube).get_channels_activities_async(channel_ids))
             """
-            service = self.service
-            try:
-                request = service.playlistItems().list(
-                    part="snippet",
-                    playlistId=playlist_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    video_title = item["snippet"]["title"]
-                    video_id = item["snippet"]["resourceId"]["videoId"]
-                    print(f"Video in Playlist: {video_title} (Video ID: {video_id})")
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch(channel_id: str) -> list[dict]:
+                request = self._activities_request(max_results, channelId=channel_id)
+                async with semaphore:
+                    response = await self.apitools_ref._execute_async(request)
+                return _parse_activities(response.get("items", []))
+
+            channel_ids = list(channel_ids)
+            results = await asyncio.gather(*(fetch(channel_id) for channel_id in channel_ids), return_exceptions=True)
+            return dict(zip(channel_ids, results))
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
     
     #//////////// SEARCH ////////////
     class Search:  
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
             
-        def search_channels(self, query, max_results=10):
+        #////// UTILITY METHODS //////
+        def _uploads_playlist_id(self, channel_id: str) -> (str | None):
+            """
+            Returns the ID of the playlist holding every upload of the channel specified
+            by channel_id, or None if there is no such channel. The ID never changes so it
+            is kept in the metadata cache.
+            """
+            key = ("channel", channel_id, "uploads")
+            uploads = metadata_cache.get(key)
+            if uploads is None:
+                response = self.service.channels().list(
+                    part="contentDetails",
+                    id=channel_id,
+                    fields="items/contentDetails/relatedPlaylists/uploads"
+                ).execute()
+                if not response.get("items"):
+                    return None
+                uploads = response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+                metadata_cache.set(key, uploads)
+            return uploads
+
+        def _search_results(self, response: dict, id_key: str=None) -> list[dict]:
+            """
+            Turns a search().list response into a list of dictionaries holding the ID and
+            title of each result, so callers can use the results without searching again.
+            The ID is read from id_key, or if it's None from the key that matches the kind
+            of each result, so searches that mix videos, channels and playlists work too.
+            """
+            results = []
+            for resource_id, snippet in map(_ID_AND_SNIPPET, response.get("items", [])):
+                key = id_key if id_key is not None else _SEARCH_ID_KEYS[resource_id["kind"]]
+                results.append({"id": resource_id[key], "title": snippet["title"]})
+            return results
+
+        def print_search_results(self, results: list[dict]) -> None:
+            """
+            Prints the title and ID of every result returned by one of the search methods.
+            """
+            if results is not None:
+                _print_lines([f"{result['title']} ({result['id']})" for result in results])
+
+        @_handle_http()
+        def search_channels(self, query, max_results=10) -> (list[dict] | None):
             service = self.service
 
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="channel",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="channel",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
+            return self._search_results(response, "channelId")
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")        
             
+        @_handle_http()
         def get_channel_id_by_name(self, channel_name: str) -> (str | None):
             """ 
             This method takes the channel_name as input and returns 
@@ -18268,6 +16590,13 @@ class YouTubeDataAPIv3Tools:
             service = self.service
 
             try:
+                channel_id = metadata_cache.get(("channel_name", channel_name))
+                if channel_id is None:
+                    channel_id = disk_cache.get(("channel_name", channel_name))
+                if channel_id is not None:
+                    metadata_cache.set(("channel_name", channel_name), channel_id)
+                    return channel_id
+
                 request = service.search().list(
                     part="id",
                     q=channel_name,
@@ -18278,14 +16607,13 @@ class YouTubeDataAPIv3Tools:
 
                 if "items" in response:
                     channel_id = response["items"][0]["id"]["channelId"]
+                    metadata_cache.set(("channel_name", channel_name), channel_id)
+                    disk_cache.set(("channel_name", channel_name), channel_id, CHANNEL_ID_TTL)
                     return channel_id
                 else:
                     print("Channel not found.")
                     return None
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no channels with the given ID.\n{ie}")
                 return None
@@ -18296,6 +16624,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def search_playlists(self, query: str, max_results: int=10) -> (list[dict] | None):
             """
             Returns a list of result snippets that matched the query.
@@ -18313,9 +16642,6 @@ class YouTubeDataAPIv3Tools:
                 for item in response["items"]:
                     result_snippets.append(item["snippet"])
                 return result_snippets
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no playlists with the given ID.\n{ie}")
                 return None
@@ -18326,172 +16652,170 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
-        def search_videos(self, query, max_results=10):
+        @_handle_http()
+        def search_videos(self, query, max_results=10) -> (list[dict] | None):
             service = self.service
 
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
+            return self._search_results(response)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")        
 
-        def search_videos_by_order(self, query, order="relevance", max_results=10):
+        @_handle_http()
+        def search_videos_by_order(self, query, order="relevance", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    order=order,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                order=order,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
 
-        def search_videos_by_category(self, query, category_id, max_results=10):
+        @_handle_http()
+        def search_videos_by_category(self, query, category_id, max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    videoCategoryId=category_id,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                videoCategoryId=category_id,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
 
-        def search_videos_by_definition(self, query, definition="any", max_results=10):
+        @_handle_http()
+        def search_videos_by_definition(self, query, definition="any", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    videoDefinition=definition,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                videoDefinition=definition,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
 
-        def search_videos_by_duration(self, query, duration="any", max_results=10):
+        @_handle_http()
+        def search_videos_by_duration(self, query, duration="any", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    videoDuration=duration,
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                videoDuration=duration,
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")    
+            return self._search_results(response)
 
-        def search_videos_by_license(self, query, license_type="any", max_results=10):
+        @_handle_http()
+        def search_videos_by_license(self, query, license_type="any", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    videoLicense=license_type,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                videoLicense=license_type,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
         
-        def search_videos_by_type(self, query, video_type="any", max_results=10):
+        @_handle_http()
+        def search_videos_by_type(self, query, video_type="any", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type=video_type,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type=video_type,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
 
-        def search_embeddable_videos(self, query, embeddable="true", max_results=10):
+        @_handle_http()
+        def search_embeddable_videos(self, query, embeddable="true", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    videoEmbeddable=embeddable,
-                    maxResults=max_results
-                )
-                response = request.execute()
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                videoEmbeddable=embeddable,
+                maxResults=max_results
+            )
+            response = request.execute()
+            return self._search_results(response)
 
-        def search_videos_by_published_date(self, query, published_after, published_before, max_results=10):
+        @_handle_http()
+        def search_videos_by_published_date(self, query, published_after, published_before, max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    publishedAfter=published_after,
-                    publishedBefore=published_before,
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=query,
+                type="video",
+                publishedAfter=published_after,
+                publishedBefore=published_before,
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
+            return self._search_results(response)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
+        @_handle_http()
         def get_channel_videos(self, channel_id: str, max_results: int=100) -> (list[dict] | None):
+            """
+            Returns up to max_results of the most recent videos uploaded by the channel 
+            specified by channel_id as video resources with the snippet, contentDetails and 
+            statistics parts. The channel's uploads playlist is walked with 
+            playlistItems().list, which costs 1 quota unit per page of 50 instead of the 
+            100 units a search().list call costs. Returns None if unsuccessful.
+            """
             service = self.service
             try:
-                request = service.search().list(
-                part="snippet",
-                channelId=channel_id,
-                type="video",
-                maxResults=max_results
+                uploads = self._uploads_playlist_id(channel_id)
+                if uploads is None:
+                    return None
+                video_ids = []
+                request = service.playlistItems().list(
+                    part="contentDetails",
+                    playlistId=uploads,
+                    maxResults=min(max_results, MAX_IDS_PER_REQUEST),
+                    fields="nextPageToken,items/contentDetails/videoId"
                 )
-                response = request.execute()
+                while request is not None and len(video_ids) < max_results:
+                    response = request.execute()
+                    for item in response.get("items", []):
+                        video_ids.append(item["contentDetails"]["videoId"])
+                    request = service.playlistItems().list_next(request, response)
+                video_ids = video_ids[:max_results]
+                found = self.apitools_ref.Video(self.apitools_ref)._fetch_videos(video_ids)
                 videos = []
-                for item in response["items"]:
-                    videos.append(item)
+                for video_id in video_ids:
+                    if video_id in found:
+                        videos.append(found[video_id])
                 return videos
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no channels with the given ID.\n{e}")
                 return None
@@ -18502,120 +16826,101 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
+        @_deprecated("YouTube removed the relatedToVideoId search parameter, use get_recommended_videos() instead.")
         def iterate_related_videos(self, video_id, max_results=10):
-            service = self.service
-
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    relatedToVideoId=video_id,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                related_videos = response.get("items", [])
-                for video in related_videos:
-                    video_id = video["id"]["videoId"]
-                    video_title = video["snippet"]["title"]
-                    channel_title = video["snippet"]["channelTitle"]
-                    print(f"Video ID: {video_id}, Title: {video_title}, Channel: {channel_title}")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            related_videos = self.get_recommended_videos(video_id, max_results)
+            if related_videos is not None:
+                _print_lines([f"Video ID: {video['video_id']}, Title: {video['title']}, Channel: {video['channel']}" for video in related_videos])
 
+        @_deprecated("YouTube removed the relatedToVideoId search parameter, use get_recommended_videos() instead.")
         def get_related_videos(self, video_id, max_results=10):
             """
             This method retrieves related videos for a specific video. It prints 
-            information about videos related to the given video based on YouTube's 
-            recommendation algorithm.
+            information about videos related to the given video. The results come 
+            from get_recommended_videos().
             """
-            service = self.service
-
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    relatedToVideoId=video_id,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                for video in response["items"]:
-                    title = video["snippet"]["title"]
-                    video_id = video["id"]["videoId"]
-                    print(f"Related Video: {title} (Video ID: {video_id})")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            related_videos = self.get_recommended_videos(video_id, max_results)
+            if related_videos is not None:
+                _print_lines([f"Related Video: {video['title']} (Video ID: {video['video_id']})" for video in related_videos])
 
-        def get_videos_by_category(self, category_id, region_code="US", max_results=10):
+        @_handle_http()
+        def get_videos_by_category(self, category_id, region_code="US", max_results=10) -> (list[dict] | None):
             service = self.service
 
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    videoCategoryId=category_id,
-                    regionCode=region_code,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                videoCategoryId=category_id,
+                regionCode=region_code,
+                type="video",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
+            return self._search_results(response)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def get_videos_by_tag(self, tag, region_code="US", max_results=10):
+        @_handle_http()
+        def get_videos_by_tag(self, tag, region_code="US", max_results=10) -> (list[dict] | None):
             service = self.service
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=tag,
-                    regionCode=region_code,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                q=tag,
+                regionCode=region_code,
+                type="video",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._search_results(response)
         
+        @_handle_http()
         def get_recommended_videos(self, video_id, max_results=10):
             """
             This method will get recommended videos based on a given video's ID.
+            YouTube no longer supports searching for related videos directly, so this 
+            searches the video's category for its first tag (or its title if it has no 
+            tags) instead.
             """
             service = self.service
 
-            try:
-                # Get recommended videos for the given video ID
-                request = service.search().list(
-                    part="snippet",
-                    relatedToVideoId=video_id,
-                    type="video",
-                    maxResults=max_results
-                )
-                response = request.execute()
-
-                recommended_videos = []
-                for item in response["items"]:
-                    video = item["snippet"]
-                    recommended_videos.append({
-                        "video_id": item["id"]["videoId"],
-                        "title": video["title"],
-                        "channel": video["channelTitle"]
-                    })
-
-                return recommended_videos
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            video = service.videos().list(
+                part="snippet",
+                id=video_id,
+                fields="items/snippet(title,tags,categoryId)"
+            ).execute()
+            if not video.get("items"):
                 return None
-        
+            snippet = video["items"][0]["snippet"]
+            tags = snippet.get("tags")
+            query = tags[0] if tags else snippet["title"]
+
+            request = service.search().list(
+                part="snippet",
+                q=query,
+                videoCategoryId=snippet.get("categoryId"),
+                type="video",
+                maxResults=max_results,
+                fields="items(id/videoId,snippet(title,channelTitle))"
+            )
+            response = request.execute()
+
+            recommended_videos = []
+            for item in response["items"]:
+                if item["id"]["videoId"] == video_id:
+                    continue
+                video = item["snippet"]
+                recommended_videos.append({
+                    "video_id": item["id"]["videoId"],
+                    "title": video["title"],
+                    "channel": video["channelTitle"]
+                })
+
+            return recommended_videos
+
+        
+        @_handle_http()
         def get_popular_video_thumbnails(self, channel_id: str, max_results: int=10) -> (list[dict] | None):
             """
             This function retrieves the most popular video thumbnails for 
@@ -18637,9 +16942,6 @@ class YouTubeDataAPIv3Tools:
                 for video in response["items"]:
                     urls.append(video["snippet"]["thumbnails"]["medium"]["url"])
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no videos with the given ID.\n{ie}")
                 return None
@@ -18650,32 +16952,49 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
         
-        def get_videos_by_categories(self, category_ids, max_results=10):
+        @_handle_http()
+        def get_videos_by_categories(self, category_ids, max_results=10) -> (list[dict] | None):
             """
             This method allows you to retrieve videos that belong to multiple video categories. 
-            Provide a list of category_ids, and it will return videos that are associated with 
-            any of the specified categories.
+            Provide a list of category_ids, and it will return up to max_results videos from 
+            each of the specified categories. search().list only accepts a single category 
+            so every category is searched on its own: the first pages of all of them are 
+            sent as one batch request and further pages are only fetched for categories 
+            that haven't reached max_results yet. Videos found in several categories are 
+            only returned once.
             """
-            service = self.service
+            search = self.service.search()
 
-            try:
-                request = service.search().list(
+            requests = {}
+            for category_id in dict.fromkeys(category_ids):
+                requests[category_id] = search.list(
                     part="snippet",
+                    fields=f"nextPageToken,{_FIELDS_SEARCH_RESULTS}",
                     type="video",
-                    maxResults=max_results,
-                    videoCategoryId=",".join(category_ids)
+                    maxResults=min(max_results, MAX_IDS_PER_REQUEST),
+                    videoCategoryId=category_id
                 )
-                response = request.execute()
-
-                for video in response["items"]:
-                    video_title = video["snippet"]["title"]
-                    video_id = video["id"]["videoId"]
-                    print(f"Video Title: {video_title} (Video ID: {video_id})")
+            responses = self.apitools_ref._execute_batch(requests)
+
+            videos = {}
+            for category_id, request in requests.items():
+                response = responses[category_id]
+                if isinstance(response, Exception):
+                    raise response
+                found = 0
+                while True:
+                    for video in self._search_results(response)[:max_results - found]:
+                        videos.setdefault(video["id"], video)
+                        found += 1
+                    request = search.list_next(request, response)
+                    if request is None or found >= max_results:
+                        break
+                    response = request.execute()
+            return list(videos.values())
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
  
-        def get_videos_in_category(self, category_id, max_results=10):
+        @_handle_http()
+        def get_videos_in_category(self, category_id, max_results=10) -> (list[dict] | None):
             """
             This method retrieves videos that belong to a specific video category, 
             identified by category_id. It prints information about each video, including 
@@ -18683,388 +17002,800 @@ class YouTubeDataAPIv3Tools:
             """
             service = self.service
 
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    type="video",
-                    maxResults=max_results,
-                    videoCategoryId=category_id
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                type="video",
+                maxResults=max_results,
+                videoCategoryId=category_id
+            )
+            response = request.execute()
 
-                for video in response["items"]:
-                    video_title = video["snippet"]["title"]
-                    video_id = video["id"]["videoId"]
-                    print(f"Video Title: {video_title} (Video ID: {video_id})")
+            return self._search_results(response)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def get_most_popular_videos_in_category(self, category_id, max_results=10):
+        @_handle_http()
+        def get_most_popular_videos_in_category(self, category_id, max_results=10) -> (list[dict] | None):
             """
             This method retrieves the most popular videos in a specific video category, 
             ordered by the number of views.
             """
             service = self.service
 
+            request = service.search().list(
+                part="snippet",
+                fields=_FIELDS_SEARCH_RESULTS,
+                type="video",
+                maxResults=max_results,
+                videoCategoryId=category_id,
+                order="viewCount"
+            )
+            response = request.execute()
+
+            return self._search_results(response)
+
+
+    #//////////// ASYNC SEARCH ////////////
+    class AsyncSearch:
+        """
+        An asyncio based alternative to the Search class for searches, with async list, 
+        insert and delete calls for the other resources. Requests are sent straight to 
+        the Data API REST endpoints over a pooled aiohttp session so many requests can 
+        run concurrently with asyncio.gather() instead of one after another. At most 
+        max_concurrency requests are in flight at once to stay clear of rate limits.
+        Requires the optional aiohttp module, and uses orjson to parse responses when 
+        it is installed. iter_items() parses the response while it is still downloading 
+        when the optional ijson module is installed. Use it as an async context manager 
+        or call close() when done.
+        
+            async with tube.AsyncSearch(tube) as search:
+                results = await search.search_many(["cats", "dogs"])
+                counts = await search.get_subscriber_counts(channel_ids)
+        """
+        def __init__(self, ytd_api_tools: object, max_connections: int=20, max_concurrency: int=10) -> None:
+            self.apitools_ref = ytd_api_tools
+            self.max_connections = max_connections
+            self.max_concurrency = max_concurrency
+            self._session = None
+            self._semaphore = None
+            self._auth_lock = None
+
+        async def __aenter__(self) -> object:
+            return self
+
+        async def __aexit__(self, *exc_info) -> None:
+            await self.close()
+
+        #////// UTILITY METHODS //////
+        def _get_session(self) -> object:
+            import aiohttp
+
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300, keepalive_timeout=75),
+                    headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+                )
+            return self._session
+
+        async def _auth(self, params: dict) -> dict:
+            """
+            Adds the developer key to params if there is one and otherwise returns the
+            OAuth 2.0 authorization header, refreshing the access token if needed. The 
+            refresh runs on a worker thread so it doesn't block the event loop, and 
+            behind a lock so concurrent requests wait for a single refresh.
+            """
+            apitools = self.apitools_ref
+            if apitools.DEV_KEY:
+                params["key"] = apitools.DEV_KEY
+                return {}
+            credentials = apitools.http.credentials
+            if not credentials.valid:
+                if self._auth_lock is None:
+                    self._auth_lock = asyncio.Lock()
+                async with self._auth_lock:
+                    if not credentials.valid:
+                        await asyncio.to_thread(
+                            lambda: credentials.refresh(google_auth_httplib2.Request(apitools._get_thread_http().http))
+                        )
+            return {"Authorization": f"Bearer {credentials.token}"}
+
+        async def _request(self, method: str, resource: str, params: dict, body: dict=None) -> dict:
+            """
+            Sends a request to the REST endpoint of resource and returns the parsed 
+            response, or an empty dictionary for responses without a body. Errors are 
+            retried by the same rules as RetryingHttpRequest, see _is_retryable_status(),
+            reading the error reasons from the response body, and with the same backoff,
+            sleeping outside the concurrency limit so other requests can go ahead. 
+            Bodies are serialized once with _json_dumps(). Raises YouTubeAPIException if
+            the request fails.
+            """
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            params = {key: value for key, value in params.items() if value is not None}
+            data = _json_dumps(body) if body is not None else None
+            for attempt in range(RetryingHttpRequest.max_attempts):
+                headers = await self._auth(params)
+                if data is not None:
+                    headers["Content-Type"] = "application/json"
+                async with self._semaphore:
+                    async with self._get_session().request(method, f"{API_BASE_URL}/{resource}", params=params, data=data, headers=headers) as response:
+                        content = await response.read()
+                        if response.status < 400:
+                            return _json_loads(content) if content else {}
+                        retry_headers = {"retry-after": response.headers.get("Retry-After", "")}
+                retryable = _is_retryable_status(response.status, _error_reasons(content), method)
+                if not retryable or attempt == RetryingHttpRequest.max_attempts - 1:
+                    raise YouTubeAPIException(f"HTTP {response.status} from {resource}: {content.decode(errors='replace')}")
+                await asyncio.sleep(RetryingHttpRequest.retry_delay(attempt, retry_headers))
+
+        async def _get(self, resource: str, params: dict) -> dict:
+            return await self._request("GET", resource, params)
+
+        async def close(self) -> None:
+            """
+            Closes the underlying HTTP session.
+            """
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+
+        #////// SEARCH //////
+        async def search(self, query: str, search_type: str="video", max_results: int=10, **filters) -> list[dict]:
+            """
+            Returns the search results for query as a list of search result resources.
+            Any other search().list parameter can be passed as a keyword argument, e.g.
+            order="viewCount" or videoDuration="short". Raises YouTubeAPIException if 
+            the request fails.
+            """
+            params = {
+                "part": "snippet",
+                "q": query,
+                "type": search_type,
+                "maxResults": max_results,
+                **filters
+            }
+            response = await self._get("search", params)
+            return response.get("items", [])
+
+        async def search_videos(self, query: str, max_results: int=10, **filters) -> list[dict]:
+            """
+            Returns the videos matching query. See search() for the keyword arguments.
+            """
+            return await self.search(query, "video", max_results, **filters)
+
+        async def search_many(self, queries: list[str], max_results: int=10, **filters) -> list[list[dict]]:
+            """
+            Runs a video search for every query concurrently and returns the results in 
+            the same order as queries.
+            """
+            return await asyncio.gather(*(self.search_videos(query, max_results, **filters) for query in queries))
+
+        async def batch(self, coroutines: typing.Iterable) -> list:
+            """
+            Runs the given coroutines concurrently and returns their results in order. A 
+            coroutine that raised is represented by its exception instead of stopping the 
+            others.
+            """
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+
+        #////// RESOURCES //////
+        async def list_items(self, resource: str, part: str="snippet", **params) -> list[dict]:
+            """
+            Returns the items of a list call on resource, e.g. "channels" or 
+            "commentThreads". Any list parameter can be passed as a keyword argument.
+            """
+            response = await self._get(resource, {"part": part, **params})
+            return response.get("items", [])
+
+        async def iter_items(self, resource: str, part: str="snippet", **params) -> typing.AsyncIterator[dict]:
+            """
+            Yields the items of a list call on resource like list_items(), but with ijson 
+            each item is parsed and yielded as soon as its bytes arrive instead of after 
+            the whole body has been downloaded. Falls back to list_items() when ijson is 
+            not installed.
+            """
             try:
-                request = service.search().list(
-                    part="snippet",
-                    type="video",
-                    maxResults=max_results,
-                    videoCategoryId=category_id,
-                    order="viewCount"
-                )
-                response = request.execute()
+                import ijson
+            except ImportError:
+                for item in await self.list_items(resource, part, **params):
+                    yield item
+                return
 
-                for video in response["items"]:
-                    video_title = video["snippet"]["title"]
-                    video_id = video["id"]["videoId"]
-                    print(f"Video Title: {video_title} (Video ID: {video_id})")
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            params = {key: value for key, value in {"part": part, **params}.items() if value is not None}
+            headers = await self._auth(params)
+            async with self._semaphore:
+                async with self._get_session().get(f"{API_BASE_URL}/{resource}", params=params, headers=headers) as response:
+                    if response.status >= 400:
+                        content = await response.read()
+                        raise YouTubeAPIException(f"HTTP {response.status} from {resource}: {content.decode(errors='replace')}")
+                    async for item in ijson.items(response.content, "items.item", use_float=True):
+                        yield item
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+        async def insert(self, resource: str, part: str, body: dict) -> dict:
+            """
+            Inserts body into resource and returns the created resource.
+            """
+            return await self._request("POST", resource, {"part": part}, body)
+
+        async def update(self, resource: str, part: str, body: dict, fields: str=None) -> dict:
+            """
+            Replaces the given part of the resource identified by body["id"] with body and 
+            returns the updated resource, trimmed to fields if given.
+            """
+            return await self._request("PUT", resource, {"part": part, "fields": fields}, body)
+
+        async def delete(self, resource: str, resource_id: str) -> bool:
+            """
+            Deletes the resource specified by resource_id from resource.
+            """
+            await self._request("DELETE", resource, {"id": resource_id})
+            return True
+
+        async def get_subscriber_counts(self, channel_ids: typing.Iterable[str]) -> dict:
+            """
+            Returns a dictionary mapping each of the given channel IDs, which can be any 
+            iterable, to its subscriber count. The IDs are requested 50 per 
+            channels().list call and all of the calls run concurrently. Channels that 
+            hide their subscriber count are left out.
+            """
+            ids = iter(channel_ids)
+            chunks = list(iter(lambda: list(itertools.islice(ids, MAX_IDS_PER_REQUEST)), []))
+            pages = await asyncio.gather(*(
+                self.list_items("channels", "statistics", id=",".join(chunk), fields="items(id,statistics/subscriberCount)") 
+                for chunk in chunks
+            ))
+            return {
+                item["id"]: int(item["statistics"]["subscriberCount"]) 
+                for page in pages for item in page if "subscriberCount" in item["statistics"]
+            }
+
+        async def get_activities(self, channel_id: str=None, max_results: int=10) -> list[dict]:
+            """
+            Returns the recent activities of the channel specified by channel_id, or your 
+            own activities if channel_id is None.
+            """
+            if channel_id is None:
+                return await self.list_items("activities", "snippet,contentDetails", mine="true", maxResults=max_results)
+            return await self.list_items("activities", "snippet,contentDetails", channelId=channel_id, maxResults=max_results)
+
+        async def iter_activities(self, channel_id: str=None, max_results: int=10) -> typing.AsyncIterator[dict]:
+            """
+            Yields the recent uploads, likes and comments of the channel specified by 
+            channel_id, or your own if channel_id is None, parsed the same way as the 
+            Activity methods. Activities are yielded while the response is streaming in, 
+            see iter_items().
+            """
+            if channel_id is None:
+                items = self.iter_items("activities", "snippet,contentDetails", mine="true", maxResults=max_results)
+            else:
+                items = self.iter_items("activities", "snippet,contentDetails", channelId=channel_id, maxResults=max_results)
+            async for item in items:
+                activity = _parse_activity(item)
+                if activity is not None:
+                    yield activity
+
+        async def get_video_details_in_languages(self, video_id: str, languages: list[str]) -> list[dict]:
+            """
+            Returns the title and description of the video specified by video_id in each 
+            of the given languages, fetching all of them concurrently.
+            """
+            async def fetch(language: str) -> (dict | None):
+                items = await self.list_items("videos", id=video_id, hl=language, fields="items/snippet(title,description,localized)")
+                if not items:
+                    return None
+                localized = items[0]["snippet"].get("localized", items[0]["snippet"])
+                return {"language": language, "title": localized["title"], "description": localized["description"]}
+
+            details = await asyncio.gather(*(fetch(language) for language in languages))
+            return [detail for detail in details if detail is not None]
+
+        async def get_video_comments(self, video_id: str, max_results: int=20) -> list[dict]:
+            """
+            Returns the top level comments of the video specified by video_id as a list 
+            of comment snippets.
+            """
+            threads = await self.list_items("commentThreads", videoId=video_id, maxResults=max_results, textFormat="plainText")
+            return [thread["snippet"]["topLevelComment"]["snippet"] for thread in threads]
+
+        #////// LOCALIZATION //////
+        async def _update_localizations(self, resource: str, resource_id: str, localizations: dict) -> dict:
+            """
+            Async version of Localization._update_localizations() for resource, i.e. 
+            "videos" or "channels". Raises YouTubeAPIException if a request fails.
+            """
+            items = await self.list_items(resource, "localizations", id=resource_id, fields="items/localizations")
+            if not items:
+                return dict.fromkeys(localizations, False)
+            current = items[0].get("localizations", {})
+            changed = _changed_localizations(current, localizations)
+            if changed:
+                await self.update(resource, "localizations", {
+                    "id": resource_id,
+                    "localizations": {**current, **changed}
+                }, fields="id")
+                metadata_cache.invalidate(resource_id)
+                disk_cache.invalidate(resource_id)
+            return dict.fromkeys(localizations, True)
+
+        async def set_video_localizations(self, video_id: str, localizations: dict) -> dict:
+            """
+            Async version of Localization.set_video_localizations(). Returns a dictionary
+            mapping each language to True if the video is up to date, or False if it 
+            wasn't found.
+            """
+            return await self._update_localizations("videos", video_id, localizations)
+
+        async def set_channel_localizations(self, channel_id: str, localizations: dict) -> dict:
+            """
+            Async version of Localization.set_channel_localizations(). Returns a 
+            dictionary mapping each language to True if the channel is up to date, or 
+            False if it wasn't found.
+            """
+            return await self._update_localizations("channels", channel_id, localizations)
+
+        async def set_captions_localizations(self, caption_track_id: str, localizations: dict) -> dict:
+            """
+            Async version of Localization.set_captions_localizations(). Every update 
+            replaces the same track's snippet and concurrent updates finish in any order,
+            so only the last one is sent. Returns a dictionary mapping each language to 
+            True if the update succeeded and False otherwise.
+            """
+            if not localizations:
+                return {}
+            localization_data = list(localizations.values())[-1]
+            [result] = await self.batch([self.update("captions", "snippet", {
+                "id": caption_track_id,
+                "snippet": {
+                    "name": localization_data.get("caption_name", ""),
+                    "language": localization_data.get("caption_language", "")
+                }
+            }, fields="id")])
+            metadata_cache.invalidate_kind("captions")
+            disk_cache.invalidate_kind("caption_tracks")
+            return dict.fromkeys(localizations, not isinstance(result, Exception))
+
+        async def get_channel_details_in_languages(self, channel_id: str, languages: list[str]) -> dict:
+            """
+            Async version of Localization.get_channel_details_in_languages(). Returns a 
+            dictionary mapping each language to the channel's title and description in it,
+            fetching all of them concurrently.
+            """
+            async def fetch(language: str) -> (dict | None):
+                items = await self.list_items("channels", id=channel_id, hl=language, fields="items/snippet(title,description,localized)")
+                if not items:
+                    return None
+                localized = items[0]["snippet"].get("localized", items[0]["snippet"])
+                return {"title": localized["title"], "description": localized["description"]}
+
+            languages = list(languages)
+            details = await asyncio.gather(*(fetch(language) for language in languages))
+            return {language: detail for language, detail in zip(languages, details) if detail is not None}
+
+        async def get_captions_in_languages(self, video_id: str, languages: list[str]) -> list[dict]:
+            """
+            Async version of Localization.get_captions_in_languages(). Returns the language 
+            and name of each caption track in one of the given languages, all of them 
+            fetched with a single list call.
+            """
+            items = await self.list_items("captions", videoId=video_id, fields="items/snippet(language,name)")
+            languages = set(languages)
+            return [
+                {"language": snippet["language"], "name": snippet["name"]}
+                for snippet in map(_SNIPPET, items) if snippet["language"] in languages
+            ]
+
+        async def get_thumbnails_in_languages(self, video_id: str, languages: list[str]) -> dict:
+            """
+            Async version of Localization.get_thumbnails_in_languages(). Returns a 
+            dictionary mapping each language to the URL of the video's default thumbnail,
+            which takes a single list call since thumbnails aren't localized.
+            """
+            items = await self.list_items("videos", id=video_id, fields="items/snippet/thumbnails/default/url")
+            if not items:
+                return {}
+            return dict.fromkeys(languages, items[0]["snippet"]["thumbnails"]["default"]["url"])
 
     #//////////// LIVE BROADCASTS ///////////
     class LiveBroadcast:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
+
+        #////// UTILITY METHODS //////
+        def print_results(self, results: list[dict], key: str="title") -> None:
+            """
+            Prints the value stored under key of every result returned by one of the 
+            list methods below, e.g. key="message" for get_live_chat_messages().
+            """
+            if results is not None:
+                _print_lines([result[key] for result in results])
         
-        def get_live_streams(self, max_results=10):
+        @_handle_http()
+        def get_live_streams(self, max_results=10) -> (list[dict] | None):
+            """
+            Returns the ID and title of your live streams as a list of dictionaries.
+            """
             service = self.service
-            try:
-                request = service.liveStreams().list(
-                    part="snippet",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.liveStreams().list(
+                part="snippet",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for stream in response["items"]:
-                    print(stream["snippet"]["title"])
+            return [{"id": item["id"], "title": item["snippet"]["title"]} for item in response["items"]]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def get_live_broadcasts(self, max_results=10):
+        @_handle_http()
+        def get_live_broadcasts(self, max_results=10) -> (list[dict] | None):
+            """
+            Returns the ID and title of your live broadcasts as a list of dictionaries.
+            """
             service = self.service
-            try:
-                request = service.liveBroadcasts().list(
-                    part="snippet",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.liveBroadcasts().list(
+                part="snippet",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for broadcast in response["items"]:
-                    print(broadcast["snippet"]["title"])
+            return [{"id": item["id"], "title": item["snippet"]["title"]} for item in response["items"]]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def search_live_broadcasts(self, query, max_results=10):
+        @_handle_http()
+        def search_live_broadcasts(self, query, max_results=10) -> (list[dict] | None):
+            """
+            Returns the video ID and title of the live broadcasts matching query as a 
+            list of dictionaries.
+            """
             service = self.service
 
-            try:
-                request = service.search().list(
-                    part="snippet",
-                    q=query,
-                    type="video",
-                    eventType="live",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.search().list(
+                part="snippet",
+                q=query,
+                type="video",
+                eventType="live",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for item in response["items"]:
-                    print(item["snippet"]["title"])
+            return [{"id": item["id"]["videoId"], "title": item["snippet"]["title"]} for item in response["items"]]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def get_live_chat_messages(self, live_chat_id, max_results=10):
+        @_handle_http()
+        def get_live_chat_messages(self, live_chat_id, max_results=10) -> (list[dict] | None):
+            """
+            Returns the ID, author channel ID and text of the messages in the live chat 
+            specified by live_chat_id as a list of dictionaries.
+            """
             service = self.service
-            try:
-                request = service.liveChatMessages().list(
-                    liveChatId=live_chat_id,
-                    part="snippet",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.liveChatMessages().list(
+                liveChatId=live_chat_id,
+                part="snippet",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for message in response["items"]:
-                    print(message["snippet"]["displayMessage"])
+            return [
+                {
+                    "id": message["id"], 
+                    "author_channel_id": message["snippet"]["authorChannelId"], 
+                    "message": message["snippet"]["displayMessage"]
+                } 
+                for message in response["items"]
+            ]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def get_live_chat_moderators(self, live_chat_id, max_results=10):
+        @_handle_http()
+        def get_live_chat_moderators(self, live_chat_id, max_results=10) -> (list[dict] | None):
+            """
+            Returns the ID, channel ID and display name of the moderators of the live chat
+            specified by live_chat_id as a list of dictionaries.
+            """
             service = self.service
-            try:
-                request = service.liveChatModerators().list(
-                    liveChatId=live_chat_id,
-                    part="snippet",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.liveChatModerators().list(
+                liveChatId=live_chat_id,
+                part="snippet",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for moderator in response["items"]:
-                    print(moderator["snippet"]["moderatorDetails"]["displayName"])
+            return [
+                {
+                    "id": moderator["id"], 
+                    "channel_id": moderator["snippet"]["moderatorDetails"]["channelId"], 
+                    "display_name": moderator["snippet"]["moderatorDetails"]["displayName"]
+                } 
+                for moderator in response["items"]
+            ]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
         
-        def get_live_chat_bans(self, live_chat_id, max_results=10):
+        @_handle_http()
+        def get_live_chat_bans(self, live_chat_id, max_results=10) -> (list[dict] | None):
+            """
+            Returns the ID, channel ID and display name of the users banned from the live
+            chat specified by live_chat_id as a list of dictionaries.
+            """
             service = self.service
 
-            try:
-                request = service.liveChatBans().list(
-                    liveChatId=live_chat_id,
-                    part="snippet",
-                    maxResults=max_results
-                )
-                response = request.execute()
+            request = service.liveChatBans().list(
+                liveChatId=live_chat_id,
+                part="snippet",
+                maxResults=max_results
+            )
+            response = request.execute()
 
-                for ban in response["items"]:
-                    print(ban["snippet"]["bannedUserDetails"]["displayName"])
+            return [
+                {
+                    "id": ban["id"], 
+                    "channel_id": ban["snippet"]["bannedUserDetails"]["channelId"], 
+                    "display_name": ban["snippet"]["bannedUserDetails"]["displayName"]
+                } 
+                for ban in response["items"]
+            ]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
+        @_handle_http()
         def insert_live_chat_message(self, live_chat_id, message_text):
             service = self.service
-            try:
-                request = service.liveChatMessages().insert(
-                    part="snippet",
-                    body={
-                        "snippet": {
-                            "liveChatId": live_chat_id,
-                            "type": "textMessageEvent",
-                            "textMessageDetails": {
-                                "messageText": message_text
-                            }
+            request = service.liveChatMessages().insert(
+                part="snippet",
+                body={
+                    "snippet": {
+                        "liveChatId": live_chat_id,
+                        "type": "textMessageEvent",
+                        "textMessageDetails": {
+                            "messageText": message_text
                         }
                     }
-                )
-                response = request.execute()
+                }
+            )
+            response = request.execute()
 
-                print("Live chat message sent successfully!")
+            print("Live chat message sent successfully!")
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def get_all_live_chat_details(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
+        def _fetch_live_chat(self, live_chat_id: str) -> (dict | None):
+            """
+            Returns the live chat resource specified by live_chat_id with its snippet and 
+            status parts, or None if there is no such chat. The resource is fetched with
+            a single call and kept in the metadata cache for LIVE_CHAT_TTL seconds, so 
+            asking for several of its details in a row only costs one request.
+            """
+            key = ("live_chat", live_chat_id)
+            chat = metadata_cache.get(key)
+            if chat is None:
+                response = self.service.liveChat().list(
                     id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _details = (
-                    chat['liveChatId'], 
-                    chat['liveChatType'], 
-                    chat['title'], 
-                    chat['description'],
-                    chat['isModerated'], 
-                    chat['scheduledStartTime'], 
-                    status['actualStartTime'],
-                    status['lifeCycleStatus'], 
-                    status['activeLiveChatId'], 
-                    status['concurrentViewers'],
-                    status['activeParticipants']
-                )
-                return _details
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-                
+                    part=_LIVE_CHAT_PART
+                ).execute()
+                if not response.get("items"):
+                    return None
+                chat = response["items"][0]
+                metadata_cache.set(key, chat, LIVE_CHAT_TTL)
+            return chat
+
+        def _live_chat_field(self, live_chat_id: str, part: str, field: str) -> (object | None):
+            """
+            Returns the given field of the given part of the live chat specified by 
+            live_chat_id, or None if there is no such chat.
+            """
+            chat = self._fetch_live_chat(live_chat_id)
+            return chat[part][field] if chat is not None else None
+
+        @_handle_http()
+        def get_live_chat_bulk(self, broadcast_ids: list[str]) -> (dict | None):
+            """
+            Returns a dictionary mapping each of the given live broadcast IDs to its live
+            broadcast resource with its snippet and status parts, where 
+            snippet["liveChatId"] is the ID of the broadcast's live chat. The broadcasts
+            that aren't in the metadata cache are requested 50 per liveBroadcasts().list
+            call. Broadcasts that couldn't be found are left out.
+            """
+            broadcasts = {}
+            missing = []
+            for broadcast_id in dict.fromkeys(broadcast_ids):
+                broadcast = metadata_cache.get(("live_broadcast", broadcast_id))
+                if broadcast is not None:
+                    broadcasts[broadcast_id] = broadcast
+                else:
+                    missing.append(broadcast_id)
+            for i in range(0, len(missing), MAX_IDS_PER_REQUEST):
+                response = self.service.liveBroadcasts().list(
+                    id=",".join(missing[i:i + MAX_IDS_PER_REQUEST]),
+                    part="snippet,status"
+                ).execute()
+                for broadcast in response.get("items", []):
+                    broadcasts[broadcast["id"]] = broadcast
+                    metadata_cache.set(("live_broadcast", broadcast["id"]), broadcast, LIVE_CHAT_TTL)
+            return broadcasts
+
+        @_handle_http()
+        def get_all_live_chat_details(self, live_chat_id) -> (LiveChatDetails | None):
+            """
+            Returns the details of the live chat specified by live_chat_id as a 
+            LiveChatDetails named tuple.
+            """
+            item = self._fetch_live_chat(live_chat_id)
+            if item is None:
+                return None
+            chat = item["snippet"]
+            status = item["status"]
+            _details = LiveChatDetails(
+                chat['liveChatId'], 
+                chat['liveChatType'], 
+                chat['title'], 
+                chat['description'],
+                chat['isModerated'], 
+                chat['scheduledStartTime'], 
+                status['actualStartTime'],
+                status['lifeCycleStatus'], 
+                status['activeLiveChatId'], 
+                status['concurrentViewers'],
+                status['activeParticipants']
+            )
+            return _details
+
+        @_handle_http()
         def get_live_chat_id(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _id = chat['liveChatId']
-                return _id
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "snippet", "liveChatId")
 
+        @_handle_http()
         def get_live_chat_type(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _type = chat['liveChatType']
-                return _type
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "snippet", "liveChatType")
 
+        @_handle_http()
         def get_live_chat_title(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _title = chat['title']
-                return _title
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "snippet", "title")
 
+        @_handle_http()
         def get_live_chat_description(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _description = chat['description']
-                return _description
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "snippet", "description")
 
+        @_handle_http()
         def is_live_chat_moderated(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _is_moderated = chat['isModerated']
-                return _is_moderated
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-        
+            return self._live_chat_field(live_chat_id, "snippet", "isModerated")
+
+        @_handle_http()
         def get_live_chat_scheduled_start_time(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _description = chat['scheduledStartTime']
-                return _description
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "snippet", "scheduledStartTime")
 
+        @_handle_http()
         def get_live_chat_actual_start_time(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _actual_start_time = status['actualStartTime']
-                return _actual_start_time
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "status", "actualStartTime")
 
+        @_handle_http()
         def get_live_chat_life_cycle_status(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _life_cycle_status = status['lifeCycleStatus']
-                return _life_cycle_status
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "status", "lifeCycleStatus")
 
+        @_handle_http()
         def get_active_live_chat_id(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _active_chat_id = status['activeLiveChatId']
-                return _active_chat_id
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
-        
+            return self._live_chat_field(live_chat_id, "status", "activeLiveChatId")
+
+        @_handle_http()
         def get_live_chat_concurrent_viewers(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _concurrent_viewers = status['concurrentViewers']
-                return _concurrent_viewers
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "status", "concurrentViewers")
 
+        @_handle_http()
         def get_live_chat_active_participants(self, live_chat_id):
-            service = self.service
-            try:
-                request = service.liveChat().list(
-                    id=live_chat_id,
-                    part="snippet,id,status,snippet.type,status.activeLiveChatId,status.actualStartTime,status.scheduledStartTime,status.concurrentViewers,status.activeParticipants,snippet.liveChatId,snippet.liveChatType,snippet.title,snippet.description,snippet.isModerated,snippet.scheduledStartTime,snippet.actualStartTime"
-                )
-                response = request.execute()
-                chat = response["items"][0]["snippet"]
-                status = response["items"][0]["status"]
-                _active_participants = status['activeParticipants']
-                return _active_participants
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
+            return self._live_chat_field(live_chat_id, "status", "activeParticipants")
     
     #//////////// LOCALIZATION /////////////
     class Localization:
-        def __init__(self, ytd_api_tools: object) -> None:
+        def __init__(self, ytd_api_tools: object, logger: object=None) -> None:
+            """
+            Status messages of the setters are printed to stdout, or passed to the info() 
+            method of logger, e.g. a logging.Logger, when one is given.
+            """
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
+            self.logger = logger
             
+        #////// UTILITY METHODS //////
+        def _report(self, lines: list[str]) -> None:
+            """
+            Writes the given status lines to the logger if there is one and to stdout with
+            a single write otherwise.
+            """
+            if self.logger is not None:
+                for line in lines:
+                    self.logger.info(line)
+            else:
+                _print_lines(lines)
+
+        def _send_updates(self, updates: dict, description: str) -> dict:
+            """
+            Sends the update requests in the given dictionary, which maps each language to
+            a (resource_id, request) pair, together as a batch request and prints whether 
+            each update succeeded. A batch doesn't run its calls in order, so only the 
+            last request for each resource ID is sent, which leaves the resource in the 
+            same state as sending them one after another, and the languages it replaced
+            share its result. Returns a dictionary mapping each language to True if its 
+            update succeeded and False otherwise.
+            """
+            last = {}
+            for language, (resource_id, request) in updates.items():
+                last[resource_id] = (language, request)
+            results = self.apitools_ref._execute_batch(dict(last.values()))
+            updated = {}
+            lines = []
+            for language, (resource_id, _) in updates.items():
+                response = results[last[resource_id][0]]
+                updated[language] = not isinstance(response, Exception)
+                if updated[language]:
+                    lines.append(f"{description} for language {language} updated successfully!")
+                else:
+                    lines.append(f"{description} for language {language} could not be updated.\n{response}")
+            self._report(lines)
+            return updated
+
+        def _update_localizations(self, collection: object, resource_id: str, localizations: dict, description: str) -> dict:
+            """
+            Sets the localized titles and descriptions of the video or channel specified 
+            by resource_id, where collection is service.videos() or service.channels(). 
+            The current localizations are fetched first and only the languages that 
+            differ are written, all of them with a single update call, which is skipped 
+            if nothing changed. After an update the cached entries of the resource are
+            dropped. Returns a dictionary mapping each language to True.
+            """
+            response = collection.list(part="localizations", id=resource_id, fields="items/localizations").execute()
+            if not response.get("items"):
+                self._report([f"{description} could not be updated. No resource with ID {resource_id} was found."])
+                return dict.fromkeys(localizations, False)
+            current = response["items"][0].get("localizations", {})
+            changed = _changed_localizations(current, localizations)
+            if changed:
+                collection.update(
+                    part="localizations",
+                    fields="id",
+                    body={
+                        "id": resource_id,
+                        "localizations": {**current, **changed}
+                    }
+                ).execute()
+                metadata_cache.invalidate(resource_id)
+                disk_cache.invalidate(resource_id)
+            self._report([
+                f"{description} for language {language} updated successfully!" if language in changed 
+                else f"{description} for language {language} is already up to date."
+                for language in localizations
+            ])
+            return dict.fromkeys(localizations, True)
+
+        def _map_languages(self, fetch: object, languages: list[str], workers: int=16) -> list:
+            """
+            Calls fetch(language) for every language on a pool of at most workers threads
+            and returns the results in the same order as languages. fetch must execute its
+            request on the calling thread's own http object from _get_thread_http(), since
+            httplib2.Http isn't thread safe.
+            """
+            languages = list(languages)
+            if not languages:
+                return []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(languages))) as executor:
+                return list(executor.map(fetch, languages))
+
+        @_handle_http()
         def verify_video(self, video_id: str, country_code: str) -> (bool | None):
             """
-            Verify if a video is available in a specific country using its ID.
+            Verify if a video is available in a specific country using its ID. The 
+            lookup is a conditional GET, so checking the same video and country again 
+            only costs a 304 Not Modified while the video's status is unchanged.
             """
             service = self.service
             try:
                 request = service.videos().list(
                     part="status",
                     id=video_id,
-                    regionCode=country_code
+                    regionCode=country_code,
+                    fields="etag,items/status(uploadStatus,privacyStatus)"
                 )
-                response = request.execute()
-                video_status = response["items"][0]["status"]
+                response = _etag_execute(request, ("video_status", video_id, country_code))
+                items = response.get("items")
+                if not items:
+                    return None
+                video_status = items[0]["status"]
                 is_available = video_status["uploadStatus"] == "processed" and video_status["privacyStatus"] == "public"
                 return is_available
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -19075,6 +17806,22 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
+        def verify_videos(self, video_ids: list[str], country_code: str) -> (dict | None):
+            """
+            Same as verify_video() for many videos at once. The videos are looked up 50 
+            per videos().list call. Returns a dictionary mapping each video ID to True if 
+            the video is available in the country specified by country_code and False 
+            otherwise.
+            """
+            videos = self.apitools_ref.Video(self.apitools_ref)._fetch_videos(video_ids, part="status", region_code=country_code)
+            available = {}
+            for video_id in video_ids:
+                status = videos[video_id]["status"] if video_id in videos else {}
+                available[video_id] = status.get("uploadStatus") == "processed" and status.get("privacyStatus") == "public"
+            return available
+
+        @_handle_http()
         def search_videos_by_location(self, query: str, location: str, location_radius: float, max_results: int=10) -> (list[dict] | None):
             service = self.service
             try:
@@ -19091,9 +17838,6 @@ class YouTubeDataAPIv3Tools:
                 for item in response["items"]:
                     videos.append(item["snippet"]["title"])
                 return videos
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"IndexError: No data.\n{e}")
                 return None
@@ -19104,6 +17848,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
+        @_handle_http()
         def search_videos_by_language(self, query: str, language_code: str, max_results: int=10) -> (list[dict] | None):
             service = self.service
             try:
@@ -19119,9 +17864,6 @@ class YouTubeDataAPIv3Tools:
                 for item in response["items"]:
                     videos.append(item["snippet"]["title"])
                 return videos
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"IndexError: No data .\n{e}")
                 return None
@@ -19132,33 +17874,40 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
 
-        def get_video_details_in_languages(self, video_id: str, languages: str ) -> (dict | None):
+        @_handle_http()
+        def get_video_details_in_languages(self, video_id: str, languages: list[str]) -> (list[dict] | None):
             """
             This method allows you to retrieve video details (title and description) in 
-            different languages for a specific video identified by its video_id.
+            different languages for a specific video identified by its video_id. The 
+            lookups for all languages are sent together as a batch request. Returns a 
+            list of dictionaries holding the language, title and description.
             """
             service = self.service
+            requests = {
+                language: service.videos().list(
+                    part="snippet",
+                    id=video_id,
+                    hl=language,
+                    fields="items/snippet(title,description,localized)"
+                )
+                for language in languages
+            }
+            responses = self.apitools_ref._execute_batch(requests)
+            details = []
+            for language in languages:
+                response = responses.get(language)
+                if isinstance(response, dict) and response.get("items"):
+                    snippet = response["items"][0]["snippet"]
+                    localized = snippet.get("localized", snippet)
+                    details.append({
+                        "language": language,
+                        "title": localized["title"],
+                        "description": localized["description"]
+                    })
+            return details
 
-            try:
-                for language in languages:
-                    request = service.videos().list(
-                        part="snippet",
-                        id=video_id,
-                        hl=language
-                    )
-                    response = request.execute()
-                    details = []
-                    if "items" in response:
-                        video = response["items"][0]
-                        detail = {}
-                        detail["title"] = video["snippet"]["title"]
-                        detail["description"] = video["snippet"]["description"]
-                        details.append(detail)
-                    return details
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
+        @_handle_http()
         def get_videos_by_language(self, language_code: str, region_code: str="US", max_results: int=10) -> (list[str] | None):
             service = self.service
             try:
@@ -19174,9 +17923,6 @@ class YouTubeDataAPIv3Tools:
                 for item in response["items"]:
                     titles.append(item["snippet"]["title"])
                 return titles
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as e:
                 print(f"There are no videos with the given ID.\n{e}")
                 return None
@@ -19187,255 +17933,243 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{e}")
                 return None
         
-        def get_video_category_by_region_and_language(self, region_code , language_code):
+        @_handle_http()
+        def get_video_category_by_region_and_language(self, region_code , language_code) -> (list[dict] | None):
             """
             This method retrieves video categories available in a specific region_code and 
-            language_code. It prints information about each category, including its ID and title.
+            language_code. It returns the ID and title of each category as a list of 
+            dictionaries.
             """
             service = self.service
 
-            try:
-                request = service.videoCategories().list(
-                    part="snippet",
-                    regionCode=region_code,
-                    hl=language_code
-                )
-                response = request.execute()
+            request = service.videoCategories().list(
+                part="snippet",
+                regionCode=region_code,
+                hl=language_code,
+                fields="items(id,snippet/title)"
+            )
+            response = request.execute()
 
-                for category in response["items"]:
-                    category_id = category["id"]
-                    category_title = category["snippet"]["title"]
-                    print(f"Category ID: {category_id}, Title: {category_title}")
+            return [{"id": category["id"], "title": category["snippet"]["title"]} for category in response["items"]]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def set_video_localizations(self, video_id, localizations):
+        @_handle_http()
+        def set_video_localizations(self, video_id, localizations) -> (dict | None):
             """
             This method allows you to set the title and description of a video 
             in different languages. Provide a dictionary localizations where the 
             keys are language codes, and the values are dictionaries containing 
-            the localized title and description for each language.
+            the localized title and description for each language. Only the languages
+            that differ from the video's current localizations are written, all of 
+            them with one update call. Returns a dictionary mapping each language to 
+            True if the video is up to date, or False if it wasn't found.
             """
-            service = self.service
-
-            try:
-                for language, localization_data in localizations.items():
-                    title = localization_data.get("title", "")
-                    description = localization_data.get("description", "")
-
-                    request = service.videos().update(
-                        part="snippet",
-                        body={
-                            "id": video_id,
-                            "snippet": {
-                                "title": title,
-                                "description": description,
-                                "defaultLanguage": language
-                            }
-                        }
-                    )
-                    response = request.execute()
+            return self._update_localizations(self.service.videos(), video_id, localizations, "Video details")
 
-                    print(f"Video details for language {language} updated successfully!")
-
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def get_channel_details_in_languages(self, channel_id, languages):
+        @_handle_http()
+        def get_channel_details_in_languages(self, channel_id, languages, ttl: float=LOCALIZED_DETAILS_TTL) -> (dict | None):
             """
             This method allows you to retrieve channel details (title and description) in 
-            different languages for a specific channel identified by its channel_id.
+            different languages for a specific channel identified by its channel_id. 
+            The languages that aren't in the disk cache yet are looked up concurrently, 
+            see _map_languages(), and kept there for ttl seconds. Returns a dictionary 
+            mapping each language to its title and description.
             """
             service = self.service
 
-            try:
-                for language in languages:
+            def fetch(language: str) -> (dict | None):
+                key = ("channel_details", channel_id, language)
+                detail = disk_cache.get(key)
+                if detail is None:
                     request = service.channels().list(
                         part="snippet",
                         id=channel_id,
-                        hl=language
+                        hl=language,
+                        fields="etag,items/snippet(title,description,localized)"
                     )
-                    response = request.execute()
+                    response = _etag_execute(request, key, http=self.apitools_ref._get_thread_http())
+                    if not response.get("items"):
+                        return None
+                    snippet = response["items"][0]["snippet"]
+                    localized = snippet.get("localized", snippet)
+                    detail = {"title": localized["title"], "description": localized["description"]}
+                    disk_cache.set(key, detail, ttl)
+                return detail
 
-                    if "items" in response:
-                        channel = response["items"][0]
-                        channel_title = channel["snippet"]["title"]
-                        channel_description = channel["snippet"]["description"]
-                        print(f"Language: {language}, Channel Title: {channel_title}, Description: {channel_description}")
+            languages = list(languages)
+            details = {}
+            for language, detail in zip(languages, self._map_languages(fetch, languages)):
+                if detail is not None:
+                    details[language] = detail
+            return details
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def set_channel_localizations(self, channel_id, localizations):
+        @_handle_http()
+        def set_channel_localizations(self, channel_id, localizations) -> (dict | None):
             """
             This method allows you to set the title and description of a channel in 
             different languages. Provide a dictionary localizations where the keys are 
             language codes, and the values are dictionaries containing the localized 
-            title and description for each language
+            title and description for each language. Only the languages that differ 
+            from the channel's current localizations are written, all of them with one
+            update call. Returns a dictionary mapping each language to True if the 
+            channel is up to date, or False if it wasn't found.
             """
-            service = self.service
-
-            try:
-                for language, localization_data in localizations.items():
-                    title = localization_data.get("title", "")
-                    description = localization_data.get("description", "")
-
-                    request = service.channels().update(
-                        part="snippet",
-                        body={
-                            "id": channel_id,
-                            "snippet": {
-                                "title": title,
-                                "description": description,
-                                "defaultLanguage": language
-                            }
-                        }
-                    )
-                    response = request.execute()
-
-                    print(f"Channel details for language {language} updated successfully!")
+            return self._update_localizations(self.service.channels(), channel_id, localizations, "Channel details")
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def list_available_caption_languages(self, video_id):
+        @_handle_http()
+        def list_available_caption_languages(self, video_id) -> (list[str] | None):
             """
             This method will retrieve a list of the available languages 
             for caption tracks on YouTube.
             """
             service = self.service
 
-            try:
-                request = service.captions().list(
-                    part="snippet",
-                    videoId=f"{video_id}"
-                )
-                response = request.execute()
-
-                languages = set()
-                for caption_track in response["items"]:
-                    language = caption_track["snippet"]["language"]
-                    languages.add(language)
+            request = service.captions().list(
+                part="snippet",
+                videoId=f"{video_id}",
+                fields="items/snippet/language"
+            )
+            response = request.execute()
 
-                print("Available caption languages:")
-                for language in languages:
-                    print(language)
+            return sorted({caption_track["snippet"]["language"] for caption_track in response.get("items", ())})
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def get_captions_in_languages(self, video_id, languages):
+        @_handle_http()
+        def get_captions_in_languages(self, video_id, languages, ttl: float=LOCALIZED_DETAILS_TTL) -> (list[dict] | None):
             """
             This method allows you to retrieve captions (subtitles) for a \
             video in different languages. Provide a list of language codes, and 
-            it will return information about each caption in the specified languages.
+            it will return the language and name of each caption track in one of the 
+            specified languages as a list of dictionaries. A single captions().list call 
+            returns every track of the video, so the tracks are fetched once, kept in 
+            the disk cache for ttl seconds or until a caption track is written, and 
+            filtered by language locally.
             """
-            service = self.service
-
-            try:
-                for language in languages:
-                    request = service.captions().list(
-                        part="snippet",
-                        videoId=video_id,
-                        hl=language
-                    )
-                    response = request.execute()
-
-                    if "items" in response:
-                        caption = response["items"][0]
-                        caption_language = caption["snippet"]["language"]
-                        caption_name = caption["snippet"]["name"]
-                        print(f"Language: {caption_language}, Caption Name: {caption_name}")
+            key = ("caption_tracks", video_id)
+            tracks = disk_cache.get(key)
+            if tracks is None:
+                response = self.service.captions().list(
+                    part="snippet",
+                    videoId=video_id,
+                    fields="items/snippet(language,name)"
+                ).execute()
+                tracks = [
+                    {"language": snippet["language"], "name": snippet["name"]} 
+                    for snippet in map(_SNIPPET, response.get("items", ()))
+                ]
+                disk_cache.set(key, tracks, ttl)
+            languages = set(languages)
+            return [track for track in tracks if track["language"] in languages]
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def set_captions_localizations(self, caption_track_id, localizations):
+        @_handle_http()
+        def set_captions_localizations(self, caption_track_id, localizations) -> (dict | None):
             """
             This method allows you to set the name and language of a caption track 
             in different languages. Provide a dictionary localizations where the keys 
             are language codes, and the values are dictionaries containing the localized 
-            caption name and language for each language.
+            caption name and language for each language. Every update replaces the same
+            track's snippet, so only the last one is sent, see _send_updates(). Returns 
+            a dictionary mapping each language to True if its update succeeded and False
+            otherwise.
             """
-            service = self.service
+            update = self.service.captions().update
 
-            try:
-                for language, localization_data in localizations.items():
-                    caption_name = localization_data.get("caption_name", "")
-                    caption_language = localization_data.get("caption_language", "")
+            updates = {}
+            for language, localization_data in localizations.items():
+                caption_name = localization_data.get("caption_name", "")
+                caption_language = localization_data.get("caption_language", "")
 
-                    request = service.captions().update(
-                        part="snippet",
-                        body={
-                            "id": caption_track_id,
-                            "snippet": {
-                                "name": caption_name,
-                                "language": caption_language
-                            }
+                updates[language] = caption_track_id, update(
+                    part="snippet",
+                    fields="id",
+                    body={
+                        "id": caption_track_id,
+                        "snippet": {
+                            "name": caption_name,
+                            "language": caption_language
                         }
-                    )
-                    response = request.execute()
-
-                    print(f"Caption details for language {caption_language} updated successfully!")
+                    }
+                )
+            updated = self._send_updates(updates, "Caption details")
+            metadata_cache.invalidate_kind("captions")
+            disk_cache.invalidate_kind("caption_tracks")
+            return updated
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
-        def get_thumbnails_in_languages(self, video_id, languages):
+        @_handle_http()
+        def get_thumbnails_in_languages(self, video_id, languages) -> (dict | None):
             """
             This method allows you to retrieve video thumbnails in different languages. 
-            Provide a list of language codes, and it will return the URL of the default 
-            thumbnail in each specified language
+            Provide a list of language codes, and it will return a dictionary mapping 
+            each language to the URL of the video's default thumbnail. Thumbnails aren't 
+            localized by the API, so they are fetched with a single videos().list call.
             """
-            service = self.service
-
-            try:
-                for language in languages:
-                    request = service.thumbnails().set(
-                        videoId=video_id,
-                        language=language
-                    )
-                    response = request.execute()
-
-                    if "items" in response:
-                        thumbnails = response["items"]
-                        thumbnail_default = thumbnails[0]["default"]["url"]
-                        print(f"Language: {language}, Default Thumbnail URL: {thumbnail_default}")
+            response = self.service.videos().list(
+                part="snippet",
+                id=video_id,
+                fields="items/snippet/thumbnails/default/url"
+            ).execute()
+            if not response.get("items"):
+                return {}
+            url = response["items"][0]["snippet"]["thumbnails"]["default"]["url"]
+            return dict.fromkeys(languages, url)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
+        @_handle_http()
         def set_thumbnail_localizations(self, video_id, localizations):
             """
             This method allows you to set the thumbnail URL for a video in 
             different languages. Provide a dictionary localizations where the 
             keys are language codes, and the values are dictionaries containing 
-            the localized thumbnail URL for each language.
+            the localized thumbnail URL for each language. thumbnails().set has no 
+            language parameter, so every upload replaces the video's single thumbnail.
+            A hash of the last uploaded image is kept in the disk cache under the video,
+            so an image that is already the video's thumbnail isn't sent again. Images 
+            are sent as resumable uploads in UPLOAD_CHUNK_SIZE chunks, so a dropped 
+            connection only repeats the current chunk.
             """
             service = self.service
 
+            key = ("thumbnail_hash", video_id)
+            lines = []
             try:
                 for language, localization_data in localizations.items():
                     thumbnail_url = localization_data.get("thumbnail_url", "")
 
+                    digest = _file_digest(thumbnail_url)
+                    if disk_cache.get(key) == digest:
+                        lines.append(f"Thumbnail URL for language {language} is already up to date.")
+                        continue
+
                     request = service.thumbnails().set(
                         videoId=video_id,
-                        language=language,
-                        media_body=thumbnail_url
+                        media_body=googleapiclient.http.MediaFileUpload(
+                            thumbnail_url,
+                            chunksize=UPLOAD_CHUNK_SIZE,
+                            resumable=True
+                        )
                     )
-                    response = request.execute()
+                    response = None
+                    while response is None:
+                        _, response = request.next_chunk(num_retries=RetryingHttpRequest.max_attempts - 1)
+                    disk_cache.set(key, digest, THUMBNAIL_HASH_TTL)
 
-                    print(f"Thumbnail URL for language {language} set successfully!")
+                    lines.append(f"Thumbnail URL for language {language} set successfully!")
+            finally:
+                self._report(lines)
 
-            except googleapiclient.errors.HttpError as e:
-                print(f"An error occurred: {e}")
 
     #//////////// ABUSE REPORT ///////////
     class AbuseReport:
         def __init__(self, ytd_api_tools: object) -> None:
+            self.apitools_ref = ytd_api_tools
             self.service = ytd_api_tools.service
         
+        @_handle_http()
         def report_video(self, video_id: str, reason_id: str, additional_comments: str=None) -> (bool | None):
             """
             Allows you to report a video for abuse. The reason_id parameter specifies the 
@@ -19452,9 +18186,6 @@ class YouTubeDataAPIv3Tools:
                     comments=additional_comments
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -19465,6 +18196,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def report_channel(self, channel_id: str, reason_id: str, additional_comments: str=None) -> (bool | None):
             """
             Allows you to report a channel for abuse. The reason_id parameter specifies the reason for 
@@ -19479,9 +18211,6 @@ class YouTubeDataAPIv3Tools:
                     comments=additional_comments
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -19492,6 +18221,7 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
+        @_handle_http()
         def report_playlist(self, playlist_id: str, reason_id: str, additional_comments=None) -> (bool | None):
             """
             Allows you to report a playlist for abuse. The reason_id parameter specifies the reason for 
@@ -19506,9 +18236,6 @@ class YouTubeDataAPIv3Tools:
                     comments=additional_comments
                 ).execute()
                 return True
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -19519,30 +18246,91 @@ class YouTubeDataAPIv3Tools:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
 
-        def get_abuse_report_reason_categories(self) -> (list[dict] | None):
+        @_handle_http()
+        def report_videos(self, video_ids: list[str], reason_id: str, additional_comments: str=None) -> (dict | None):
+            """
+            Same as report_video() for many videos at once. The reports are sent up to 50 
+            per batch request. Returns a dictionary mapping each video ID to True if it 
+            was reported and False otherwise.
+            """
+            requests = {
+                video_id: self.service.videos().reportAbuse(
+                    part="snippet",
+                    videoId=video_id,
+                    reasonId=reason_id,
+                    comments=additional_comments
+                )
+                for video_id in video_ids
+            }
+            results = self.apitools_ref._execute_batch(requests)
+            return {video_id: not isinstance(response, Exception) for video_id, response in results.items()}
+
+        @_handle_http()
+        def report_channels(self, channel_ids: list[str], reason_id: str, additional_comments: str=None) -> (dict | None):
+            """
+            Same as report_channel() for many channels at once. The reports are sent up to 
+            50 per batch request. Returns a dictionary mapping each channel ID to True if 
+            it was reported and False otherwise.
+            """
+            requests = {
+                channel_id: self.service.channels().reportAbuse(
+                    part="snippet",
+                    channelId=channel_id,
+                    reasonId=reason_id,
+                    comments=additional_comments
+                )
+                for channel_id in channel_ids
+            }
+            results = self.apitools_ref._execute_batch(requests)
+            return {channel_id: not isinstance(response, Exception) for channel_id, response in results.items()}
+
+        @_handle_http()
+        def report_playlists(self, playlist_ids: list[str], reason_id: str, additional_comments: str=None) -> (dict | None):
+            """
+            Same as report_playlist() for many playlists at once. The reports are sent up 
+            to 50 per batch request. Returns a dictionary mapping each playlist ID to True 
+            if it was reported and False otherwise.
+            """
+            requests = {
+                playlist_id: self.service.playlists().reportAbuse(
+                    part="snippet",
+                    playlistId=playlist_id,
+                    reasonId=reason_id,
+                    comments=additional_comments
+                )
+                for playlist_id in playlist_ids
+            }
+            results = self.apitools_ref._execute_batch(requests)
+            return {playlist_id: not isinstance(response, Exception) for playlist_id, response in results.items()}
+
+        @_handle_http()
+        def get_abuse_report_reason_categories(self, ttl: float=ABUSE_REASONS_TTL) -> (list[dict] | None):
             """
             Retrieves the categories of abuse report reasons available on YouTube. 
-            Returns a list of the categories.
+            Returns a list of the categories. They hardly ever change, so the list is 
+            kept in the disk cache for ttl seconds.
             """
             service = self.service
             try:
+                key = ("abuse_report_reasons", "categories")
+                cats = disk_cache.get(key)
+                if cats is not None:
+                    return cats
                 request = service.videoAbuseReportReasons().list(
-                    part="snippet"
+                    part="snippet",
+                    fields="etag,items(id,snippet/label)"
                 )
-                response = request.execute()
+                response = _etag_execute(request, key)
                 if "items" in response:
-                    cats = []
-                    for reason_category in response["items"]:
-                        cats.append(reason_category)
+                    cats = list(response["items"])
+                    disk_cache.set(key, cats, ttl)
                     return cats
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except KeyError as ke:
                 print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                 return None
  
+        @_handle_http()
         def get_abuse_report_reasons_in_category(self, category_id: str, hl:str="en_US") -> (list[dict] | None):
             """
             Retrieves the abuse report reasons available within a specific category_id. 
@@ -19553,18 +18341,13 @@ class YouTubeDataAPIv3Tools:
                 request = service.videoAbuseReportReasons().list(
                     part="snippet",
                     hl=hl,
-                    videoId=category_id
+                    videoId=category_id,
+                    fields="items(id,snippet/label)"
                 )
                 response = request.execute()
                 if "items" in response:
-                    reasons = []
-                    for reason in response["items"]:
-                        reasons.append(reason)
-                    return reasons
+                    return list(response["items"])
                 else: return None
-            except googleapiclient.errors.HttpError as e:
-                print(f"An API error occurred: {e}")
-                return None
             except IndexError as ie:
                 print(f"There are no comments with the given ID.\n{ie}")
                 return None
@@ -19581,6 +18364,7 @@ class YouTubeDataAPIv3Tools:
                 self.service = ytd_api_tools.service
 
             #////// ENTIRE VIDEO ABUSE REPORT REASON RESOURCE //////
+            @_handle_http()
             def get_report_reason(self, reason: str, hl: str="en_US") -> (dict | None):
                 service = self.service
                 try:
@@ -19595,9 +18379,6 @@ class YouTubeDataAPIv3Tools:
                                 return item
                         return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19608,6 +18389,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_report_reasons(self, hl: str="en_US") -> (list[dict] | None):
                 service = self.service
                 try:
@@ -19622,9 +18404,6 @@ class YouTubeDataAPIv3Tools:
                             reasons.append(item)
                         return reasons
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19636,6 +18415,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
             
             #////// REPORT REASON KIND //////
+            @_handle_http()
             def get_kind_of_report_reason(self, reason_id: str, hl: str="en_US") -> (str | None):
                 service = self.service
                 try:
@@ -19649,9 +18429,6 @@ class YouTubeDataAPIv3Tools:
                             if item["id"] == reason_id:
                                 return item["kind"]
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19662,6 +18439,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
                 
+            @_handle_http()
             def get_all_kinds(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -19676,9 +18454,6 @@ class YouTubeDataAPIv3Tools:
                             kinds.append(item["kind"])
                         return kinds
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19690,6 +18465,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
                 
             #////// REPORT REASON ETAG //////
+            @_handle_http()
             def get_etag(self, reason_id: str, hl: str="en_US") -> (str | None):
                 service = self.service
                 try:
@@ -19704,9 +18480,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["etag"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19717,6 +18490,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
                 
+            @_handle_http()
             def get_all_etags(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -19731,9 +18505,6 @@ class YouTubeDataAPIv3Tools:
                             etags.append(item["etag"])
                         return etags
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19745,6 +18516,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
                 
             #////// REPORT REASON ID //////
+            @_handle_http()
             def get_id(self, reason: str, hl: str="en_US") -> (str | None):
                 service = self.service
                 try:
@@ -19759,9 +18531,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["id"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19772,6 +18541,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
 
+            @_handle_http()
             def get_all_ids(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -19786,9 +18556,6 @@ class YouTubeDataAPIv3Tools:
                             ids.append(item["id"])
                         return ids
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19800,6 +18567,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
             
             #////// REPORT REASON SNIPPET //////
+            @_handle_http()
             def get_snippet(self, reason_id: str, hl: str="en_US") -> (dict | None):
                 service = self.service
                 try:
@@ -19814,9 +18582,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["snippet"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19827,6 +18592,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_all_snippets(self, hl: str="en_US") -> (list[dict] | None):
                 service = self.service
                 try:
@@ -19841,9 +18607,6 @@ class YouTubeDataAPIv3Tools:
                             snippets.append(item["snippet"])
                         return snippets
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19855,6 +18618,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
                 
             #////// REPORT REASON LABEL //////
+            @_handle_http()
             def get_label(self, reason_id: str, hl: str="en_US") -> (str | None):
                 service = self.service
                 try:
@@ -19869,9 +18633,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["snippet"]["label"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19882,6 +18643,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_all_labels(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -19896,9 +18658,6 @@ class YouTubeDataAPIv3Tools:
                             labels.append(item["snippet"]["label"])
                         return labels
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19910,6 +18669,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
             
             #////// REPORT REASON SECONDARY REASON //////
+            @_handle_http()
             def get_secondary_reasons(self, reason_id: str, hl: str="en_US") -> (dict | None):
                 service = self.service
                 try:
@@ -19924,9 +18684,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["snippet"]["secondaryReasons"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19937,6 +18694,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_all_secondary_reasons(self, hl: str="en_US") -> (list[dict] | None):
                 service = self.service
                 try:
@@ -19951,9 +18709,6 @@ class YouTubeDataAPIv3Tools:
                             reasons.append(item["snippet"]["secondaryReasons"])
                         return reasons
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19965,6 +18720,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
             
             #////// REPORT REASON SECONDARY REASON ID //////
+            @_handle_http()
             def get_secondary_reason_id(self, reason_id: str, hl: str="en_US") -> (dict | None):
                 service = self.service
                 try:
@@ -19979,9 +18735,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["snippet"]["secondaryReasons"]["id"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -19992,6 +18745,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_all_secondary_reason_ids(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -20006,9 +18760,6 @@ class YouTubeDataAPIv3Tools:
                             ids.append(item["snippet"]["secondaryReasons"]["id"])
                         return ids
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -20020,6 +18771,7 @@ class YouTubeDataAPIv3Tools:
                     return None 
             
             #////// REPORT REASON SECONDARY REASON LABEL //////
+            @_handle_http()
             def get_secondary_reason_label(self, reason_id: str, hl: str="en_US") -> (dict | None):
                 service = self.service
                 try:
@@ -20034,9 +18786,6 @@ class YouTubeDataAPIv3Tools:
                                 return item["snippet"]["secondaryReasons"]["label"]
                             return None
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None
@@ -20047,6 +18796,7 @@ class YouTubeDataAPIv3Tools:
                     print(f"Key error: Bad key. Field doesn't exists!\n{ke}")
                     return None 
             
+            @_handle_http()
             def get_all_secondary_reason_labels(self, hl: str="en_US") -> (list[str] | None):
                 service = self.service
                 try:
@@ -20061,9 +18811,6 @@ class YouTubeDataAPIv3Tools:
                             labels.append(item["snippet"]["secondaryReasons"]["label"])
                         return labels
                     else: return None
-                except googleapiclient.errors.HttpError as e:
-                    print(f"An API error occurred: {e}")
-                    return None
                 except IndexError as ie:
                     print(f"IndexError: Reason doesn't exist\n{ie}")
                     return None